@@ -0,0 +1,79 @@
+"""
+Command-line entry point of Nexus.
+
+Usage::
+
+    nexus convert trajectory.xyz --node-types Si O [-o trajectory.nxtraj]
+    python -m nexus convert trajectory.lammpstrj --node-types 1 2 --range 0 99
+    zcat trajectory.xyz.gz | nexus convert - --format xyz --node-types Si O -o trajectory.nxtraj
+"""
+
+import argparse
+from typing import List, Optional
+
+from .config.settings import GeneralSettings, SettingsBuilder
+from .io.writer.trajectory_writer import TrajectoryWriter
+
+
+def cli(argv: Optional[List[str]] = None) -> None:
+    """
+    Parse command-line arguments and run the requested command.
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse, defaults to ``sys.argv``.
+    """
+    parser = argparse.ArgumentParser(prog="nexus", description="Nexus cluster analysis toolkit")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser(
+        "convert",
+        help="Convert a trajectory to the Nexus binary format (.nxtraj)",
+    )
+    convert.add_argument("input", help="Trajectory file to convert, or - for standard input")
+    convert.add_argument(
+        "-f",
+        "--format",
+        default=None,
+        help="Trajectory format as a file extension, e.g. xyz (required for standard input)",
+    )
+    convert.add_argument(
+        "-o", "--output", default=None, help="Output path (default: <input>.nxtraj)"
+    )
+    convert.add_argument(
+        "-t",
+        "--node-types",
+        nargs="+",
+        required=True,
+        help="Species to keep in the converted file",
+    )
+    convert.add_argument(
+        "-r",
+        "--range",
+        nargs=2,
+        type=int,
+        default=(0, -1),
+        metavar=("START", "END"),
+        help="Range of frames to convert (default: all)",
+    )
+    convert.add_argument("-v", "--verbose", action="store_true")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "convert":
+        general = GeneralSettings(
+            project_name="convert",
+            file_location=args.input,
+            file_format=args.format,
+            verbose=args.verbose,
+        )
+        settings = SettingsBuilder().with_general(general).build()
+        settings.set_range_of_frames(*args.range)
+        # Conversion only selects species, no clustering criterion is needed
+        settings.clustering.node_types = args.node_types
+        writer = TrajectoryWriter(settings, args.output)
+        writer.write()
+        print(writer.output_path)
+
+
+if __name__ == "__main__":
+    cli()
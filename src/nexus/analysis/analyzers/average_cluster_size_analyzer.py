@@ -140,7 +140,7 @@ class AverageClusterSizeAnalyzer(BaseAnalyzer):
         """Write ensemble-averaged results to ``average_cluster_size.dat``."""
         output = self.finalize()
         self._write_header()
-        path = os.path.join(self._settings.export_directory, "average_cluster_size.dat")
+        path = self._output_path("average_cluster_size.dat")
         with open(path, "a") as f:
             for connectivity in self.average_sizes:
                 concentration = output["concentrations"].get(connectivity, 0.0)
@@ -154,7 +154,7 @@ class AverageClusterSizeAnalyzer(BaseAnalyzer):
 
     def _write_header(self) -> None:
         """Write the CSV header to the output file if needed."""
-        path = os.path.join(self._settings.export_directory, "average_cluster_size.dat")
+        path = self._output_path("average_cluster_size.dat")
         number_of_frames = self.frame_processed_count
 
         if self._settings.analysis.overwrite or not os.path.exists(path):
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional
+import os
 
 from ...core.frame import Frame
 from ...config.settings import Settings
@@ -16,6 +17,8 @@ class BaseAnalyzer(ABC):
     Attributes:
         frame_processed_count (int): Number of frames processed so far.
         _settings (Settings): Configuration settings for the analyzer.
+        _output_contents (Dict[str, Optional[bytes]]): Content of each output
+            file before the analyzer first wrote to it, None if it did not exist.
     """
 
     def __init__(self, settings: Settings) -> None:
@@ -27,6 +30,7 @@ class BaseAnalyzer(ABC):
         """
         self.frame_processed_count: int = 0
         self._settings: Settings = settings
+        self._output_contents: Dict[str, Optional[bytes]] = {}
 
     @abstractmethod
     def analyze(self, frame: Frame, connectivities: List[str]) -> None:
@@ -68,6 +72,58 @@ class BaseAnalyzer(ABC):
         """Write the analysis results to the export directory."""
         pass
 
+    def _output_path(self, filename: str) -> str:
+        """
+        Return the path of an output file in the export directory.
+
+        The content of the file is recorded the first time its path is requested,
+        before the analyzer writes to it, so that ``restore_outputs()`` can undo
+        the writes of a ``flush()``.
+
+        Args:
+            filename (str): Name of the output file.
+
+        Returns:
+            str: Path of the output file.
+        """
+        path = os.path.join(self._settings.export_directory, filename)
+        if path not in self._output_contents:
+            content = None
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    content = f.read()
+            self._output_contents[path] = content
+        return path
+
+    def restore_outputs(self) -> None:
+        """
+        Restore the output files to their content before the analyzer wrote to them.
+
+        Output files are appended to when ``analysis.overwrite`` is False, so the
+        results written by a ``flush()`` are removed before results are written
+        again, and the final files match those of a run without flushing.
+        """
+        for path, content in self._output_contents.items():
+            if content is None:
+                if os.path.exists(path):
+                    os.remove(path)
+            else:
+                with open(path, "wb") as f:
+                    f.write(content)
+
+    def flush(self) -> None:
+        """
+        Write the results of the frames processed so far without ending the analysis.
+
+        The results of a previous flush are replaced (see ``restore_outputs()``).
+        The accumulators are kept, so later frames keep contributing and the next
+        ``flush()`` or ``print_to_file()`` writes results over all frames processed.
+        """
+        self.restore_outputs()
+        self._finalized = False
+        self.print_to_file()
+        self._finalized = False
+
     def __str__(self) -> str:
         """Return the class name."""
         return f"{self.__class__.__name__}"
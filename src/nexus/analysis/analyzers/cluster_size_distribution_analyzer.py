@@ -138,10 +138,7 @@ class ClusterSizeDistributionAnalyzer(BaseAnalyzer):
 
         for connectivity in self.size_distribution:
             self._write_header(connectivity)
-            path = os.path.join(
-                self._settings.export_directory,
-                f"cluster_size_distribution-{connectivity}.dat",
-            )
+            path = self._output_path(f"cluster_size_distribution-{connectivity}.dat")
 
             # Sort by size in descending order for plotting
             sorted_sizes = sorted(
@@ -166,10 +163,7 @@ class ClusterSizeDistributionAnalyzer(BaseAnalyzer):
         Args:
             connectivity (str): Connectivity label for the output file.
         """
-        path = os.path.join(
-            self._settings.export_directory,
-            f"cluster_size_distribution-{connectivity}.dat",
-        )
+        path = self._output_path(f"cluster_size_distribution-{connectivity}.dat")
         number_of_frames = self.frame_processed_count
 
         if self._settings.analysis.overwrite or not os.path.exists(path):
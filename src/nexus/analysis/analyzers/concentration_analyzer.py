@@ -113,7 +113,7 @@ class ConcentrationAnalyzer(BaseAnalyzer):
         """Write ensemble-averaged results to ``concentrations.dat``."""
         output = self.finalize()
         self._write_header()
-        path = os.path.join(self._settings.export_directory, "concentrations.dat")
+        path = self._output_path("concentrations.dat")
         with open(path, "a") as f:
             for connectivity in self.concentrations:
                 concentration = output["concentrations"].get(connectivity, 0.0)
@@ -124,7 +124,7 @@ class ConcentrationAnalyzer(BaseAnalyzer):
 
     def _write_header(self) -> None:
         """Write the CSV header to the output file if needed."""
-        path = os.path.join(self._settings.export_directory, "concentrations.dat")
+        path = self._output_path("concentrations.dat")
         number_of_frames = self.frame_processed_count
 
         if self._settings.analysis.overwrite or not os.path.exists(path):
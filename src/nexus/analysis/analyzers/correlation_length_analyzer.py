@@ -146,7 +146,7 @@ class CorrelationLengthAnalyzer(BaseAnalyzer):
         """Write ensemble-averaged results to ``correlation_length.dat``."""
         output = self.finalize()
         self._write_header()
-        path = os.path.join(self._settings.export_directory, "correlation_length.dat")
+        path = self._output_path("correlation_length.dat")
         with open(path, "a") as f:
             for connectivity in self.correlation_length:
                 concentration = output["concentrations"].get(connectivity, 0.0)
@@ -160,7 +160,7 @@ class CorrelationLengthAnalyzer(BaseAnalyzer):
 
     def _write_header(self) -> None:
         """Write the CSV header to the output file if needed."""
-        path = os.path.join(self._settings.export_directory, "correlation_length.dat")
+        path = self._output_path("correlation_length.dat")
         number_of_frames = self.frame_processed_count
 
         if self._settings.analysis.overwrite or not os.path.exists(path):
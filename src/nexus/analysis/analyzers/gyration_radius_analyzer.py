@@ -122,10 +122,7 @@ class GyrationRadiusAnalyzer(BaseAnalyzer):
         self._write_header()
 
         for connectivity in self.gyration_radii:
-            path = os.path.join(
-                self._settings.export_directory,
-                f"gyration_radius_distribution-{connectivity}.dat",
-            )
+            path = self._output_path(f"gyration_radius_distribution-{connectivity}.dat")
             with open(path, "a") as f:
                 for size, gyr in sorted(
                     output["gyration_radii"][connectivity].items(),
@@ -141,10 +138,7 @@ class GyrationRadiusAnalyzer(BaseAnalyzer):
         """Write the CSV header to each per-connectivity output file if needed."""
         number_of_frames = self.frame_processed_count
         for connectivity in self._raw_gyration_radii:
-            path = os.path.join(
-                self._settings.export_directory,
-                f"gyration_radius_distribution-{connectivity}.dat",
-            )
+            path = self._output_path(f"gyration_radius_distribution-{connectivity}.dat")
 
             if self._settings.analysis.overwrite or not os.path.exists(path):
                 mode = "w"
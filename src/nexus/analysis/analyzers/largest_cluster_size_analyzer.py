@@ -136,7 +136,7 @@ class LargestClusterSizeAnalyzer(BaseAnalyzer):
         output = self.finalize()
 
         self._write_header()
-        path = os.path.join(self._settings.export_directory, "largest_cluster_size.dat")
+        path = self._output_path("largest_cluster_size.dat")
         with open(path, "a") as f:
             for connectivity in self.largest_cluster_sizes:
                 concentration = output["concentrations"].get(connectivity, 0.0)
@@ -150,7 +150,7 @@ class LargestClusterSizeAnalyzer(BaseAnalyzer):
 
     def _write_header(self) -> None:
         """Write the CSV header to the output file if needed."""
-        path = os.path.join(self._settings.export_directory, "largest_cluster_size.dat")
+        path = self._output_path("largest_cluster_size.dat")
         number_of_frames = self.frame_processed_count
         file_exists = os.path.exists(path)
 
@@ -141,7 +141,7 @@ class OrderParameterAnalyzer(BaseAnalyzer):
         """Write ensemble-averaged results to ``order_parameter.dat``."""
         output = self.finalize()
         self._write_header()
-        path = os.path.join(self._settings.export_directory, "order_parameter.dat")
+        path = self._output_path("order_parameter.dat")
         with open(path, "a") as f:
             for connectivity in self.order_parameters:
                 concentration = output["concentrations"].get(connectivity, 0.0)
@@ -155,7 +155,7 @@ class OrderParameterAnalyzer(BaseAnalyzer):
 
     def _write_header(self) -> None:
         """Write the CSV header to the output file if needed."""
-        path = os.path.join(self._settings.export_directory, "order_parameter.dat")
+        path = self._output_path("order_parameter.dat")
         number_of_frames = self.frame_processed_count
 
         if self._settings.analysis.overwrite or not os.path.exists(path):
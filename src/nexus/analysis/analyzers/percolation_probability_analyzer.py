@@ -134,9 +134,7 @@ class PercolationProbabilityAnalyzer(BaseAnalyzer):
         """Write ensemble-averaged results to ``percolation_probability.dat``."""
         output = self.finalize()
         self._write_header()
-        path = os.path.join(
-            self._settings.export_directory, "percolation_probability.dat"
-        )
+        path = self._output_path("percolation_probability.dat")
         with open(path, "a") as f:
             for connectivity in self.percolation_probabilities:
                 concentration = output["concentrations"].get(connectivity, 0.0)
@@ -152,9 +150,7 @@ class PercolationProbabilityAnalyzer(BaseAnalyzer):
 
     def _write_header(self) -> None:
         """Write the CSV header to the output file if needed."""
-        path = os.path.join(
-            self._settings.export_directory, "percolation_probability.dat"
-        )
+        path = self._output_path("percolation_probability.dat")
         number_of_frames = self.frame_processed_count
 
         if self._settings.analysis.overwrite or not os.path.exists(path):
@@ -136,9 +136,7 @@ class SpanningClusterSizeAnalyzer(BaseAnalyzer):
         """Write ensemble-averaged results to ``spanning_cluster_size.dat``."""
         output = self.finalize()
         self._write_header()
-        path = os.path.join(
-            self._settings.export_directory, "spanning_cluster_size.dat"
-        )
+        path = self._output_path("spanning_cluster_size.dat")
         with open(path, "a") as f:
             for connectivity in self.spanning_cluster_sizes:
                 concentration = output["concentrations"].get(connectivity, 0.0)
@@ -152,9 +150,7 @@ class SpanningClusterSizeAnalyzer(BaseAnalyzer):
 
     def _write_header(self) -> None:
         """Write the CSV header to the output file if needed."""
-        path = os.path.join(
-            self._settings.export_directory, "spanning_cluster_size.dat"
-        )
+        path = self._output_path("spanning_cluster_size.dat")
         number_of_frames = self.frame_processed_count
 
         if self._settings.analysis.overwrite or not os.path.exists(path):
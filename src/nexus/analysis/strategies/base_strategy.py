@@ -1,26 +1,29 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 import numpy as np
 
 from ...core.frame import Frame
 from ...core.node import Node
 from ...config.settings import Settings
 from ...core.cluster import Cluster
+from .labeling.union_find import union_find_labels
+from .labeling.connected_components import connected_components_labels
 
 
 class BaseClusteringStrategy(ABC):
     """
     Abstract base class for all clustering strategies.
 
-    Defines the interface for grouping nodes into clusters using a union-find
-    data structure with path compression. Concrete strategies must implement
-    ``build_clusters()`` with the specific algorithm for identifying and
-    forming clusters.
+    Defines the interface for grouping nodes into clusters. Concrete strategies
+    select the linked node pairs from the frame neighbor list, label the
+    clusters with ``label_clusters()`` (an array-based union-find or SciPy
+    connected components) and group their nodes with ``group_clusters()``. They must
+    implement ``build_clusters()`` with the specific algorithm for identifying
+    and forming clusters.
 
     Attributes:
         frame (Frame): The simulation frame containing the nodes to cluster.
         _lattice (np.ndarray): Lattice matrix from the frame.
-        _nodes (List[Node]): Direct reference to the nodes in the frame.
         _settings (Settings): Configuration settings with clustering parameters.
     """
 
@@ -34,14 +37,87 @@ class BaseClusteringStrategy(ABC):
         """
         self.frame: Frame = frame
         self._lattice: np.ndarray = self.frame.lattice
-        self._nodes: List[Node] = self.frame.nodes
         self._settings: Settings = settings
 
+    def get_networking_ids(self) -> np.ndarray:
+        """
+        Return the indices of the nodes eligible for clustering.
+
+        Networking nodes have one of the ``node_types``; with the bond criterion,
+        nodes of the bridging type (``connectivity[1]``) are excluded. They are
+        selected from the frame type codes, without creating node views.
+
+        Returns:
+            np.ndarray: Indices of the networking nodes, in increasing order.
+        """
+        clustering = self._settings.clustering
+        symbols = clustering.node_types
+        if clustering.criterion == "bond":
+            symbols = [symbol for symbol in symbols if symbol != clustering.connectivity[1]]
+        codes = [self.frame.get_type_code(symbol) for symbol in symbols]
+        return np.flatnonzero(np.isin(self.frame.types, codes))
+
+    def label_clusters(
+        self, first: np.ndarray, second: np.ndarray, num_nodes: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Label the clusters formed by linking node pairs.
+
+        The backend is selected by ``clustering.labeling_backend``:
+        ``"union_find"`` (Numba union-find) or ``"connected_components"``
+        (``scipy.sparse.csgraph``). Both return the same labels.
+
+        Args:
+            first (np.ndarray): First node of each linked pair.
+            second (np.ndarray): Second node of each linked pair.
+            num_nodes (Optional[int]): Number of nodes of the graph, defaults to the
+                number of nodes of the frame.
+
+        Returns:
+            np.ndarray: Cluster label of every node, the smallest node index of its
+                cluster, shape (num_nodes,).
+        """
+        if num_nodes is None:
+            num_nodes = len(self.frame)
+        first = np.ascontiguousarray(first, dtype=np.int64)
+        second = np.ascontiguousarray(second, dtype=np.int64)
+        if self._settings.clustering.labeling_backend == "connected_components":
+            return connected_components_labels(num_nodes, first, second)
+        return union_find_labels(num_nodes, first, second)
+
+    def group_clusters(
+        self, labels: np.ndarray, node_ids: np.ndarray
+    ) -> List[Tuple[int, np.ndarray]]:
+        """
+        Group nodes by cluster label, keeping the clusters of more than one node.
+
+        Nodes are sorted by label with a stable ``np.argsort`` and split with the
+        label counts from ``np.bincount``.
+
+        Args:
+            labels (np.ndarray): Cluster label of every node of the frame.
+            node_ids (np.ndarray): Nodes to group, in increasing order.
+
+        Returns:
+            List[Tuple[int, np.ndarray]]: Label and member nodes of each cluster,
+                ordered by smallest member.
+        """
+        node_labels = labels[node_ids]
+        order = np.argsort(node_labels, kind="stable")
+        counts = np.bincount(node_labels, minlength=len(labels))
+        sizes = counts[counts > 0]
+        groups = np.split(node_ids[order], np.cumsum(sizes)[:-1])
+        groups = [group for group in groups if len(group) > 1]
+        groups.sort(key=lambda group: group[0])
+        return [(int(labels[group[0]]), group) for group in groups]
+
     def find(self, node: Node) -> Node:
         """
         Find the root representative of the set containing *node*.
 
-        Uses path compression so that subsequent lookups are O(1).
+        Uses path compression so that subsequent lookups are O(1). This
+        node-level union-find is not used by the built-in strategies, which
+        label whole frames with ``label_clusters()``.
 
         Args:
             node (Node): The node to look up.
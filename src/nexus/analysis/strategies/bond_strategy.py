@@ -1,5 +1,6 @@
-from typing import List
+from typing import List, Optional
 import numpy as np
+from scipy.sparse import triu
 from tqdm import tqdm
 import shutil
 
@@ -9,7 +10,9 @@ from ...core.cluster import Cluster
 from ...core.frame import Frame
 from ...config.settings import Settings
 from .base_strategy import BaseClusteringStrategy
+from .labeling.bridges import shared_bridge_matrix
 from .search.neighbor_searcher import NeighborSearcher
+from .search.verlet_list import VerletList
 
 
 class BondingStrategy(BaseClusteringStrategy):
@@ -26,24 +29,29 @@ class BondingStrategy(BaseClusteringStrategy):
         _neighbor_searcher (NeighborSearcher): KD-tree based neighbor finder.
     """
 
-    def __init__(self, frame: Frame, settings: Settings) -> None:
+    def __init__(
+        self, frame: Frame, settings: Settings, verlet_list: Optional[VerletList] = None
+    ) -> None:
         """
         Initialize the strategy.
 
         Args:
             frame (Frame): The simulation frame to operate on.
             settings (Settings): Configuration settings.
+            verlet_list (Optional[VerletList]): Candidate pairs kept across frames
+                by the neighbor searcher, or None to search every frame.
         """
         self.frame: Frame = frame
         self.clusters: List[Cluster] = []
         self._lattice: np.ndarray = self.frame.lattice
-        self._nodes: List[Node] = self.frame.nodes
         self._settings: Settings = settings
         self._counter: int = 0
-        self._neighbor_searcher = NeighborSearcher(self.frame, self._settings)
+        self._neighbor_searcher = NeighborSearcher(
+            self.frame, self._settings, verlet_list=verlet_list
+        )
 
     def find_neighbors(self) -> None:
-        """Populate each node's neighbor list using the KD-tree searcher."""
+        """Build the neighbor list of the frame using the KD-tree searcher."""
         self._neighbor_searcher.execute()
 
     def get_connectivities(self) -> List[str]:
@@ -69,18 +77,15 @@ class BondingStrategy(BaseClusteringStrategy):
         """
         Build clusters of networking nodes connected through bridging nodes.
 
-        Applies union-find over networking node pairs that share a common
-        bridging neighbor, then computes cluster properties for each cluster.
+        Finds the networking node pairs that share a common bridging neighbor as
+        the non-zero entries of a sparse incidence-matrix product (see
+        ``shared_bridge_matrix``), labels their clusters, then computes cluster
+        properties for each cluster.
 
         Returns:
             List[Cluster]: The clusters found.
         """
-        networking_nodes = [
-            node
-            for node in self._nodes
-            if node.symbol in self._settings.clustering.node_types
-            and node.symbol != self._settings.clustering.connectivity[1]
-        ]
+        networking_ids = self.get_networking_ids()
         connectivity = self._settings.clustering.connectivity
 
         number_of_nodes = 0
@@ -91,61 +96,54 @@ class BondingStrategy(BaseClusteringStrategy):
             "ncols": shutil.get_terminal_size().columns,
             "colour": "green",
         }
-        progress_bar = tqdm(
-            networking_nodes, desc="Finding clusters ...", **progress_bar_kwargs
+
+        # Pairs of networking nodes sharing at least one bridging node, from the
+        # product of the node-to-bridge incidence matrices
+        types = self.frame.types
+        type1 = self.frame.get_type_code(connectivity[0])
+        type2 = self.frame.get_type_code(connectivity[1])
+        type3 = self.frame.get_type_code(connectivity[2])
+        shared = shared_bridge_matrix(
+            self.frame.neighbor_list,
+            (types == type1) & (types != type2),
+            types == type2,
+            types == type3,
         )
+        if type1 == type3:
+            # Symmetric product: keep each pair once, without the diagonal
+            shared = triu(shared, k=1)
+        shared = shared.tocoo()
 
-        for node in progress_bar:
-            if node.symbol == connectivity[0]:
-                for neighbor in node.neighbors:
-                    if neighbor.symbol == connectivity[1]:
-                        for neighbor2 in neighbor.neighbors:
-                            if neighbor2.symbol == connectivity[2]:
-                                self.union(neighbor2, node)
+        labels = self.label_clusters(shared.row, shared.col)
 
-        clusters_found = {}
+        # Every networking node takes the label of its cluster, then the clusters
+        # of more than one node are grouped from the labels
+        self.frame.cluster_labels[networking_ids] = labels[networking_ids]
+        clusters_found = self.group_clusters(labels, networking_ids)
         local_clusters = []
 
-        for node in networking_nodes:
-            root = self.find(node)
-            clusters_found.setdefault(root.node_id, []).append(node)
-
         progress_bar = tqdm(
-            range(len(clusters_found)),
+            clusters_found,
             desc="Calculating clusters properties ...",
             **progress_bar_kwargs,
         )
 
-        for i in progress_bar:
-            cluster = list(clusters_found.values())[i]
-
-            root = None
-            for node in cluster:
-                root = self.find(node)
-                break
-            if root is None:
-                raise ValueError("Cluster has no root")
-
+        for root_id, members in progress_bar:
             current_cluster = Cluster(
                 connectivity=self.get_connectivities()[0],
-                root_id=root.node_id,
-                size=len(cluster),
+                root_id=root_id,
+                size=len(members),
                 settings=self._settings,
                 lattice=self._lattice,
             )
 
-            for node in cluster:
-                current_cluster.add_node(node)
-                if len(cluster) > 1:
-                    number_of_nodes += 1
-
-            if len(cluster) > 1:
-                self.clusters.append(current_cluster)
-                local_clusters.append(current_cluster)
-                self._counter += 1
+            for node_id in members.tolist():
+                current_cluster.add_node(Node(self.frame, node_id))
+            number_of_nodes += len(members)
 
-            for node in cluster:
-                node.reset_parent()
+            self.clusters.append(current_cluster)
+            local_clusters.append(current_cluster)
+            self._counter += 1
 
         if number_of_nodes == 0:
             number_of_nodes = 1  # avoid zero division
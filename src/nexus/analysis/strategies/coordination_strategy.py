@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 import numpy as np
 from tqdm import tqdm
 import shutil
@@ -9,7 +9,9 @@ from ...core.frame import Frame
 from ...core.cluster import Cluster
 from ...config.settings import Settings
 from .base_strategy import BaseClusteringStrategy
+from .labeling.bridges import shared_bridge_matrix
 from .search.neighbor_searcher import NeighborSearcher
+from .search.verlet_list import VerletList
 
 
 class CoordinationStrategy(BaseClusteringStrategy):
@@ -31,59 +33,60 @@ class CoordinationStrategy(BaseClusteringStrategy):
         _neighbor_searcher (NeighborSearcher): KD-tree based neighbor finder.
     """
 
-    def __init__(self, frame: Frame, settings: Settings) -> None:
+    def __init__(
+        self, frame: Frame, settings: Settings, verlet_list: Optional[VerletList] = None
+    ) -> None:
         """
         Initialize the strategy.
 
         Args:
             frame (Frame): The simulation frame to operate on.
             settings (Settings): Configuration settings.
+            verlet_list (Optional[VerletList]): Candidate pairs kept across frames
+                by the neighbor searcher, or None to search every frame.
         """
         self.frame: Frame = frame
         self.clusters: List[Cluster] = []
         self._lattice: np.ndarray = self.frame.lattice
-        self._nodes: List[Node] = self.frame.nodes
         self._settings: Settings = settings
         self._counter: int = 0
         self._search_mode = "default"
-        self._neighbor_searcher = NeighborSearcher(self.frame, self._settings)
+        self._neighbor_searcher = NeighborSearcher(
+            self.frame, self._settings, verlet_list=verlet_list
+        )
 
     def find_neighbors(self) -> None:
-        """Populate neighbor lists and compute coordination numbers for all nodes."""
+        """Build the neighbor list and compute coordination numbers for all nodes."""
         self._neighbor_searcher.execute()
 
         # Calculate the coordination number
-        for i in range(len(self._nodes)):
-            self.calculate_coordination(idx=i)
+        self.calculate_coordination()
 
-    def calculate_coordination(self, idx: int) -> None:
+    def calculate_coordination(self) -> None:
         """
-        Calculate the coordination number for the node at *idx*.
+        Calculate the coordination number of every node from the neighbor list.
 
         The counting mode is determined by ``coordination_mode`` in settings:
         ``"all_types"``, ``"same_type"``, ``"different_type"``, or a specific
-        node symbol.
-
-        Args:
-            idx (int): Index of the node in ``_nodes``.
+        node symbol. Results are stored in the frame ``coordination`` array.
         """
-        node = self._nodes[idx]
+        neighbor_list = self.frame.neighbor_list
+        types = self.frame.types
+        rows = neighbor_list.rows()
+        neighbor_types = types[neighbor_list.indices]
 
         mode = self._settings.clustering.coordination_mode
 
         # "all_types", "same_type", "different_type", "<node_type>"
         if mode == "all_types":
-            node.set_coordination(len(node.neighbors))
+            counted = rows
         elif mode == "same_type":
-            node.set_coordination(
-                len([n for n in node.neighbors if n.symbol == node.symbol])
-            )
+            counted = rows[neighbor_types == types[rows]]
         elif mode == "different_type":
-            node.set_coordination(
-                len([n for n in node.neighbors if n.symbol != node.symbol])
-            )
+            counted = rows[neighbor_types != types[rows]]
         else:
-            node.set_coordination(len([n for n in node.neighbors if n.symbol == mode]))
+            counted = rows[neighbor_types == self.frame.get_type_code(mode)]
+        self.frame.coordination[:] = np.bincount(counted, minlength=len(self.frame))
 
     def get_connectivities(self) -> List[str]:
         """
@@ -172,65 +175,61 @@ class CoordinationStrategy(BaseClusteringStrategy):
         Build clusters of networking nodes filtered by coordination number.
 
         Selects networking nodes, generates connectivity labels from the
-        coordination range, then delegates to ``_find_cluster()`` for each
-        connectivity.
+        coordination range, then delegates to ``_find_clusters()``, which labels
+        the clusters of all connectivities in a single pass.
 
         Returns:
             List[Cluster]: The clusters found.
         """
         # Select the networking nodes based on clustering settings
         # 1 - check node types
-        if self._settings.clustering.criterion == "bond":
-            networking_nodes = [
-                node
-                for node in self._nodes
-                if node.symbol in self._settings.clustering.node_types
-                and node.symbol != self._settings.clustering.connectivity[1]
-            ]
-        else:
-            networking_nodes = [
-                node
-                for node in self._nodes
-                if node.symbol in self._settings.clustering.node_types
-            ]
+        networking_ids = self.get_networking_ids()
 
         # 2 - generate connectivities based on coordination number range
         connectivities = self.get_connectivities()
 
-        # 3 - generate clusters based on connectivities
+        # 3 - generate clusters of all connectivities in a single pass
         if self._search_mode == "default":
-            self._find_cluster(networking_nodes, connectivities[0], 0, 0)
+            coordination_pairs = [(0, 0)]
         else:
+            coordination_pairs = []
             for connectivity in connectivities:
                 z1, z2 = connectivity.split("-")
-                z1 = int(z1.split("_")[1])
-                z2 = int(z2.split("_")[1])
-                self._find_cluster(networking_nodes, connectivity, z1, z2)
+                coordination_pairs.append(
+                    (int(z1.split("_")[1]), int(z2.split("_")[1]))
+                )
+        self._find_clusters(networking_ids, connectivities, coordination_pairs)
 
         # 4 - return clusters
         for cluster in self.clusters:
             cluster._all_connectivities = set(connectivities)
         return self.clusters
 
-    def _find_cluster(
-        self, networking_nodes: List[Node], connectivity: str, z1: int, z2: int
+    def _find_clusters(
+        self,
+        networking_ids: np.ndarray,
+        connectivities: List[str],
+        coordination_pairs: List[Tuple[int, int]],
     ) -> List[Cluster]:
         """
-        Run union-find for a single connectivity label and coordination pair.
+        Label the clusters of every connectivity in a single pass.
+
+        The linked node pairs are selected once. Each pair is then tagged with the
+        class of its coordination numbers ``(z1, z2)``, and the clusters of all
+        classes are labeled with one call on a graph holding one copy of the
+        nodes per class, so that pairs of different classes never merge.
 
         Args:
-            networking_nodes (List[Node]): Nodes eligible for clustering.
-            connectivity (str): The connectivity label for this run.
-            z1 (int): Required coordination number for the first node type
-                (0 in default mode).
-            z2 (int): Required coordination number for the second node type
-                (0 in default mode).
+            networking_ids (np.ndarray): Indices of the nodes eligible for
+                clustering, in increasing order.
+            connectivities (List[str]): Connectivity labels, one per class.
+            coordination_pairs (List[Tuple[int, int]]): Required coordination
+                numbers ``(z1, z2)`` of the first and second node of each class
+                (``(0, 0)`` in default mode).
 
         Returns:
             List[Cluster]: Updated cumulative cluster list.
         """
-        number_of_nodes = 0
-
         lbound = self._settings.clustering.coordination_range[0]
         ubound = self._settings.clustering.coordination_range[1]
         if lbound == ubound:
@@ -244,111 +243,120 @@ class CoordinationStrategy(BaseClusteringStrategy):
             "ncols": shutil.get_terminal_size().columns,
             "colour": "blue",
         }
-        progress_bar = tqdm(
-            networking_nodes,
-            desc=f"Finding clusters {connectivity} ...",
-            **progress_bar_kwargs,
-        )
+        # Select the linked pairs starting from networking nodes
+        neighbor_list = self.frame.neighbor_list
+        types = self.frame.types
+        coordination = self.frame.coordination
+        rows = neighbor_list.rows()
+        cols = neighbor_list.indices
+        is_networking = np.zeros(len(self.frame), dtype=bool)
+        is_networking[networking_ids] = True
+        sources = targets = np.empty(0, dtype=np.int64)
+        symmetric = False
 
         if self._settings.clustering.criterion == "bond":
-            type1 = self._settings.clustering.connectivity[0]
-            type2 = self._settings.clustering.connectivity[1]
-            type3 = self._settings.clustering.connectivity[2]
-
-            for node in progress_bar:
-                for neighbor in node.neighbors:
-                    if neighbor.symbol == type2:
-                        for neighbor2 in neighbor.neighbors:
-                            if self._search_mode == "default":
-                                if (
-                                    node.symbol == type1 and neighbor2.symbol == type3
-                                ) and (
-                                    node.coordination in coordination_range
-                                    and neighbor2.coordination in coordination_range
-                                ):
-                                    self.union(neighbor2, node)
-                            else:
-                                if (
-                                    node.symbol == type1 and neighbor2.symbol == type3
-                                ) and (
-                                    node.coordination == z1
-                                    and neighbor2.coordination == z2
-                                ):
-                                    self.union(neighbor2, node)
+            type1 = self.frame.get_type_code(self._settings.clustering.connectivity[0])
+            type2 = self.frame.get_type_code(self._settings.clustering.connectivity[1])
+            type3 = self.frame.get_type_code(self._settings.clustering.connectivity[2])
+
+            # Pairs sharing a bridging node, in both orientations
+            shared = shared_bridge_matrix(
+                neighbor_list, is_networking & (types == type1), types == type2, types == type3
+            ).tocoo()
+            symmetric = type1 == type3
+            mask = shared.row != shared.col
+            sources, targets = shared.row[mask], shared.col[mask]
 
         elif self._settings.clustering.criterion == "distance":
-            type1 = self._settings.clustering.connectivity[0]
-            type2 = self._settings.clustering.connectivity[1]
+            type1 = self.frame.get_type_code(self._settings.clustering.connectivity[0])
+            type2 = self.frame.get_type_code(self._settings.clustering.connectivity[1])
 
-            for node in progress_bar:
-                for neighbor in node.neighbors:
-                    if self._search_mode == "default":
-                        if (node.symbol == type1 and neighbor.symbol == type2) and (
-                            node.coordination in coordination_range
-                            and neighbor.coordination in coordination_range
-                        ):
-                            self.union(neighbor, node)
-                    else:
-                        if (node.symbol == type1 and neighbor.symbol == type2) and (
-                            node.coordination == z1 and neighbor.coordination == z2
-                        ):
-                            self.union(neighbor, node)
-
-        clusters_found = {}
-        local_clusters = []
-
-        for node in networking_nodes:
-            root = self.find(node)
-            clusters_found.setdefault(root.node_id, []).append(node)
-
-        progress_bar = tqdm(
-            range(len(clusters_found)),
-            desc=f"Calculating clusters {connectivity} properties ...",
-            **progress_bar_kwargs,
-        )
+            mask = is_networking[rows] & (types[rows] == type1) & (types[cols] == type2)
+            symmetric = type1 == type2
+            sources, targets = rows[mask], cols[mask]
 
-        for i in progress_bar:
-            cluster = list(clusters_found.values())[i]
-
-            root = None
-            for node in cluster:
-                root = self.find(node)
-                break
-            if root is None:
-                raise ValueError("Cluster has no root")
-
-            current_cluster = Cluster(
-                connectivity=connectivity,
-                root_id=root.node_id,
-                size=len(cluster),
-                settings=self._settings,
-                lattice=self._lattice,
+        # Class of every pair, -1 for pairs outside of all classes
+        if self._search_mode == "default":
+            pair_class = np.where(
+                np.isin(coordination[sources], coordination_range)
+                & np.isin(coordination[targets], coordination_range),
+                0,
+                -1,
+            )
+        else:
+            size = max(int(coordination.max(initial=0)), ubound) + 1
+            class_table = np.full((size, size), -1, dtype=np.int64)
+            for k, (z1, z2) in reversed(list(enumerate(coordination_pairs))):
+                class_table[z1, z2] = k
+            pair_class = class_table[coordination[sources], coordination[targets]]
+        mask = pair_class >= 0
+        if symmetric:
+            # Pairs of equal coordination are found from both ends, keep i < j
+            mask &= (sources < targets) | (coordination[sources] != coordination[targets])
+        sources, targets, pair_class = sources[mask], targets[mask], pair_class[mask]
+
+        # One copy of the nodes per class, renumbered to the nodes actually linked.
+        # Keys are sorted, so the smallest key of a component is its smallest node.
+        num_nodes = len(self.frame)
+        keys, inverse = np.unique(
+            np.concatenate((pair_class * num_nodes + sources, pair_class * num_nodes + targets)),
+            return_inverse=True,
+        )
+        inverse = inverse.ravel()
+        compact_labels = self.label_clusters(
+            inverse[: len(sources)], inverse[len(sources) :], num_nodes=len(keys)
+        )
+        roots = keys[compact_labels] % num_nodes
+        class_starts = np.searchsorted(keys, np.arange(len(coordination_pairs) + 1) * num_nodes)
+
+        for k, connectivity in enumerate(connectivities):
+            number_of_nodes = 0
+            # Labels of the class of this coordination pair (its first occurrence):
+            # linked nodes take their root, other nodes keep their own index
+            c = coordination_pairs.index(coordination_pairs[k])
+            start, end = class_starts[c], class_starts[c + 1]
+            labels = np.arange(num_nodes, dtype=np.int64)
+            labels[keys[start:end] % num_nodes] = roots[start:end]
+
+            # Every networking node takes the label of its cluster, then the clusters
+            # of more than one node are grouped from the labels
+            self.frame.cluster_labels[networking_ids] = labels[networking_ids]
+            clusters_found = self.group_clusters(labels, networking_ids)
+            local_clusters = []
+
+            progress_bar = tqdm(
+                clusters_found,
+                desc=f"Calculating clusters {connectivity} properties ...",
+                **progress_bar_kwargs,
             )
 
-            for node in cluster:
-                current_cluster.add_node(node)
-                if len(cluster) > 1:
-                    number_of_nodes += 1
+            for root_id, members in progress_bar:
+                current_cluster = Cluster(
+                    connectivity=connectivity,
+                    root_id=root_id,
+                    size=len(members),
+                    settings=self._settings,
+                    lattice=self._lattice,
+                )
+
+                for node_id in members.tolist():
+                    current_cluster.add_node(Node(self.frame, node_id))
+                number_of_nodes += len(members)
 
-            if len(cluster) > 1:
                 self.clusters.append(current_cluster)
                 local_clusters.append(current_cluster)
                 self._counter += 1
 
-            for node in cluster:
-                node.reset_parent()
-
-        if number_of_nodes == 0:
-            number_of_nodes = 1  # avoid zero division
+            if number_of_nodes == 0:
+                number_of_nodes = 1  # avoid zero division
 
-        for cluster in local_clusters:
-            cluster.total_nodes = number_of_nodes
-            cluster.calculate_unwrapped_positions()
-            cluster.calculate_center_of_mass()
-            cluster.calculate_gyration_radius()
-            cluster.calculate_percolation_probability()
-            cluster.calculate_concentration()
-            cluster.calculate_order_parameter()
+            for cluster in local_clusters:
+                cluster.total_nodes = number_of_nodes
+                cluster.calculate_unwrapped_positions()
+                cluster.calculate_center_of_mass()
+                cluster.calculate_gyration_radius()
+                cluster.calculate_percolation_probability()
+                cluster.calculate_concentration()
+                cluster.calculate_order_parameter()
 
         return self.clusters
-
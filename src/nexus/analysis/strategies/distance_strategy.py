@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 import numpy as np
 from tqdm import tqdm
 import shutil
@@ -10,6 +10,7 @@ from ...core.frame import Frame
 from ...config.settings import Settings
 from .base_strategy import BaseClusteringStrategy
 from .search.neighbor_searcher import NeighborSearcher
+from .search.verlet_list import VerletList
 
 
 class DistanceStrategy(BaseClusteringStrategy):
@@ -26,24 +27,29 @@ class DistanceStrategy(BaseClusteringStrategy):
         _neighbor_searcher (NeighborSearcher): KD-tree based neighbor finder.
     """
 
-    def __init__(self, frame: Frame, settings: Settings) -> None:
+    def __init__(
+        self, frame: Frame, settings: Settings, verlet_list: Optional[VerletList] = None
+    ) -> None:
         """
         Initialize the strategy.
 
         Args:
             frame (Frame): The simulation frame to operate on.
             settings (Settings): Configuration settings.
+            verlet_list (Optional[VerletList]): Candidate pairs kept across frames
+                by the neighbor searcher, or None to search every frame.
         """
         self.frame: Frame = frame
         self.clusters: List[Cluster] = []
         self._lattice: np.ndarray = self.frame.lattice
-        self._nodes: List[Node] = self.frame.nodes
         self._settings: Settings = settings
         self._counter: int = 0
-        self._neighbor_searcher = NeighborSearcher(self.frame, self._settings)
+        self._neighbor_searcher = NeighborSearcher(
+            self.frame, self._settings, verlet_list=verlet_list
+        )
 
     def find_neighbors(self) -> None:
-        """Populate each node's neighbor list using the KD-tree searcher."""
+        """Build the neighbor list of the frame using the KD-tree searcher."""
         self._neighbor_searcher.execute()
 
     def get_connectivities(self) -> List[str]:
@@ -74,11 +80,7 @@ class DistanceStrategy(BaseClusteringStrategy):
         Returns:
             List[Cluster]: The clusters found.
         """
-        networking_nodes = [
-            node
-            for node in self._nodes
-            if node.symbol in self._settings.clustering.node_types
-        ]
+        networking_ids = self.get_networking_ids()
         connectivity = self._settings.clustering.connectivity
 
         number_of_nodes = 0
@@ -89,59 +91,49 @@ class DistanceStrategy(BaseClusteringStrategy):
             "ncols": shutil.get_terminal_size().columns,
             "colour": "green",
         }
-        progress_bar = tqdm(
-            networking_nodes, desc="Finding clusters ...", **progress_bar_kwargs
-        )
-
-        for node in progress_bar:
-            if node.symbol == connectivity[0]:
-                for neighbor in node.neighbors:
-                    if neighbor.symbol == connectivity[1]:
-                        self.union(neighbor, node)
 
-        clusters_found = {}
+        # Select the neighbor entries linking the two connectivity types
+        neighbor_list = self.frame.neighbor_list
+        types = self.frame.types
+        rows = neighbor_list.rows()
+        cols = neighbor_list.indices
+        type1 = self.frame.get_type_code(connectivity[0])
+        type2 = self.frame.get_type_code(connectivity[1])
+        mask = (types[rows] == type1) & (types[cols] == type2)
+        if type1 == type2:
+            # Each pair is stored from both ends, keep the half with i < j
+            mask &= rows < cols
+
+        labels = self.label_clusters(rows[mask], cols[mask])
+
+        # Every networking node takes the label of its cluster, then the clusters
+        # of more than one node are grouped from the labels
+        self.frame.cluster_labels[networking_ids] = labels[networking_ids]
+        clusters_found = self.group_clusters(labels, networking_ids)
         local_clusters = []
 
-        for node in networking_nodes:
-            root = self.find(node)
-            clusters_found.setdefault(root.node_id, []).append(node)
-
         progress_bar = tqdm(
-            range(len(clusters_found)),
+            clusters_found,
             desc="Calculating clusters properties ...",
             **progress_bar_kwargs,
         )
 
-        for i in progress_bar:
-            cluster = list(clusters_found.values())[i]
-
-            root = None
-            for node in cluster:
-                root = self.find(node)
-                break
-            if root is None:
-                raise ValueError("Cluster has no root")
-
+        for root_id, members in progress_bar:
             current_cluster = Cluster(
                 connectivity=self.get_connectivities()[0],
-                root_id=root.node_id,
-                size=len(cluster),
+                root_id=root_id,
+                size=len(members),
                 settings=self._settings,
                 lattice=self._lattice,
             )
 
-            for node in cluster:
-                current_cluster.add_node(node)
-                if len(cluster) > 1:
-                    number_of_nodes += 1
-
-            if len(cluster) > 1:
-                self.clusters.append(current_cluster)
-                local_clusters.append(current_cluster)
-                self._counter += 1
+            for node_id in members.tolist():
+                current_cluster.add_node(Node(self.frame, node_id))
+            number_of_nodes += len(members)
 
-            for node in cluster:
-                node.reset_parent()
+            self.clusters.append(current_cluster)
+            local_clusters.append(current_cluster)
+            self._counter += 1
 
         if number_of_nodes == 0:
             number_of_nodes = 1  # avoid zero division
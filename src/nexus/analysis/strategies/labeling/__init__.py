@@ -0,0 +1,3 @@
+from .union_find import union_find_labels
+from .connected_components import connected_components_labels
+from .bridges import shared_bridge_matrix
\ No newline at end of file
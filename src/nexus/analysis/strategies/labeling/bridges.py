@@ -0,0 +1,45 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ....core.neighbor_list import NeighborList
+
+
+def shared_bridge_matrix(
+    neighbor_list: NeighborList,
+    sources: np.ndarray,
+    bridges: np.ndarray,
+    targets: np.ndarray,
+) -> csr_matrix:
+    """
+    Count the bridging neighbors shared by every pair of nodes.
+
+    Builds the sparse incidence matrices linking source nodes and target nodes to
+    their bridging neighbors, ``B_s`` and ``B_t``, and returns their product
+    ``B_s @ B_t.T``. Its entry ``(i, j)`` is the number of bridging nodes that are
+    neighbors of both ``i`` and ``j``, so its non-zero entries are the pairs
+    linked through at least one bridge (e.g. Si-O-Si). The diagonal holds the
+    number of bridges of the nodes that are both sources and targets.
+
+    Args:
+        neighbor_list (NeighborList): Neighbor list of the frame.
+        sources (np.ndarray): Boolean mask of the source nodes, shape (N,).
+        bridges (np.ndarray): Boolean mask of the bridging nodes, shape (N,).
+        targets (np.ndarray): Boolean mask of the target nodes, shape (N,).
+
+    Returns:
+        csr_matrix: Number of shared bridges of every (source, target) pair, shape
+            (N, N).
+    """
+    num_nodes = neighbor_list.num_nodes
+    rows = neighbor_list.rows()
+    cols = neighbor_list.indices
+    to_bridge = bridges[cols]
+
+    def incidence(mask: np.ndarray) -> csr_matrix:
+        keep = to_bridge & mask[rows]
+        return csr_matrix(
+            (np.ones(np.count_nonzero(keep), dtype=np.int32), (rows[keep], cols[keep])),
+            shape=(num_nodes, num_nodes),
+        )
+
+    return (incidence(sources) @ incidence(targets).T).tocsr()
@@ -0,0 +1,31 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+def connected_components_labels(
+    num_nodes: int, first: np.ndarray, second: np.ndarray
+) -> np.ndarray:
+    """
+    Label the connected components of a graph given by its edges with SciPy.
+
+    Builds the sparse adjacency matrix of the edges and labels it with
+    ``scipy.sparse.csgraph.connected_components``. Each component is labeled by
+    its smallest node index, like ``union_find_labels``.
+
+    Args:
+        num_nodes (int): Number of nodes of the graph.
+        first (np.ndarray): First node of each edge.
+        second (np.ndarray): Second node of each edge.
+
+    Returns:
+        np.ndarray: Component label of every node, shape (num_nodes,).
+    """
+    adjacency = csr_matrix(
+        (np.ones(len(first), dtype=np.int8), (first, second)),
+        shape=(num_nodes, num_nodes),
+    )
+    _, components = connected_components(adjacency, directed=False)
+    # np.unique returns the first, hence smallest, node of each component
+    _, smallest = np.unique(components, return_index=True)
+    return smallest[components].astype(np.int64)
@@ -1 +1,2 @@
-from .neighbor_searcher import NeighborSearcher
\ No newline at end of file
+from .neighbor_searcher import NeighborSearcher
+from .verlet_list import VerletList
\ No newline at end of file
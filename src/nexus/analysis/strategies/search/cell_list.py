@@ -0,0 +1,167 @@
+import numpy as np
+from numba import jit
+from typing import Tuple
+
+from ....utils.geometry import calculate_lattice_widths
+
+
+def get_num_cells(
+    reduced_to_cartesian: np.ndarray, radius: float, num_nodes: int
+) -> np.ndarray:
+    """
+    Return the number of cells along each axis of a cell list.
+
+    Cells are slices of the reduced coordinates ``[0, 1)`` along each axis. The
+    width of a slice is measured perpendicular to the two other axes, so that any
+    pair closer than ``radius`` lies in the same or in adjacent cells, also in
+    triclinic cells. The grid is coarsened when it would hold many more cells than
+    nodes.
+
+    Args:
+        reduced_to_cartesian (np.ndarray): 3x3 matrix whose rows map reduced
+            coordinates to Cartesian coordinates (the lattice for periodic systems).
+        radius (float): Largest distance at which pairs are searched.
+        num_nodes (int): Number of nodes in the frame.
+
+    Returns:
+        np.ndarray: Number of cells along each axis, shape (3,).
+    """
+    widths = calculate_lattice_widths(reduced_to_cartesian)
+    num_cells = np.maximum(1, np.floor(widths / radius)).astype(np.int64)
+    while np.prod(num_cells) > max(27, 4 * num_nodes):
+        num_cells = np.maximum(1, num_cells // 2)
+    return num_cells
+
+
+@jit(nopython=True, cache=True, fastmath=True)
+def cell_list_pairs(
+    reduced: np.ndarray,
+    reduced_to_cartesian: np.ndarray,
+    num_cells: np.ndarray,
+    periodic: bool,
+    radius: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find all pairs of nodes closer than ``radius`` with a linked-cell search.
+
+    Nodes are binned into cells, then each node is only compared with the nodes
+    of its own and of the 26 adjacent cells. Periodic systems wrap the cell
+    indices and use minimum-image displacements. Each unordered pair is reported
+    once, with ``first < second``.
+
+    Args:
+        reduced (np.ndarray): Reduced coordinates of the nodes in ``[0, 1)``, shape
+            (N, 3) (fractional coordinates for periodic systems).
+        reduced_to_cartesian (np.ndarray): 3x3 matrix whose rows map reduced
+            coordinates to Cartesian coordinates.
+        num_cells (np.ndarray): Number of cells along each axis, from
+            ``get_num_cells``.
+        periodic (bool): Whether the reduced box is periodic.
+        radius (float): Largest distance of the reported pairs.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: First and second node of each pair.
+    """
+    num_nodes = reduced.shape[0]
+    nx, ny, nz = num_cells[0], num_cells[1], num_cells[2]
+    num_total = nx * ny * nz
+
+    # Bin the nodes into cells, sorted by cell with a counting sort
+    cell_of = np.empty(num_nodes, dtype=np.int64)
+    for i in range(num_nodes):
+        a = min(max(int(reduced[i, 0] * nx), 0), nx - 1)
+        b = min(max(int(reduced[i, 1] * ny), 0), ny - 1)
+        c = min(max(int(reduced[i, 2] * nz), 0), nz - 1)
+        cell_of[i] = (a * ny + b) * nz + c
+    cell_start = np.zeros(num_total + 1, dtype=np.int64)
+    for i in range(num_nodes):
+        cell_start[cell_of[i] + 1] += 1
+    for cell in range(num_total):
+        cell_start[cell + 1] += cell_start[cell]
+    fill = cell_start[:-1].copy()
+    members = np.empty(num_nodes, dtype=np.int64)
+    for i in range(num_nodes):
+        members[fill[cell_of[i]]] = i
+        fill[cell_of[i]] += 1
+
+    # Distinct neighbor offsets along each axis: with fewer than three periodic
+    # cells, the offsets -1 and +1 would visit the same cell twice
+    offsets = np.zeros((3, 3), dtype=np.int64)
+    num_offsets = np.zeros(3, dtype=np.int64)
+    for axis in range(3):
+        n = num_cells[axis]
+        if n == 1:
+            num_offsets[axis] = 1
+        elif n == 2 and periodic:
+            offsets[axis, 1] = 1
+            num_offsets[axis] = 2
+        else:
+            offsets[axis, 0] = -1
+            offsets[axis, 2] = 1
+            num_offsets[axis] = 3
+
+    radius2 = radius * radius
+    num_pairs = 0
+    first = np.empty(0, dtype=np.int64)
+    second = np.empty(0, dtype=np.int64)
+    # First pass counts the pairs, second pass stores them
+    for step in range(2):
+        count = 0
+        for a in range(nx):
+            for b in range(ny):
+                for c in range(nz):
+                    cell = (a * ny + b) * nz + c
+                    for oa in range(num_offsets[0]):
+                        a2 = a + offsets[0, oa]
+                        if periodic:
+                            a2 %= nx
+                        elif a2 < 0 or a2 >= nx:
+                            continue
+                        for ob in range(num_offsets[1]):
+                            b2 = b + offsets[1, ob]
+                            if periodic:
+                                b2 %= ny
+                            elif b2 < 0 or b2 >= ny:
+                                continue
+                            for oc in range(num_offsets[2]):
+                                c2 = c + offsets[2, oc]
+                                if periodic:
+                                    c2 %= nz
+                                elif c2 < 0 or c2 >= nz:
+                                    continue
+                                cell2 = (a2 * ny + b2) * nz + c2
+                                # Visit each pair of cells once
+                                if cell2 < cell:
+                                    continue
+                                for p in range(cell_start[cell], cell_start[cell + 1]):
+                                    i = members[p]
+                                    q_start = cell_start[cell2]
+                                    if cell2 == cell:
+                                        q_start = p + 1
+                                    for q in range(q_start, cell_start[cell2 + 1]):
+                                        j = members[q]
+                                        d0 = reduced[j, 0] - reduced[i, 0]
+                                        d1 = reduced[j, 1] - reduced[i, 1]
+                                        d2 = reduced[j, 2] - reduced[i, 2]
+                                        if periodic:
+                                            d0 -= np.rint(d0)
+                                            d1 -= np.rint(d1)
+                                            d2 -= np.rint(d2)
+                                        distance2 = 0.0
+                                        for k in range(3):
+                                            x = (
+                                                d0 * reduced_to_cartesian[0, k]
+                                                + d1 * reduced_to_cartesian[1, k]
+                                                + d2 * reduced_to_cartesian[2, k]
+                                            )
+                                            distance2 += x * x
+                                        if distance2 <= radius2:
+                                            if step == 1:
+                                                first[count] = min(i, j)
+                                                second[count] = max(i, j)
+                                            count += 1
+        if step == 0:
+            num_pairs = count
+            first = np.empty(num_pairs, dtype=np.int64)
+            second = np.empty(num_pairs, dtype=np.int64)
+    return first, second
@@ -1,132 +1,300 @@
 import numpy as np
 from scipy.spatial import cKDTree
-from tqdm import tqdm
-from typing import List
-import shutil
+from typing import Optional, Tuple
 
-from ....core.node import Node
 from ....core.frame import Frame
+from ....core.neighbor_list import NeighborList
 from ....config.settings import Settings
-from ....utils.geometry import cartesian_to_fractional
+from ....utils.geometry import cartesian_to_fractional, calculate_lattice_widths
+from .cell_list import cell_list_pairs, get_num_cells
+from .verlet_list import VerletList
 
 
 class NeighborSearcher:
     """
-    KD-tree based neighbor finder for all nodes in a frame.
+    Neighbor finder for all nodes in a frame.
 
-    Builds a ``cKDTree`` over node positions (with optional PBC support),
-    queries it for candidates within the largest cutoff, then refines
-    results with exact per-pair distance checks.
+    Fetches the candidate pairs within the largest cutoff, either from a
+    ``cKDTree`` over node positions (``neighbor_searcher="kd_tree"``) or from a
+    Numba linked-cell search (``neighbor_searcher="cell_list"``), or the pairs of
+    each type pair within its own cutoff from one ``cKDTree`` per species
+    (``neighbor_searcher="per_species"``), all with optional PBC support, then
+    refines them with exact per-pair distance checks.
+    The result is stored on the frame as a CSR ``NeighborList``.
+
+    With a ``VerletList``, the candidates are searched within the cutoffs plus
+    the Verlet skin and reused by the following frames until a node has moved by
+    more than half the skin.
 
     Attributes:
         frame (Frame): The frame containing the nodes to process.
         settings (Settings): Configuration settings with cutoffs and PBC flag.
-        _nodes (List[Node]): Direct reference to the nodes in the frame.
+        with_vectors (bool): Whether displacement vectors are stored in the
+            neighbor list.
+        verlet_list (Optional[VerletList]): Candidate pairs shared with the
+            searchers of the other frames, or None to search every frame.
         _lattice (np.ndarray): Lattice matrix from the frame.
         _max_cutoff (float): Largest cutoff distance across all pair types.
+        _skin (float): Distance added to the cutoffs when searching candidates.
     """
 
-    def __init__(self, frame: Frame, settings: Settings):
+    def __init__(
+        self,
+        frame: Frame,
+        settings: Settings,
+        with_vectors: bool = False,
+        verlet_list: Optional[VerletList] = None,
+    ):
         """
         Initialize the neighbor searcher.
 
         Args:
             frame (Frame): The frame containing the nodes to process.
             settings (Settings): Configuration settings.
+            with_vectors (bool): Store the minimum-image displacement vector of
+                every neighbor entry in addition to its distance.
+            verlet_list (Optional[VerletList]): Candidate pairs kept across
+                frames. When given, its candidates are reused while valid and
+                rebuilt otherwise.
         """
         self.frame: Frame = frame
         self.settings: Settings = settings
-        self._nodes: List[Node] = frame.nodes
+        self.with_vectors: bool = with_vectors
+        self.verlet_list: Optional[VerletList] = verlet_list
         self._lattice: np.ndarray = frame.lattice
         self._max_cutoff: float = max(
             c.distance for c in self.settings.clustering.cutoffs
         )
+        self._skin: float = 0.0 if verlet_list is None else verlet_list.skin
 
-    def execute(self) -> None:
-        """Build the KD-tree and assign neighbors to every node in the frame."""
-        positions = self.frame.get_wrapped_positions()
+    def execute(self) -> NeighborList:
+        """
+        Find all neighbor pairs and assign the neighbor list of the frame.
 
-        # Build the k-d tree, handling periodic boundary conditions
-        if self.settings.apply_pbc:
-            positions_frac = cartesian_to_fractional(positions, self._lattice)
-            kdtree = cKDTree(positions_frac, boxsize=[1, 1, 1])
-            query_positions = positions_frac
-            # Estimate fractional cutoff. This is an approximation but is only used for broad-phase search.
-            # The exact distance check will perform the precise filtering.
-            search_radius = (
-                self._max_cutoff / np.linalg.norm(self._lattice, axis=0).max()
-            )
+        All candidate pairs are fetched at once with the method selected by
+        ``clustering.neighbor_searcher``, then filtered with exact distances in a
+        single array operation. Each unordered pair is checked once and stored
+        for both endpoints. With a valid ``verlet_list``, its candidates replace
+        the search.
+
+        Returns:
+            NeighborList: The neighbor list, also stored as ``frame.neighbor_list``.
+        """
+        if self.verlet_list is not None and self.verlet_list.is_valid(
+            self.frame.positions, self._lattice, self.frame.types, self.settings.apply_pbc
+        ):
+            first, second = self.verlet_list.first, self.verlet_list.second
         else:
-            kdtree = cKDTree(positions)
-            query_positions = positions
-            search_radius = self._max_cutoff
-
-        progress_bar_kwargs = {
-            "disable": not self.settings.verbose,
-            "leave": False,
-            "ncols": shutil.get_terminal_size().columns,
-            "colour": "green",
-        }
-
-        progress_bar = tqdm(
-            range(len(self._nodes)),
-            desc="Fetching nearest neighbors ...",
-            **progress_bar_kwargs,
+            first, second = self._query_pairs()
+            if self.verlet_list is not None:
+                # Keep the candidates within the cutoffs plus the skin
+                first, second, _, _ = self._filter_pairs(first, second, self._skin)
+                self.verlet_list.update(
+                    self.frame.positions, self._lattice, self.frame.types, first, second
+                )
+        first, second, distances, vectors = self._filter_pairs(first, second)
+
+        self.frame.neighbor_list = NeighborList.from_half_pairs(
+            len(self.frame),
+            first,
+            second,
+            distances,
+            vectors if self.with_vectors else None,
         )
+        return self.frame.neighbor_list
+
+    def _query_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch the candidate pairs with the method of ``clustering.neighbor_searcher``.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: First and second node of each candidate
+                pair, with first < second.
+        """
+        if self.settings.clustering.neighbor_searcher == "cell_list":
+            return self._query_cell_list()
+        if self.settings.clustering.neighbor_searcher == "per_species":
+            return self._query_per_species()
+        return self._query_kd_tree()
+
+    def _get_fractional_positions(self) -> np.ndarray:
+        """
+        Return the fractional coordinates of the nodes, wrapped into ``[0, 1)``.
 
-        for i in progress_bar:
-            node = self._nodes[i]
+        Returns:
+            np.ndarray: Fractional coordinates of shape (N, 3).
+        """
+        positions = self.frame.get_wrapped_positions()
+        positions_frac = cartesian_to_fractional(positions, self._lattice)
+        # Rounding can push a coordinate just outside [0, 1), the periodic box
+        positions_frac %= 1.0
+        positions_frac[positions_frac >= 1.0] = 0.0
+        return positions_frac
 
-            # Find candidate neighbors within the max cutoff radius
-            indices = kdtree.query_ball_point(query_positions[i], search_radius)
+    def _get_tree_coordinates(self) -> Tuple[np.ndarray, Optional[np.ndarray], float]:
+        """
+        Return the coordinates, periodic box and norm of the KD-tree searches.
 
-            # Refine neighbors with exact distance checks
-            self._filter_and_assign_neighbors(node, indices)
+        Under PBC, the coordinates are fractional coordinates scaled by the
+        perpendicular widths of the cell, in a periodic box of these widths. A
+        pair closer than the cutoff differs by at most the cutoff along every
+        scaled axis, so querying the Chebyshev ball of radius cutoff returns every
+        such pair, whatever the cell shape. For cells with orthogonal lattice
+        vectors the scaled coordinates are Cartesian, and the Euclidean ball
+        returns exactly the pairs within the cutoff.
 
-    def _filter_and_assign_neighbors(
-        self, node: Node, candidate_indices: List[int]
-    ) -> None:
+        Returns:
+            Tuple[np.ndarray, Optional[np.ndarray], float]: Coordinates of shape
+                (N, 3), periodic box size (None without PBC) and Minkowski norm of
+                the queries.
         """
-        Refine candidates with exact per-pair cutoff checks and assign results.
+        if not self.settings.apply_pbc:
+            return self.frame.positions, None, 2
+        widths = calculate_lattice_widths(self._lattice)
+        scaled = self._get_fractional_positions() * widths
+        # Keep the scaled coordinates inside [0, widths) despite rounding
+        scaled = np.where(scaled >= widths, 0.0, scaled)
+        gram = self._lattice @ self._lattice.T
+        orthogonal = np.count_nonzero(gram - np.diag(np.diag(gram))) == 0
+        return scaled, widths, 2 if orthogonal else np.inf
 
-        Args:
-            node (Node): The node whose neighbors are being assigned.
-            candidate_indices (List[int]): Indices from the broad-phase KD-tree
-                query.
+    def _query_kd_tree(self) -> Tuple[np.ndarray, np.ndarray]:
         """
-        new_neighbors = []
-        new_distances = []
+        Fetch the candidate pairs within the largest cutoff from a KD-tree.
 
-        node_pos = node.position
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: First and second node of each candidate
+                pair, with first < second.
+        """
+        coordinates, boxsize, norm = self._get_tree_coordinates()
+        kdtree = cKDTree(coordinates, boxsize=boxsize)
 
-        for neighbor_idx in candidate_indices:
-            neighbor = self._nodes[neighbor_idx]
+        # Candidate pairs (i < j) within the max cutoff radius
+        radius = self._max_cutoff + self._skin
+        pairs = kdtree.query_pairs(radius, p=norm, output_type="ndarray")
+        return pairs[:, 0], pairs[:, 1]
 
-            # Skip self-interaction
-            if node.node_id == neighbor.node_id:
-                continue
+    def _query_per_species(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch the candidate pairs of each type pair from per-species KD-trees.
 
-            # Check exact cutoff distance for this pair of node types
-            rcut = self.settings.clustering.get_cutoff(node.symbol, neighbor.symbol)
-            if rcut is None:
-                continue
+        One tree is built per species, and only the type pairs with a cutoff are
+        queried, each at its own cutoff. Pairs of species without a cutoff (e.g.
+        O-O in Si-O bond clustering) are never generated.
 
-            # Calculate distance (PBC or direct)
-            if self.settings.apply_pbc:
-                # You should implement calculate_pbc_distance in geometry.py
-                # For now, we assume it exists
-                from ....utils.geometry import calculate_pbc_distance
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: First and second node of each candidate
+                pair, with first < second.
+        """
+        coordinates, boxsize, norm = self._get_tree_coordinates()
+        cutoffs = self.get_cutoff_matrix()
+        types = self.frame.types
+        members = [np.flatnonzero(types == code) for code in range(len(cutoffs))]
+        trees = [
+            cKDTree(coordinates[indices], boxsize=boxsize) if len(indices) else None
+            for indices in members
+        ]
 
-                dist = calculate_pbc_distance(
-                    node_pos, neighbor.position, self._lattice
-                )
-            else:
-                dist = np.linalg.norm(node_pos - neighbor.position)
+        firsts, seconds = [], []
+        for a in range(len(cutoffs)):
+            for b in range(a, len(cutoffs)):
+                if np.isnan(cutoffs[a, b]) or trees[a] is None or trees[b] is None:
+                    continue
+                radius = cutoffs[a, b] + self._skin
+                if a == b:
+                    pairs = trees[a].query_pairs(radius, p=norm, output_type="ndarray")
+                    first, second = members[a][pairs[:, 0]], members[a][pairs[:, 1]]
+                else:
+                    pairs = trees[a].sparse_distance_matrix(
+                        trees[b], radius, p=norm, output_type="ndarray"
+                    )
+                    first, second = members[a][pairs["i"]], members[b][pairs["j"]]
+                firsts.append(np.minimum(first, second))
+                seconds.append(np.maximum(first, second))
 
-            if dist <= rcut:
-                new_neighbors.append(neighbor)
-                new_distances.append(dist)
+        if not firsts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(firsts), np.concatenate(seconds)
+
+    def _query_cell_list(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch the candidate pairs within the largest cutoff from a cell list.
+
+        Periodic systems are binned in fractional coordinates along the lattice
+        vectors, which handles triclinic cells; other systems are binned in the
+        bounding box of the positions.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: First and second node of each candidate
+                pair, with first < second.
+        """
+        search_radius = self._max_cutoff + self._skin
+        if self.settings.apply_pbc:
+            reduced = self._get_fractional_positions()
+            reduced_to_cartesian = np.asarray(self._lattice, dtype=np.float64)
+        else:
+            positions = self.frame.positions
+            lower = positions.min(axis=0) if len(positions) else np.zeros(3)
+            extent = positions.max(axis=0) - lower if len(positions) else np.zeros(3)
+            extent = np.maximum(extent, search_radius)
+            reduced = (positions - lower) / extent
+            reduced_to_cartesian = np.diag(extent)
+
+        num_cells = get_num_cells(reduced_to_cartesian, search_radius, len(self.frame))
+        # Slightly larger radius so that the exact filter alone decides borderline pairs
+        radius = search_radius * (1.0 + 1e-8)
+        return cell_list_pairs(
+            np.ascontiguousarray(reduced),
+            np.ascontiguousarray(reduced_to_cartesian),
+            num_cells,
+            self.settings.apply_pbc,
+            radius,
+        )
+
+    def get_cutoff_matrix(self) -> np.ndarray:
+        """
+        Return the cutoff of every pair of type codes of the frame.
+
+        Returns:
+            np.ndarray: Symmetric (K, K) matrix indexed by type codes, holding NaN for
+                type pairs without a cutoff so that no distance passes the check.
+        """
+        type_symbols = self.frame.type_symbols
+        cutoffs = np.full((len(type_symbols), len(type_symbols)), np.nan)
+        for a, symbol_a in enumerate(type_symbols):
+            for b, symbol_b in enumerate(type_symbols):
+                rcut = self.settings.clustering.get_cutoff(symbol_a, symbol_b)
+                if rcut is not None:
+                    cutoffs[a, b] = rcut
+        return cutoffs
+
+    def _filter_pairs(
+        self, first: np.ndarray, second: np.ndarray, margin: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Refine candidate pairs with exact per-type-pair cutoff checks.
+
+        Args:
+            first (np.ndarray): First node of each candidate pair.
+            second (np.ndarray): Second node of each candidate pair.
+            margin (float): Distance added to every cutoff.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: First and second
+                node, distance and displacement vector of the retained pairs.
+        """
+        types = self.frame.types
+        rcut = self.get_cutoff_matrix()[types[first], types[second]]
+        keep = ~np.isnan(rcut)
+        first, second, rcut = first[keep], second[keep], rcut[keep]
+
+        # Minimum-image displacements for all pairs in one operation
+        vectors = self.frame.positions[second] - self.frame.positions[first]
+        if self.settings.apply_pbc:
+            fractional = vectors @ np.linalg.inv(self._lattice)
+            fractional -= np.round(fractional)
+            vectors = fractional @ self._lattice
+        distances = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
 
-        node.neighbors = new_neighbors
-        node.distances = new_distances
-        node.indices = [n.node_id for n in new_neighbors]
+        keep = distances <= rcut + margin
+        return first[keep], second[keep], distances[keep], vectors[keep]
@@ -0,0 +1,102 @@
+import numpy as np
+from typing import Optional
+
+
+class VerletList:
+    """
+    Candidate pairs kept across consecutive frames (Verlet skin).
+
+    The candidate pairs are the pairs closer than their cutoff plus ``skin`` in
+    the frame where they were built. As long as no node has moved by more than
+    ``skin / 2`` since then, no pair can have come closer than its cutoff without
+    being a candidate, so later frames only re-check the exact distances of the
+    candidates instead of searching the whole frame again.
+
+    The list is created once per run and handed to the ``NeighborSearcher`` of
+    every frame, which rebuilds it whenever it is no longer valid.
+
+    Attributes:
+        skin (float): Distance added to the cutoffs when the candidates are built.
+        first (Optional[np.ndarray]): First node of each candidate pair.
+        second (Optional[np.ndarray]): Second node of each candidate pair.
+        num_rebuilds (int): Number of times the candidates were built.
+        _positions (Optional[np.ndarray]): Node positions when the candidates were
+            built.
+        _lattice (Optional[np.ndarray]): Lattice when the candidates were built.
+        _types (Optional[np.ndarray]): Node type codes when the candidates were
+            built.
+    """
+
+    def __init__(self, skin: float) -> None:
+        """
+        Initialize an empty Verlet list.
+
+        Args:
+            skin (float): Distance added to the cutoffs when the candidates are
+                built.
+        """
+        self.skin: float = skin
+        self.first: Optional[np.ndarray] = None
+        self.second: Optional[np.ndarray] = None
+        self.num_rebuilds: int = 0
+        self._positions: Optional[np.ndarray] = None
+        self._lattice: Optional[np.ndarray] = None
+        self._types: Optional[np.ndarray] = None
+
+    def is_valid(
+        self, positions: np.ndarray, lattice: np.ndarray, types: np.ndarray, apply_pbc: bool
+    ) -> bool:
+        """
+        Check whether the candidates still hold every pair within the cutoffs.
+
+        The candidates are invalid when they were never built, when the nodes or
+        the lattice changed, or when a node moved by more than ``skin / 2`` since
+        they were built.
+
+        Args:
+            positions (np.ndarray): Current node positions, shape (N, 3).
+            lattice (np.ndarray): Current lattice matrix.
+            types (np.ndarray): Current node type codes, shape (N,).
+            apply_pbc (bool): Whether displacements follow the minimum-image
+                convention.
+
+        Returns:
+            bool: True if the candidates can be reused.
+        """
+        if self._positions is None or len(positions) != len(self._positions):
+            return False
+        if not np.array_equal(lattice, self._lattice) or not np.array_equal(types, self._types):
+            return False
+
+        displacements = positions - self._positions
+        if apply_pbc:
+            fractional = displacements @ np.linalg.inv(lattice)
+            fractional -= np.round(fractional)
+            displacements = fractional @ lattice
+        max_displacement2 = np.einsum("ij,ij->i", displacements, displacements).max(initial=0.0)
+        return max_displacement2 <= (0.5 * self.skin) ** 2
+
+    def update(
+        self,
+        positions: np.ndarray,
+        lattice: np.ndarray,
+        types: np.ndarray,
+        first: np.ndarray,
+        second: np.ndarray,
+    ) -> None:
+        """
+        Store freshly built candidates with the frame they were built from.
+
+        Args:
+            positions (np.ndarray): Node positions, shape (N, 3).
+            lattice (np.ndarray): Lattice matrix.
+            types (np.ndarray): Node type codes, shape (N,).
+            first (np.ndarray): First node of each candidate pair.
+            second (np.ndarray): Second node of each candidate pair.
+        """
+        self._positions = np.array(positions, dtype=np.float64)
+        self._lattice = np.array(lattice, dtype=np.float64)
+        self._types = np.array(types)
+        self.first = first
+        self.second = second
+        self.num_rebuilds += 1
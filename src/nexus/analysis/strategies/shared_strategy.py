@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 import numpy as np
 from tqdm import tqdm
 import shutil
@@ -9,7 +9,9 @@ from ...core.frame import Frame
 from ...core.cluster import Cluster
 from ...config.settings import Settings
 from .base_strategy import BaseClusteringStrategy
+from .labeling.bridges import shared_bridge_matrix
 from .search.neighbor_searcher import NeighborSearcher
+from .search.verlet_list import VerletList
 
 
 class SharedStrategy(BaseClusteringStrategy):
@@ -27,123 +29,112 @@ class SharedStrategy(BaseClusteringStrategy):
         _neighbor_searcher (NeighborSearcher): KD-tree based neighbor finder.
     """
 
-    def __init__(self, frame: Frame, settings: Settings) -> None:
+    def __init__(
+        self, frame: Frame, settings: Settings, verlet_list: Optional[VerletList] = None
+    ) -> None:
         """
         Initialize the strategy.
 
         Args:
             frame (Frame): The simulation frame to operate on.
             settings (Settings): Configuration settings.
+            verlet_list (Optional[VerletList]): Candidate pairs kept across frames
+                by the neighbor searcher, or None to search every frame.
         """
         self.frame: Frame = frame
         self.clusters: List[Cluster] = []
         self._lattice: np.ndarray = self.frame.lattice
-        self._nodes: List[Node] = self.frame.nodes
         self._settings: Settings = settings
         self._counter: int = 0
-        self._neighbor_searcher = NeighborSearcher(self.frame, self._settings)
+        self._neighbor_searcher = NeighborSearcher(
+            self.frame, self._settings, verlet_list=verlet_list
+        )
 
     def find_neighbors(self) -> None:
-        """Populate neighbor lists and compute coordination numbers for all nodes."""
+        """Build the neighbor list and compute coordination numbers for all nodes."""
         self._neighbor_searcher.execute()
 
         # Calculate the coordination number
-        for i in range(len(self._nodes)):
-            self.calculate_coordination(idx=i)
+        self.calculate_coordination()
 
-    def calculate_coordination(self, idx: int) -> None:
+    def calculate_coordination(self) -> None:
         """
-        Calculate the coordination number for the node at *idx*.
+        Calculate the coordination number of every node from the neighbor list.
 
         The counting mode is determined by ``coordination_mode`` in settings:
         ``"all_types"``, ``"same_type"``, ``"different_type"``, or a specific
-        node symbol.
-
-        Args:
-            idx (int): Index of the node in ``_nodes``.
+        node symbol. Results are stored in the frame ``coordination`` array.
         """
-        node = self._nodes[idx]
+        neighbor_list = self.frame.neighbor_list
+        types = self.frame.types
+        rows = neighbor_list.rows()
+        neighbor_types = types[neighbor_list.indices]
 
         mode = self._settings.clustering.coordination_mode
 
         # "all_types", "same_type", "different_type", "<node_type>"
         if mode == "all_types":
-            node.set_coordination(len(node.neighbors))
+            counted = rows
         elif mode == "same_type":
-            node.set_coordination(
-                len([n for n in node.neighbors if n.symbol == node.symbol])
-            )
+            counted = rows[neighbor_types == types[rows]]
         elif mode == "different_type":
-            node.set_coordination(
-                len([n for n in node.neighbors if n.symbol != node.symbol])
-            )
+            counted = rows[neighbor_types != types[rows]]
         else:
-            node.set_coordination(len([n for n in node.neighbors if n.symbol == mode]))
+            counted = rows[neighbor_types == self.frame.get_type_code(mode)]
+        self.frame.coordination[:] = np.bincount(counted, minlength=len(self.frame))
 
-    def get_networking_nodes(self, coordination_range: List) -> List[Node]:
+    def get_shared_networking_ids(self, coordination_range: List) -> np.ndarray:
         """
         Filter networking nodes by shared-neighbor threshold.
 
         Counts how many bridging neighbors each pair of networking nodes
-        shares and retains only those nodes that have at least two qualifying
-        neighbors. The threshold can operate in ``"exact"`` or ``"minimum"``
-        mode as specified in settings.
+        shares, for the whole frame at once as a sparse matrix (see
+        ``shared_bridge_matrix``), and retains only those nodes that have at
+        least two qualifying neighbors. The threshold can operate in
+        ``"exact"`` or ``"minimum"`` mode as specified in settings.
 
         Args:
             coordination_range (List): Allowed coordination numbers.
 
         Returns:
-            List[Node]: Nodes that satisfy the shared-neighbor criterion.
+            np.ndarray: Indices of the nodes that satisfy the shared-neighbor
+                criterion, in increasing order.
         """
         mode = self._settings.clustering.shared_mode
         threshold_mode = self._settings.clustering.shared_threshold_mode
-        network_nodes = [
-            n
-            for n in self._nodes
-            if n.symbol
-            in [
-                self._settings.clustering.connectivity[0],
-                self._settings.clustering.connectivity[-1],
-            ]
-            and n.coordination in coordination_range
-        ]
-
-        filtered_nodes: List[Node] = []
-
-        for _, node in enumerate(network_nodes):
-            if node.symbol in [
-                self._settings.clustering.connectivity[0],
-                self._settings.clustering.connectivity[-1],
-            ]:
-                unique_bond = []
-                for neighbor in node.neighbors:
-                    if neighbor.symbol == mode:
-                        for second_neighbor in neighbor.neighbors:
-                            if second_neighbor == node:
-                                continue
-                            if second_neighbor.symbol in [
-                                self._settings.clustering.connectivity[0],
-                                self._settings.clustering.connectivity[-1],
-                            ]:
-                                unique_bond.append(second_neighbor.node_id)
-                _, counts = np.unique(unique_bond, return_counts=True)
-                counter = 0
-                for c in counts:
-                    if threshold_mode == "exact":
-                        if c == self._settings.clustering.shared_threshold:
-                            counter += 1
-                    elif threshold_mode == "minimum":
-                        if c >= self._settings.clustering.shared_threshold:
-                            counter += 1
-                    else:
-                        raise ValueError(
-                            f"Unknown shared threshold mode: {threshold_mode}. Supported modes are 'exact' and 'minimum'."
-                        )
-                if counter >= 2:
-                    if node not in filtered_nodes:
-                        filtered_nodes.append(node)
+        threshold = self._settings.clustering.shared_threshold
+        if threshold_mode not in ["exact", "minimum"]:
+            raise ValueError(
+                f"Unknown shared threshold mode: {threshold_mode}. Supported modes are 'exact' and 'minimum'."
+            )
 
-        return filtered_nodes
+        types = self.frame.types
+        is_end_type = np.isin(
+            types,
+            [
+                self.frame.get_type_code(self._settings.clustering.connectivity[0]),
+                self.frame.get_type_code(self._settings.clustering.connectivity[-1]),
+            ],
+        )
+        is_network_node = is_end_type & np.isin(self.frame.coordination, coordination_range)
+
+        # Number of bridging neighbors shared by every network node and every
+        # other node of the end types, for the whole frame at once
+        shared = shared_bridge_matrix(
+            self.frame.neighbor_list,
+            is_network_node,
+            types == self.frame.get_type_code(mode),
+            is_end_type,
+        ).tocoo()
+        if threshold_mode == "exact":
+            qualifying = shared.data == threshold
+        else:
+            qualifying = shared.data >= threshold
+        qualifying &= shared.row != shared.col
+
+        # Keep the nodes with at least two qualifying partners
+        counter = np.bincount(shared.row[qualifying], minlength=len(self.frame))
+        return np.flatnonzero(is_network_node & (counter >= 2))
 
     # def find(self, node: Node) -> Node:
     #     if node.parent != node:
@@ -262,7 +253,7 @@ class SharedStrategy(BaseClusteringStrategy):
         else:
             coordination_range = np.arange(lbound, ubound + 1)
         if self._settings.clustering.criterion == "bond":
-            networking_nodes = self.get_networking_nodes(coordination_range)
+            networking_ids = self.get_shared_networking_ids(coordination_range)
         else:
             raise NotImplementedError(
                 "SharedStrategy currently supports only 'bond' criterion for clustering."
@@ -273,25 +264,26 @@ class SharedStrategy(BaseClusteringStrategy):
 
         # 3 - generate clusters based on connectivities
         if self._search_mode == "default":
-            self._find_cluster(networking_nodes, connectivities[0], 0, 0)
+            self._find_cluster(networking_ids, connectivities[0], 0, 0)
         else:
             for connectivity in connectivities:
                 z1, z2 = connectivity.split("=")
                 z1 = int(z1.split("_")[1])
                 z2 = int(z2.split("_")[1])
-                self._find_cluster(networking_nodes, connectivity, z1, z2)
+                self._find_cluster(networking_ids, connectivity, z1, z2)
 
         # 4 - return clusters
         return self.clusters
 
     def _find_cluster(
-        self, networking_nodes: List[Node], connectivity: str, z1: int, z2: int
+        self, networking_ids: np.ndarray, connectivity: str, z1: int, z2: int
     ) -> List[Cluster]:
         """
         Run union-find for a single connectivity label and coordination pair.
 
         Args:
-            networking_nodes (List[Node]): Nodes eligible for clustering.
+            networking_ids (np.ndarray): Indices of the nodes eligible for
+                clustering, in increasing order.
             connectivity (str): The connectivity label for this run.
             z1 (int): Required coordination number for the first node type
                 (0 in default mode).
@@ -316,104 +308,82 @@ class SharedStrategy(BaseClusteringStrategy):
             "ncols": shutil.get_terminal_size().columns,
             "colour": "blue",
         }
-        progress_bar = tqdm(
-            networking_nodes,
-            desc=f"Finding clusters {connectivity} ...",
-            **progress_bar_kwargs,
-        )
-        indices = [node.node_id for node in networking_nodes]
+        # Select the neighbor entries starting from networking nodes
+        neighbor_list = self.frame.neighbor_list
+        types = self.frame.types
+        coordination = self.frame.coordination
+        rows = neighbor_list.rows()
+        cols = neighbor_list.indices
+        is_networking = np.zeros(len(self.frame), dtype=bool)
+        is_networking[networking_ids] = True
+        mask = is_networking[rows]
+        sources = targets = np.empty(0, dtype=np.int64)
+        symmetric = False
 
         if self._settings.clustering.criterion == "bond":
-            type1 = self._settings.clustering.connectivity[0]
-            type2 = self._settings.clustering.connectivity[1]
-            type3 = self._settings.clustering.connectivity[2]
-
-            for node in progress_bar:
-                for neighbor in node.neighbors:
-                    if neighbor.symbol == type2:
-                        for neighbor2 in neighbor.neighbors:
-                            if neighbor2 == node:
-                                continue
-                            if neighbor2.node_id not in indices:
-                                continue
-                            if self._search_mode == "default":
-                                if (
-                                    node.symbol == type1 and neighbor2.symbol == type3
-                                ) and (
-                                    node.coordination in coordination_range
-                                    and neighbor2.coordination in coordination_range
-                                ):
-                                    self.union(neighbor2, node)
-                            else:
-                                if (
-                                    node.symbol == type1 and neighbor2.symbol == type3
-                                ) and (
-                                    node.coordination == z1
-                                    and neighbor2.coordination == z2
-                                ):
-                                    self.union(neighbor2, node)
+            type1 = self.frame.get_type_code(self._settings.clustering.connectivity[0])
+            type2 = self.frame.get_type_code(self._settings.clustering.connectivity[1])
+            type3 = self.frame.get_type_code(self._settings.clustering.connectivity[2])
+
+            # Follow the bridging nodes to the nodes on the other side
+            mask &= (types[rows] == type1) & (types[cols] == type2)
+            symmetric = type1 == type3
+            sources, targets = neighbor_list.expand(rows[mask], cols[mask])
+            # Skip paths coming back to their source and non-networking targets
+            mask = (
+                (types[targets] == type3)
+                & (targets != sources)
+                & is_networking[targets]
+            )
+            sources, targets = sources[mask], targets[mask]
 
         elif self._settings.clustering.criterion == "distance":
-            type1 = self._settings.clustering.connectivity[0]
-            type2 = self._settings.clustering.connectivity[1]
+            type1 = self.frame.get_type_code(self._settings.clustering.connectivity[0])
+            type2 = self.frame.get_type_code(self._settings.clustering.connectivity[1])
 
-            for node in progress_bar:
-                for neighbor in node.neighbors:
-                    if self._search_mode == "default":
-                        if (node.symbol == type1 and neighbor.symbol == type2) and (
-                            node.coordination in coordination_range
-                            and neighbor.coordination in coordination_range
-                        ):
-                            self.union(neighbor, node)
-                    else:
-                        if (node.symbol == type1 and neighbor.symbol == type2) and (
-                            node.coordination == z1 and neighbor.coordination == z2
-                        ):
-                            self.union(neighbor, node)
-
-        clusters_found = {}
-        local_clusters = []
+            mask &= (types[rows] == type1) & (types[cols] == type2)
+            sources, targets = rows[mask], cols[mask]
 
-        for node in networking_nodes:
-            root = self.find(node)
-            clusters_found.setdefault(root.node_id, []).append(node)
+        if self._search_mode == "default":
+            mask = np.isin(coordination[sources], coordination_range) & np.isin(
+                coordination[targets], coordination_range
+            )
+        else:
+            mask = (coordination[sources] == z1) & (coordination[targets] == z2)
+        if symmetric and (self._search_mode == "default" or z1 == z2):
+            # Each pair is found from both ends, keep the half with i < j
+            mask &= sources < targets
+
+        labels = self.label_clusters(sources[mask], targets[mask])
+
+        # Every networking node takes the label of its cluster, then the clusters
+        # of more than one node are grouped from the labels
+        self.frame.cluster_labels[networking_ids] = labels[networking_ids]
+        clusters_found = self.group_clusters(labels, networking_ids)
+        local_clusters = []
 
         progress_bar = tqdm(
-            range(len(clusters_found)),
+            clusters_found,
             desc=f"Calculating clusters {connectivity} properties ...",
             **progress_bar_kwargs,
         )
 
-        for i in progress_bar:
-            cluster = list(clusters_found.values())[i]
-
-            root = None
-            for node in cluster:
-                root = self.find(node)
-                break
-            if root is None:
-                raise ValueError("Cluster has no root")
-
+        for root_id, members in progress_bar:
             current_cluster = Cluster(
                 connectivity=connectivity,
-                root_id=root.node_id,
-                size=len(cluster),
+                root_id=root_id,
+                size=len(members),
                 settings=self._settings,
                 lattice=self._lattice,
             )
 
-            for node in cluster:
-                current_cluster.add_node(node)
-                if len(cluster) > 1:
-                    number_of_nodes += 1
-
-            if len(cluster) > 1:
-                self.clusters.append(current_cluster)
-                local_clusters.append(current_cluster)
-                self._counter += 1
+            for node_id in members.tolist():
+                current_cluster.add_node(Node(self.frame, node_id))
+            number_of_nodes += len(members)
 
-            for node in cluster:
-                node.reset_parent()
+            self.clusters.append(current_cluster)
+            local_clusters.append(current_cluster)
+            self._counter += 1
 
         if number_of_nodes == 0:
             number_of_nodes = 1  # avoid zero division
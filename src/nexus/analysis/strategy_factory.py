@@ -7,6 +7,7 @@ from .strategies.distance_strategy import DistanceStrategy
 from .strategies.bond_strategy import BondingStrategy
 from .strategies.shared_strategy import SharedStrategy
 from .strategies.coordination_strategy import CoordinationStrategy
+from .strategies.search.verlet_list import VerletList
 
 
 class StrategyFactory:
@@ -28,7 +29,9 @@ class StrategyFactory:
         _strategies (dict): Internal dictionary mapping strategy class names to strategy instances.
     """
 
-    def __init__(self, frame: Frame, settings: Settings) -> None:
+    def __init__(
+        self, frame: Frame, settings: Settings, verlet_list: Optional[VerletList] = None
+    ) -> None:
         """
         Initialize the StrategyFactory with a frame and settings, and register all available strategies.
 
@@ -40,13 +43,16 @@ class StrategyFactory:
             frame (Frame): The simulation frame containing the nodes to be clustered.
             settings (Settings): Configuration settings object containing clustering parameters
                 needed by the strategies for their initialization and operation.
+            verlet_list (Optional[VerletList]): Candidate pairs kept across frames,
+                handed to the neighbor searcher of every strategy. None searches
+                every frame from scratch.
         """
         self._strategies = {}
         # Register other strategies here
-        self.register_strategy(DistanceStrategy(frame, settings))
-        self.register_strategy(BondingStrategy(frame, settings))
-        self.register_strategy(SharedStrategy(frame, settings))
-        self.register_strategy(CoordinationStrategy(frame, settings))
+        self.register_strategy(DistanceStrategy(frame, settings, verlet_list))
+        self.register_strategy(BondingStrategy(frame, settings, verlet_list))
+        self.register_strategy(SharedStrategy(frame, settings, verlet_list))
+        self.register_strategy(CoordinationStrategy(frame, settings, verlet_list))
 
     def register_strategy(self, strategy: BaseClusteringStrategy) -> None:
         """
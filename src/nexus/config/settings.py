@@ -12,18 +12,49 @@ class GeneralSettings:
     Attributes:
         project_name (str): Name of the project, used for output directory naming.
         export_directory (str): Root directory for exported results.
-        file_location (str): Path to the trajectory file.
+        file_location (str): Path to the trajectory file. Named pipes and ``"-"``
+            (standard input) are read as streams in a single forward pass.
+        file_format (Optional[str]): File extension selecting the reader (``"xyz"``,
+            ``"lammpstrj"``, ``"bin"`` or ``"nxtraj"``, not a reader name such as
+            ``"lammps_binary"``) when ``file_location`` has none. Required for
+            standard input.
         range_of_frames (Tuple[int, int]): Start and end frame indices to process.
             Use -1 as end to process all remaining frames.
         apply_pbc (bool): Whether to apply periodic boundary conditions.
         verbose (bool): Whether to print settings, progress bars, and other information.
         save_logs (bool): Whether to save log files.
         save_performance (bool): Whether to save performance metrics.
+        memory_map (bool): Whether to memory-map the trajectory file so that frames
+            are indexed and sliced from the mapped buffer instead of read line by line.
+        save_frame_index (bool): Whether to save the frame index to a sidecar file next
+            to the trajectory and reuse it while the trajectory is unchanged.
+        scan_workers (int): Number of worker processes used to scan the trajectory.
+            Values above 1 split the file into byte ranges scanned in parallel.
+        read_buffer_size (int): Size in bytes of the read-ahead buffer of the file
+            handle kept open while iterating over frames in order.
+        prefetch_depth (int): Number of frames parsed and prepared ahead in a
+            background thread while the current frame is analyzed. 0 disables
+            prefetching.
+        checkpoint_interval (int): Number of uncompressed bytes between the
+            decompression checkpoints recorded for compressed trajectories. Each
+            gzip checkpoint keeps a copy of the decompressor state, including its
+            32 KiB window (about 40 kB in total), so a smaller interval uses
+            proportionally more memory: the 16 MiB default costs about 2.5 kB per
+            MiB of uncompressed data.
+        follow (bool): Whether to keep reading frames appended to the trajectory
+            while it is still being written, as ``tail -f`` does.
+        follow_poll_interval (float): Seconds to wait before checking the
+            trajectory again when no new frame is available in follow mode.
+        follow_timeout (Optional[float]): Seconds without new frames after which
+            follow mode stops. None waits until interrupted.
+        flush_interval (int): Number of processed frames between intermediate
+            writes of the analyzer results. 0 writes them only at the end.
     """
 
     project_name: str = "Project"  # Name of the project
     export_directory: str = "exports"  # Directory to export results
-    file_location: str = ""  # Path to the trajectory file
+    file_location: str = ""  # Path to the trajectory file, or "-" for standard input
+    file_format: Optional[str] = None  # Extension selecting the reader, e.g. "xyz"
     range_of_frames: Tuple[int, int] = (
         0,
         -1,
@@ -34,6 +65,16 @@ class GeneralSettings:
     )
     save_logs: bool = False  # Whether to save logs
     save_performance: bool = False  # Whether to save performance
+    memory_map: bool = False  # Whether to memory-map the trajectory file
+    save_frame_index: bool = False  # Whether to save and reuse the frame index sidecar
+    scan_workers: int = 1  # Number of worker processes used to scan the trajectory
+    read_buffer_size: int = 1 << 20  # Read-ahead buffer size for sequential iteration
+    prefetch_depth: int = 0  # Number of frames prepared ahead in a background thread
+    checkpoint_interval: int = 1 << 24  # Uncompressed bytes between decompression checkpoints
+    follow: bool = False  # Whether to keep reading frames appended to the trajectory
+    follow_poll_interval: float = 1.0  # Seconds between checks for new frames
+    follow_timeout: Optional[float] = None  # Seconds without new frames before stopping
+    flush_interval: int = 0  # Frames between intermediate writes of analyzer results
 
 
 @dataclass
@@ -78,7 +119,15 @@ class ClusteringSettings:
     Attributes:
         criterion (str): Clustering criterion, either ``"distance"`` (2-element
             connectivity) or ``"bond"`` (3-element connectivity through a bridging node).
-        neighbor_searcher (str): Spatial search algorithm (currently ``"kd_tree"``).
+        neighbor_searcher (str): Spatial search algorithm, ``"kd_tree"``,
+            ``"cell_list"`` or ``"per_species"``.
+        verlet_skin (float): Verlet skin distance. When positive, candidate pairs
+            are searched within the cutoffs plus the skin and reused by the
+            following frames until a node has moved by more than half the skin.
+            ``0.0`` searches every frame.
+        labeling_backend (str): Cluster labeling algorithm, ``"union_find"``
+            (Numba array union-find) or ``"connected_components"``
+            (``scipy.sparse.csgraph``).
         node_types (List[str]): Node symbols to include in the analysis.
         node_masses (List[float]): Masses for each node type in reduced units.
         connectivity (List[str]): Connectivity pattern (e.g., ``["Si", "Si"]`` or
@@ -107,7 +156,9 @@ class ClusteringSettings:
     """
 
     criterion: str = "distance"  # "distance" or "bond"
-    neighbor_searcher: str = "kd_tree"  # "kd_tree", TODO : "cell_list"
+    neighbor_searcher: str = "kd_tree"  # "kd_tree", "cell_list", "per_species"
+    verlet_skin: float = 0.0  # Verlet skin distance, 0.0 to search every frame
+    labeling_backend: str = "union_find"  # "union_find", "connected_components"
     node_types: List[str] = field(default_factory=lambda: [])  # List of node types
     node_masses: List[float] = field(
         default_factory=lambda: []
@@ -450,12 +501,24 @@ class Settings:
     Attributes:
         project_name (str): Name of the project, used for output directory naming.
         export_directory (str): Root directory for exported results.
-        file_location (str): Path to the trajectory file.
+        file_location (str): Path to the trajectory file, or ``"-"`` for standard input.
+        file_format (Optional[str]): File extension selecting the reader, e.g.
+            ``"xyz"`` or ``"bin"``. Required for standard input.
         range_of_frames (Tuple[int, int]): Start and end frame indices to process.
         apply_pbc (bool): Whether to apply periodic boundary conditions.
         verbose (bool): Whether to print progress information.
         save_logs (bool): Whether to save log files.
         save_performance (bool): Whether to save performance metrics.
+        memory_map (bool): Whether to memory-map the trajectory file.
+        save_frame_index (bool): Whether to save and reuse the frame index sidecar.
+        scan_workers (int): Number of worker processes used to scan the trajectory.
+        read_buffer_size (int): Read-ahead buffer size for sequential iteration.
+        prefetch_depth (int): Number of frames prepared ahead in a background thread.
+        checkpoint_interval (int): Uncompressed bytes between decompression checkpoints.
+        follow (bool): Whether to keep reading frames appended to the trajectory.
+        follow_poll_interval (float): Seconds between checks for new frames.
+        follow_timeout (Optional[float]): Seconds without new frames before stopping.
+        flush_interval (int): Frames between intermediate writes of analyzer results.
         general (GeneralSettings): General configuration sub-settings.
         lattice (LatticeSettings): Lattice configuration sub-settings.
         clustering (ClusteringSettings): Clustering configuration sub-settings.
@@ -465,11 +528,22 @@ class Settings:
     project_name: str = "default"
     export_directory: str = "export"
     file_location: str = "./"
+    file_format: Optional[str] = None
     range_of_frames: Tuple[int, int] = (0, -1)
     apply_pbc: bool = True
     verbose: bool = False
     save_logs: bool = False
     save_performance: bool = False
+    memory_map: bool = False
+    save_frame_index: bool = False
+    scan_workers: int = 1
+    read_buffer_size: int = 1 << 20
+    prefetch_depth: int = 0
+    checkpoint_interval: int = 1 << 24
+    follow: bool = False
+    follow_poll_interval: float = 1.0
+    follow_timeout: Optional[float] = None
+    flush_interval: int = 0
     general: GeneralSettings = field(default_factory=GeneralSettings)
     lattice: LatticeSettings = field(default_factory=LatticeSettings)
     clustering: ClusteringSettings = field(default_factory=ClusteringSettings)
@@ -600,14 +674,33 @@ class SettingsBuilder:
             raise ValueError(f"Invalid export directory: {general.export_directory}")
         if not general.file_location:
             raise ValueError(f"Invalid file location: {general.file_location}")
+        if general.file_location == "-" and not general.file_format:
+            raise ValueError(
+                "Reading from standard input requires file_format (e.g. \"xyz\")"
+            )
         if not general.range_of_frames:
             raise ValueError(f"Invalid range of frames: {general.range_of_frames}")
         if general.apply_pbc is None:
             raise ValueError(f"Invalid apply pbc: {general.apply_pbc}")
+        if general.scan_workers is not None and general.scan_workers < 1:
+            raise ValueError(f"Invalid scan workers: {general.scan_workers}")
+        if general.read_buffer_size is not None and general.read_buffer_size < 1:
+            raise ValueError(f"Invalid read buffer size: {general.read_buffer_size}")
+        if general.prefetch_depth is not None and general.prefetch_depth < 0:
+            raise ValueError(f"Invalid prefetch depth: {general.prefetch_depth}")
+        if general.checkpoint_interval is not None and general.checkpoint_interval < 1:
+            raise ValueError(f"Invalid checkpoint interval: {general.checkpoint_interval}")
+        if general.follow_poll_interval is not None and general.follow_poll_interval <= 0:
+            raise ValueError(f"Invalid follow poll interval: {general.follow_poll_interval}")
+        if general.follow_timeout is not None and general.follow_timeout < 0:
+            raise ValueError(f"Invalid follow timeout: {general.follow_timeout}")
+        if general.flush_interval is not None and general.flush_interval < 0:
+            raise ValueError(f"Invalid flush interval: {general.flush_interval}")
 
         self._settings.project_name = general.project_name
         self._settings.export_directory = general.export_directory
         self._settings.file_location = general.file_location
+        self._settings.file_format = general.file_format
         self._settings.range_of_frames = general.range_of_frames
         self._settings.apply_pbc = general.apply_pbc
         if general.verbose is not None:
@@ -616,6 +709,25 @@ class SettingsBuilder:
             self._settings.save_logs = general.save_logs
         if general.save_performance is not None:
             self._settings.save_performance = general.save_performance
+        if general.memory_map is not None:
+            self._settings.memory_map = general.memory_map
+        if general.save_frame_index is not None:
+            self._settings.save_frame_index = general.save_frame_index
+        if general.scan_workers is not None:
+            self._settings.scan_workers = general.scan_workers
+        if general.read_buffer_size is not None:
+            self._settings.read_buffer_size = general.read_buffer_size
+        if general.prefetch_depth is not None:
+            self._settings.prefetch_depth = general.prefetch_depth
+        if general.checkpoint_interval is not None:
+            self._settings.checkpoint_interval = general.checkpoint_interval
+        if general.follow is not None:
+            self._settings.follow = general.follow
+        if general.follow_poll_interval is not None:
+            self._settings.follow_poll_interval = general.follow_poll_interval
+        self._settings.follow_timeout = general.follow_timeout
+        if general.flush_interval is not None:
+            self._settings.flush_interval = general.flush_interval
         return self
 
     def with_analysis(self, analysis: AnalysisSettings):
@@ -658,6 +770,15 @@ class SettingsBuilder:
         if clustering.criterion not in ["bond", "distance"]:
             raise ValueError(f"Invalid criterion: {clustering.criterion}")
 
+        if clustering.neighbor_searcher not in ["kd_tree", "cell_list", "per_species"]:
+            raise ValueError(f"Invalid neighbor searcher: {clustering.neighbor_searcher}")
+
+        if clustering.verlet_skin < 0:
+            raise ValueError(f"Invalid Verlet skin: {clustering.verlet_skin}")
+
+        if clustering.labeling_backend not in ["union_find", "connected_components"]:
+            raise ValueError(f"Invalid labeling backend: {clustering.labeling_backend}")
+
         if clustering.connectivity is None:
             raise ValueError(f"Invalid connectivity: {clustering.connectivity}")
 
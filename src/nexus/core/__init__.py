@@ -7,4 +7,5 @@ nodes, frames, and other molecular dynamics components.
 
 from .node import Node
 from .frame import Frame
+from .neighbor_list import NeighborList
 from .system import System
@@ -1,5 +1,6 @@
-from typing import List, Tuple, Set, Dict
+from typing import List, Tuple, Set, Dict, TYPE_CHECKING
 import numpy as np
+from collections import deque
 from tqdm import tqdm
 import shutil
 
@@ -8,6 +9,9 @@ from .node import Node
 from ..config.settings import Settings
 from ..utils.geometry import calculate_gyration_radius, wrap_position
 
+if TYPE_CHECKING:
+    from .frame import Frame
+
 
 class Cluster:
     """
@@ -150,12 +154,10 @@ class Cluster:
         """
         unwrapped_pos_list = []
         for node in self.nodes:
-            for node_id, position in positions_dict.items():
-                if node.node_id == node_id:
-                    self.symbols.append(node.symbol)
-                    self.indices.append(node.node_id)
-                    unwrapped_pos_list.append(position)
-                    break
+            if node.node_id in positions_dict:
+                self.symbols.append(node.symbol)
+                self.indices.append(node.node_id)
+                unwrapped_pos_list.append(positions_dict[node.node_id])
         self.unwrapped_positions = np.array(unwrapped_pos_list)
 
     def calculate_center_of_mass(self) -> None:
@@ -406,23 +408,51 @@ class Cluster:
         fractional_vector -= np.round(fractional_vector)
         return np.dot(fractional_vector, self.lattice)
 
+    def _relative_vector(self, frame: "Frame", entry: int, source: int, target: int) -> np.ndarray:
+        """
+        Return the minimum-image displacement of a neighbor list entry.
+
+        Uses the displacement vectors stored in the neighbor list when available,
+        and otherwise unwraps the difference of the positions.
+
+        Args:
+            frame (Frame): Frame owning the member nodes.
+            entry (int): Index of the entry in the neighbor list.
+            source (int): Index of the node the entry belongs to.
+            target (int): Index of the neighbor of the entry.
+
+        Returns:
+            np.ndarray: Cartesian displacement from ``source`` to ``target``.
+        """
+        vectors = frame.neighbor_list.vectors
+        if vectors is not None:
+            return vectors[entry]
+        return self._unwrap_vector(frame.positions[target] - frame.positions[source])
+
     def calculate_unwrapped_positions(self) -> None:
         """
         Unwrap node positions across periodic boundaries using BFS traversal.
 
-        Starting from the root node, traverses the cluster graph and reconstructs
-        continuous (unwrapped) positions by applying the minimum-image convention to each
-        neighbor displacement. Tracks unique node-pair linkages during traversal. For the
-        bond criterion, also unwraps decoration nodes (bridging nodes) connected to member
-        nodes.
+        Starting from the root node, traverses the cluster graph through the frame
+        neighbor list and reconstructs continuous (unwrapped) positions by applying
+        the minimum-image convention to each neighbor displacement. Tracks unique
+        node-pair linkages during traversal. For the bond criterion, also unwraps
+        decoration nodes (bridging nodes) connected to member nodes.
 
         """
         # TODO : stores period_vectors on the fly for percolation probability calculation
         if self.size <= 1:
             return
 
-        root_node = self.nodes[0].parent
-        queue = [root_node]
+        root_node = self.nodes[0]
+        frame = root_node.frame
+        positions = frame.positions
+        types = frame.types
+        labels = frame.cluster_labels
+        indptr = frame.neighbor_list.indptr.tolist()
+        indices = frame.neighbor_list.indices
+
+        queue = deque([root_node.node_id])
         visited_positions = {root_node.node_id: root_node.position}
         visited_nodes = {root_node.node_id}
 
@@ -442,76 +472,84 @@ class Cluster:
         # Distance criterion: direct neighbor-to-neighbor traversal
         if self.settings.clustering.criterion == "distance":
             while queue:
-                current_node = queue.pop(0)
-                current_unwrapped = visited_positions[current_node.node_id]
+                current_node = queue.popleft()
+                current_unwrapped = visited_positions[current_node]
 
-                for neighbor in current_node.neighbors:
+                start, end = indptr[current_node], indptr[current_node + 1]
+                for entry, neighbor in enumerate(indices[start:end].tolist(), start):
                     # Only consider neighbors in this cluster
-                    if neighbor.cluster_id != self.root_id:
+                    if labels[neighbor] != self.root_id:
                         continue
 
                     # Calculate unwrapped position of neighbor
-                    relative_vec = self._unwrap_vector(
-                        neighbor.position - current_node.position
+                    relative_vec = self._relative_vector(
+                        frame, entry, current_node, neighbor
                     )
 
                     neighbor_unwrapped = current_unwrapped + relative_vec
 
                     # Store period vector if already visited
-                    if neighbor.node_id in visited_nodes:
-                        period = (
-                            neighbor_unwrapped - visited_positions[neighbor.node_id]
-                        )
+                    if neighbor in visited_nodes:
+                        period = neighbor_unwrapped - visited_positions[neighbor]
 
                         # If period is non-zero -> found a periodic connection
                         if np.linalg.norm(period) > 1e-6:
                             period_vectors.append(period)
                     else:
                         # First time visiting this neighbor
-                        visited_positions[neighbor.node_id] = neighbor_unwrapped
-                        link = tuple(sorted((current_node.node_id, neighbor.node_id)))
+                        visited_positions[neighbor] = neighbor_unwrapped
+                        link = tuple(sorted((current_node, neighbor)))
                         self._linkage_set.add(link)
-                        visited_nodes.add(neighbor.node_id)
+                        visited_nodes.add(neighbor)
                         queue.append(neighbor)
                         pbar.update(1)
-            
+
         # Bond criterion: traverse through bridging nodes (e.g., Si -> O -> Si)
         elif self.settings.clustering.criterion == "bond":
-            bridge_symbol = self.settings.clustering.connectivity[1]
+            bridge_type = frame.get_type_code(self.settings.clustering.connectivity[1])
             while queue:
-                current_node = queue.pop(0)
-                current_unwrapped = visited_positions[current_node.node_id]
-
-                for neighbor in current_node.neighbors:
-                    if neighbor.symbol == bridge_symbol:
-                        for neighbor2 in neighbor.neighbors:
-                            # Only consider neighbors in this cluster
-                            if neighbor2.cluster_id != self.root_id:
-                                continue
+                current_node = queue.popleft()
+                current_unwrapped = visited_positions[current_node]
 
-                            # Calculate unwrapped position of neighbor
+                start, end = indptr[current_node], indptr[current_node + 1]
+                for entry, neighbor in enumerate(indices[start:end].tolist(), start):
+                    if types[neighbor] != bridge_type:
+                        continue
+                    start2, end2 = indptr[neighbor], indptr[neighbor + 1]
+                    for entry2, neighbor2 in enumerate(
+                        indices[start2:end2].tolist(), start2
+                    ):
+                        # Only consider neighbors in this cluster
+                        if labels[neighbor2] != self.root_id:
+                            continue
+
+                        # Calculate unwrapped position of neighbor
+                        if frame.neighbor_list.vectors is not None:
+                            relative_vec = (
+                                frame.neighbor_list.vectors[entry]
+                                + frame.neighbor_list.vectors[entry2]
+                            )
+                        else:
                             relative_vec = self._unwrap_vector(
-                                neighbor2.position - current_node.position
+                                positions[neighbor2] - positions[current_node]
                             )
-                            neighbor_unwrapped = current_unwrapped + relative_vec
-
-                            if neighbor2.node_id in visited_nodes:
-                                # Already visited - check for period vector
-                                period = (
-                                    neighbor_unwrapped - visited_positions[neighbor2.node_id]
-                                )
-
-                                # If period is non-zero -> found a periodic connection
-                                if np.linalg.norm(period) > 1e-6:
-                                    period_vectors.append(period)
-                            else:
-                                # First time visiting this neighbor
-                                visited_positions[neighbor2.node_id] = neighbor_unwrapped
-                                link = tuple(sorted((current_node.node_id, neighbor2.node_id)))
-                                self._linkage_set.add(link)
-                                visited_nodes.add(neighbor2.node_id)
-                                queue.append(neighbor2)
-                                pbar.update(1)
+                        neighbor_unwrapped = current_unwrapped + relative_vec
+
+                        if neighbor2 in visited_nodes:
+                            # Already visited - check for period vector
+                            period = neighbor_unwrapped - visited_positions[neighbor2]
+
+                            # If period is non-zero -> found a periodic connection
+                            if np.linalg.norm(period) > 1e-6:
+                                period_vectors.append(period)
+                        else:
+                            # First time visiting this neighbor
+                            visited_positions[neighbor2] = neighbor_unwrapped
+                            link = tuple(sorted((current_node, neighbor2)))
+                            self._linkage_set.add(link)
+                            visited_nodes.add(neighbor2)
+                            queue.append(neighbor2)
+                            pbar.update(1)
 
         pbar.close()
         self.set_indices_and_positions(visited_positions)
@@ -523,28 +561,23 @@ class Cluster:
             self.settings.clustering.criterion == "bond"
             and self.settings.clustering.with_printed_unwrapped_clusters
         ):
-            bridge_symbol = self.settings.clustering.connectivity[1]
-            # Create a map of node ID to original Node object for quick lookup
-            cluster_nodes_map = {node.node_id: node for node in self.nodes}
+            bridge_type = frame.get_type_code(self.settings.clustering.connectivity[1])
 
             for node_id, unwrapped_pos in visited_positions.items():
-                original_node = cluster_nodes_map.get(node_id)
-                if not original_node:
-                    continue
-
-                for neighbor in original_node.neighbors:
+                start, end = indptr[node_id], indptr[node_id + 1]
+                for entry, neighbor in enumerate(indices[start:end].tolist(), start):
                     if (
-                        neighbor.symbol == bridge_symbol
-                        and neighbor.node_id not in self.decoration_atoms
+                        types[neighbor] == bridge_type
+                        and neighbor not in self.decoration_atoms
                     ):
-                        relative_pos = self._unwrap_vector(
-                            neighbor.position - original_node.position
+                        relative_pos = self._relative_vector(
+                            frame, entry, node_id, neighbor
                         )
                         unwrapped_bridge_pos = unwrapped_pos + relative_pos
-                        self.decoration_atoms[neighbor.node_id] = {
-                            "symbol": neighbor.symbol,
+                        self.decoration_atoms[neighbor] = {
+                            "symbol": frame.type_symbols[types[neighbor]],
                             "position": unwrapped_bridge_pos,
-                            "coordination": neighbor.coordination,
+                            "coordination": int(frame.coordination[neighbor]),
                         }
 
     def __str__(self) -> str:
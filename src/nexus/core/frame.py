@@ -1,8 +1,9 @@
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 
 from .node import Node
+from .neighbor_list import NeighborList
 from ..utils.geometry import wrap_positions
 from ..core.cluster import Cluster
 from ..config.settings import Settings
@@ -17,18 +18,35 @@ class Frame:
     produced by a clustering strategy. It is created by a reader, populated during
     the analysis pipeline, and consumed by analyzers.
 
+    Node data are stored as structure-of-arrays built by ``initialize_nodes()``:
+    one row of ``positions``, ``types``, ``masses``, ``coordination`` and
+    ``cluster_labels`` per node. ``Node`` objects are optional views of these
+    arrays, only created when ``get_nodes()`` is called.
+
     Attributes:
         frame_id (int): Sequential identifier of this frame in the trajectory.
-        nodes (List[Node]): Nodes present in this frame after species filtering.
+        nodes (List[Node]): Node views of this frame, built by ``get_nodes()``.
         lattice (np.ndarray): 3x3 lattice matrix defining the simulation cell.
-        _data (Dict[str, np.ndarray]): Internal storage for raw node data (symbols and
-            positions) as parsed by the reader.
+        _data (Dict[str, np.ndarray]): Internal storage for raw node data as parsed by
+            the reader: a ``"symbol"`` array of shape (N,) and a contiguous float64
+            ``"position"`` array of shape (N, 3).
         _settings (Settings): Configuration settings used for node initialization and
             analysis.
         clusters (Optional[List[Cluster]]): Clusters identified in this frame, or None
             if clustering has not been performed yet.
         connectivities (Optional[List[str]]): List of connectivity labels found in this
             frame, or None if not yet determined.
+        positions (np.ndarray): Cartesian positions of the nodes, shape (N, 3).
+        types (np.ndarray): Integer type code of each node, shape (N,), indexing
+            ``type_symbols``.
+        type_symbols (List[str]): Symbol of each type code, in the order of the
+            configured ``node_types``.
+        masses (np.ndarray): Mass of each node in reduced units, shape (N,).
+        coordination (np.ndarray): Coordination number of each node, shape (N,).
+        cluster_labels (np.ndarray): Cluster identifier of each node, shape (N,),
+            defaulting to the node index.
+        neighbor_list (Optional[NeighborList]): CSR neighbor list built by the
+            neighbor searcher, or None if neighbors have not been searched yet.
     """
 
     frame_id: int
@@ -38,6 +56,17 @@ class Frame:
     _settings: Settings
     clusters: Optional[List[Cluster]] = None
     connectivities: Optional[List[str]] = None
+    positions: np.ndarray = field(default_factory=lambda: np.empty((0, 3)))
+    types: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    type_symbols: List[str] = field(default_factory=list)
+    masses: np.ndarray = field(default_factory=lambda: np.empty(0))
+    coordination: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int64)
+    )
+    cluster_labels: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int64)
+    )
+    neighbor_list: Optional[NeighborList] = None
 
     def __post_init__(self):
         """Validate field types after dataclass initialization."""
@@ -48,24 +77,46 @@ class Frame:
 
     def initialize_nodes(self) -> None:
         """
-        Build the node list from raw data, keeping only selected species.
+        Build the node arrays from raw data, keeping only selected species.
 
-        Reads symbols and positions from the internal ``_data`` dictionary and creates
-        a ``Node`` for each entry whose symbol appears in the configured ``node_types``.
-        Nodes are assigned sequential IDs starting from zero.
+        Reads symbols and positions from the internal ``_data`` dictionary and keeps
+        the entries whose symbol appears in the configured ``node_types``. The
+        built-in readers already drop other species while parsing; the selection
+        is kept for frames built from unfiltered data. Symbols are encoded as type
+        codes in the order of ``node_types``, masses are taken from ``node_masses``
+        (1.0 when not set), and node IDs are the row indices starting from zero.
+        No ``Node`` object is created.
         """
-        id = 0
-        symbols = self._data["symbol"]
-        positions = self._data["position"]
+        symbols = np.asarray(self._data["symbol"])
+        positions = np.asarray(self._data["position"], dtype=np.float64)
 
         if len(symbols) != len(positions):
             raise ValueError("symbols and positions must have the same length")
 
-        for symbol, position in zip(symbols, positions):
-            if symbol not in self._settings.clustering.node_types:
-                continue
-            self.nodes.append(Node(node_id=id, symbol=symbol, position=position))
-            id += 1
+        node_types = list(self._settings.clustering.node_types)
+        selected = np.isin(symbols, node_types)
+        if not selected.all():
+            symbols = symbols[selected]
+            positions = positions[selected]
+
+        types = np.zeros(len(symbols), dtype=np.int64)
+        for code, node_type in enumerate(node_types):
+            types[symbols == node_type] = code
+
+        node_masses = self._settings.clustering.node_masses
+        if node_masses and len(node_masses) == len(node_types):
+            masses = np.asarray(node_masses, dtype=np.float64)[types]
+        else:
+            masses = np.ones(len(symbols))
+
+        self.positions = np.ascontiguousarray(positions.reshape(-1, 3))
+        self.types = types
+        self.type_symbols = node_types
+        self.masses = masses
+        self.coordination = np.zeros(len(symbols), dtype=np.int64)
+        self.cluster_labels = np.arange(len(symbols), dtype=np.int64)
+        self.neighbor_list = None
+        self.nodes = []
 
     def set_lattice(self, lattice: np.ndarray) -> None:
         """
@@ -103,7 +154,31 @@ class Frame:
         Returns:
             List[str]: Sorted list of unique element symbols.
         """
-        return np.unique([node.symbol for node in self.nodes])
+        return np.unique(self.get_symbols())
+
+    def get_symbols(self) -> np.ndarray:
+        """
+        Return the chemical symbol of every node, decoded from the type codes.
+
+        Returns:
+            np.ndarray: Symbol array of shape (N,).
+        """
+        return np.asarray(self.type_symbols, dtype=str)[self.types]
+
+    def get_type_code(self, symbol: str) -> int:
+        """
+        Return the type code of a chemical symbol.
+
+        Args:
+            symbol (str): Chemical symbol to encode.
+
+        Returns:
+            int: Index of the symbol in ``type_symbols``, or -1 if the symbol is not
+                a node type of this frame.
+        """
+        if symbol in self.type_symbols:
+            return self.type_symbols.index(symbol)
+        return -1
 
     def get_node_by_id(self, node_id: int) -> Optional[Node]:
         """
@@ -115,9 +190,8 @@ class Frame:
         Returns:
             Optional[Node]: The matching node, or None if no node has the given ID.
         """
-        for node in self.nodes:
-            if node.node_id == node_id:
-                return node
+        if 0 <= node_id < len(self):
+            return self.get_nodes()[node_id]
         return None
 
     def get_positions(self) -> np.ndarray:
@@ -127,7 +201,7 @@ class Frame:
         Returns:
             np.ndarray: Position array of shape (N, 3).
         """
-        return np.array([node.position for node in self.nodes])
+        return self.positions
 
     def get_positions_by_element(self) -> Dict[str, np.ndarray]:
         """
@@ -137,10 +211,9 @@ class Frame:
             Dict[str, np.ndarray]: Mapping of element symbols to position arrays.
         """
         return {
-            node.symbol: np.array(
-                [node.position for node in self.nodes if node.symbol == node.symbol]
-            )
-            for node in self.nodes
+            symbol: self.positions[self.types == code]
+            for code, symbol in enumerate(self.type_symbols)
+            if np.any(self.types == code)
         }
 
     def get_wrapped_positions(self) -> np.ndarray:
@@ -160,13 +233,8 @@ class Frame:
             Dict[str, np.ndarray]: Mapping of element symbols to wrapped position arrays.
         """
         return {
-            node.symbol: wrap_positions(
-                np.array(
-                    [node.position for node in self.nodes if node.symbol == node.symbol]
-                ),
-                self.lattice,
-            )
-            for node in self.nodes
+            symbol: wrap_positions(positions, self.lattice)
+            for symbol, positions in self.get_positions_by_element().items()
         }
 
     def get_clusters(self) -> List[Cluster]:
@@ -180,11 +248,13 @@ class Frame:
 
     def get_nodes(self) -> List[Node]:
         """
-        Return the list of nodes in this frame.
+        Return the node views of this frame, creating them on first use.
 
         Returns:
             List[Node]: Nodes belonging to this frame.
         """
+        if len(self.nodes) != len(self):
+            self.nodes = [Node(self, i) for i in range(len(self))]
         return self.nodes
 
     def get_networking_nodes(self) -> int:
@@ -253,13 +323,11 @@ class Frame:
             for cluster in self.clusters:
                 if cluster.get_connectivity() == connectivity:
                     connectivity_settings = self._settings.clustering.connectivity
-                    networking_nodes = len(
-                        [
-                            node
-                            for node in self.nodes
-                            if node.symbol
-                            in [connectivity_settings[0], connectivity_settings[-1]]
-                        ]
+                    networking_nodes = np.count_nonzero(
+                        np.isin(
+                            self.get_symbols(),
+                            [connectivity_settings[0], connectivity_settings[-1]],
+                        )
                     )
                     concentrations[connectivity] = (
                         cluster.total_nodes / networking_nodes
@@ -274,15 +342,15 @@ class Frame:
 
     def __len__(self) -> int:
         """Return the number of nodes in this frame."""
-        return len(self.nodes)
+        return len(self.positions)
 
     def __str__(self) -> str:
         """Return a human-readable summary of the frame."""
-        return f"Frame {self.frame_id} (num_nodes={len(self.nodes)}, num_clusters={len(self.clusters)})"
+        return f"Frame {self.frame_id} (num_nodes={len(self)}, num_clusters={len(self.clusters)})"
 
     def __repr__(self) -> str:
         """Return a detailed string representation of the frame."""
-        return f"Frame {self.frame_id} (num_nodes={len(self.nodes)})\n(first node: {(self.nodes[0].symbol, self.nodes[0].position) if len(self.nodes) > 0 else ''}\n(lattice=\n{self.lattice})\n"
+        return f"Frame {self.frame_id} (num_nodes={len(self)})\n(first node: {(self.type_symbols[self.types[0]], self.positions[0]) if len(self) > 0 else ''}\n(lattice=\n{self.lattice})\n"
 
     def __del__(self) -> None:
         """Release references to internal data structures."""
@@ -291,3 +359,9 @@ class Frame:
         del self.lattice
         del self._data
         del self.connectivities
+        del self.positions
+        del self.types
+        del self.masses
+        del self.coordination
+        del self.cluster_labels
+        del self.neighbor_list
@@ -0,0 +1,170 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(slots=True)
+class NeighborList:
+    """
+    Compressed-sparse-row (CSR) neighbor list of a frame.
+
+    The neighbors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``, with the
+    matching entries of ``distances`` (and ``vectors`` when stored). Every pair is
+    stored in both directions, from a single distance computation. The list is
+    built by ``NeighborSearcher`` and shared by all clustering strategies, which
+    work on whole entry arrays instead of walking per-node lists, and keep only
+    the half with ``i < j`` when their criterion is symmetric.
+
+    Attributes:
+        indptr (np.ndarray): Offsets of the neighbors of each node in ``indices``,
+            shape (N + 1,).
+        indices (np.ndarray): Node index of each neighbor entry, shape (M,).
+        distances (np.ndarray): Distance of each neighbor entry, shape (M,).
+        vectors (Optional[np.ndarray]): Minimum-image displacement from the node to
+            each neighbor, shape (M, 3), or None if not stored.
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    distances: np.ndarray
+    vectors: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_pairs(
+        cls,
+        num_nodes: int,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        distances: np.ndarray,
+        vectors: Optional[np.ndarray] = None,
+    ) -> "NeighborList":
+        """
+        Build a neighbor list from entries sorted by source node.
+
+        Args:
+            num_nodes (int): Number of nodes in the frame.
+            rows (np.ndarray): Source node of each entry, in non-decreasing order.
+            cols (np.ndarray): Neighbor node of each entry.
+            distances (np.ndarray): Distance of each entry.
+            vectors (Optional[np.ndarray]): Displacement vector of each entry.
+
+        Returns:
+            NeighborList: The CSR neighbor list.
+        """
+        counts = np.bincount(np.asarray(rows, dtype=np.int64), minlength=num_nodes)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(
+            indptr=indptr,
+            indices=np.asarray(cols, dtype=np.int64),
+            distances=np.asarray(distances, dtype=np.float64),
+            vectors=None if vectors is None else np.asarray(vectors, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_half_pairs(
+        cls,
+        num_nodes: int,
+        first: np.ndarray,
+        second: np.ndarray,
+        distances: np.ndarray,
+        vectors: Optional[np.ndarray] = None,
+    ) -> "NeighborList":
+        """
+        Build a neighbor list from unordered pairs, each given once.
+
+        Every pair is mirrored into the neighbors of both endpoints, with the
+        displacement vector reversed, and the neighbors of each node are sorted by
+        index.
+
+        Args:
+            num_nodes (int): Number of nodes in the frame.
+            first (np.ndarray): First node of each pair.
+            second (np.ndarray): Second node of each pair.
+            distances (np.ndarray): Distance of each pair.
+            vectors (Optional[np.ndarray]): Displacement from the first to the second
+                node of each pair.
+
+        Returns:
+            NeighborList: The CSR neighbor list.
+        """
+        rows = np.concatenate((first, second)).astype(np.int64, copy=False)
+        cols = np.concatenate((second, first)).astype(np.int64, copy=False)
+        order = np.lexsort((cols, rows))
+        distances = np.concatenate((distances, distances))[order]
+        if vectors is not None:
+            vectors = np.concatenate((vectors, -vectors))[order]
+        return cls.from_pairs(num_nodes, rows[order], cols[order], distances, vectors)
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes covered by the list."""
+        return len(self.indptr) - 1
+
+    def degrees(self) -> np.ndarray:
+        """
+        Return the number of neighbors of every node.
+
+        Returns:
+            np.ndarray: Neighbor counts, shape (N,).
+        """
+        return np.diff(self.indptr)
+
+    def rows(self) -> np.ndarray:
+        """
+        Return the source node of every entry.
+
+        Returns:
+            np.ndarray: Source node indices, shape (M,), aligned with ``indices``.
+        """
+        return np.repeat(np.arange(self.num_nodes, dtype=np.int64), self.degrees())
+
+    def get_neighbors(self, node_id: int) -> np.ndarray:
+        """
+        Return the neighbor indices of a node.
+
+        Args:
+            node_id (int): Index of the node.
+
+        Returns:
+            np.ndarray: Indices of the neighbors of the node.
+        """
+        return self.indices[self.indptr[node_id] : self.indptr[node_id + 1]]
+
+    def get_distances(self, node_id: int) -> np.ndarray:
+        """
+        Return the distances from a node to its neighbors.
+
+        Args:
+            node_id (int): Index of the node.
+
+        Returns:
+            np.ndarray: Distances aligned with ``get_neighbors(node_id)``.
+        """
+        return self.distances[self.indptr[node_id] : self.indptr[node_id + 1]]
+
+    def expand(self, rows: np.ndarray, cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Follow one more hop from a set of entries.
+
+        For every entry ``(i, k)``, yields one entry ``(i, j)`` per neighbor ``j`` of
+        ``k``, keeping the order of the input entries and of the neighbors of each
+        ``k``. This is how strategies reach nodes connected through a bridging node.
+
+        Args:
+            rows (np.ndarray): Source node of each entry.
+            cols (np.ndarray): Intermediate node of each entry.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Source and second-neighbor node of each
+                two-hop path.
+        """
+        counts = self.indptr[cols + 1] - self.indptr[cols]
+        total = int(counts.sum())
+        starts = np.repeat(self.indptr[cols] - (np.cumsum(counts) - counts), counts)
+        second = self.indices[starts + np.arange(total, dtype=np.int64)]
+        return np.repeat(rows, counts), second
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return len(self.indices)
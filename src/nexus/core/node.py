@@ -1,85 +1,124 @@
 import numpy as np
-from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import List, TYPE_CHECKING
 
 from ..utils.geometry import wrap_position
 
-@dataclass(slots=True, order=True)
+if TYPE_CHECKING:
+    from .frame import Frame
+
+
 class Node:
     """
-    Dataclass representing a node in the simulation frame.
+    Lightweight view of a single node of a frame.
 
-    A Node is the fundamental unit of the cluster analysis pipeline. It stores
-    properties (symbol, position, mass) and participates in the union-find
-    algorithm through its parent field. Nodes self-parent by default, meaning each
-    node starts as the root of its own cluster.
+    Node data live in the arrays of the owning ``Frame`` (positions, type codes,
+    masses, coordination numbers and cluster labels). A Node only holds the frame,
+    its index and its union-find parent, so views are created on demand, by
+    ``Frame.get_nodes()``, by the clustering strategies for the members of each
+    cluster, or by ``neighbors`` for the neighbors of a node, and reading or
+    writing a property reads or writes the frame arrays. Neighbors are read from
+    the frame ``neighbor_list``. Nodes self-parent by default, meaning each node
+    starts as the root of its own cluster in the union-find algorithm.
 
     Attributes:
+        frame (Frame): Frame owning the node data.
+        node_id (int): Index of the node in the frame arrays.
         symbol (str): Chemical symbol of the atom (e.g., "Si", "O").
-        node_id (int): Unique identifier for the node.
-        position (np.ndarray): 3D Cartesian coordinates of the atom.
-        parent (Optional[Node]): Parent node in the union-find structure. Defaults to self,
+        position (np.ndarray): 3D Cartesian coordinates of the atom, a view of the
+            frame ``positions`` row.
+        parent (Node): Parent node in the union-find structure. Defaults to self,
             making each node its own root until merged via union().
-        neighbors (List[Node]): List of neighboring nodes found by the neighbor searcher.
-        cluster_id (Optional[int]): Identifier of the cluster this node belongs to.
-            Defaults to node_id until assigned during clustering.
-        distances (Optional[List[float]]): Distances to each neighbor, populated by the
-            neighbor searcher.
-        indices (Optional[List[int]]): Global indices of each neighbor in the frame's node list.
-        mass (Optional[float]): Atomic, particle, or node mass in reduced units. Defaults to 1.0.
-        coordination (Optional[int]): Coordination number (count of nearest neighbors).
-            Defaults to 0.
-        other (Optional[List[str]]): Additional per-atom attributes parsed from the trajectory file.
+        neighbors (List[Node]): Neighboring nodes found by the neighbor searcher, read
+            from the frame ``neighbor_list``.
+        cluster_id (int): Identifier of the cluster this node belongs to, stored in
+            the frame ``cluster_labels``. Defaults to node_id until assigned during
+            clustering.
+        distances (np.ndarray): Distances to each neighbor.
+        indices (np.ndarray): Global indices of each neighbor in the frame's node list.
+        mass (float): Atomic, particle, or node mass in reduced units, stored in the
+            frame ``masses``.
+        coordination (int): Coordination number (count of nearest neighbors), stored in
+            the frame ``coordination``. Defaults to 0.
+        other (List[str]): Additional per-atom attributes parsed from the trajectory file.
     """
-    symbol: str
-    node_id: int
-    position: np.ndarray = field(compare=False, repr=False)
-    parent: Optional['Node'] = field(default=None, compare=False, repr=False)
-    neighbors: List['Node'] = field(default_factory=list, compare=False, repr=False)
-    cluster_id: Optional[int] = field(default=None, compare=False, repr=False)
-    distances: Optional[List[float]] = field(default=None, compare=False, repr=False)
-    indices: Optional[List[int]] = field(default=None, compare=False, repr=False)
-    mass: Optional[float] = field(default=None, compare=True, repr=True)
-    coordination: Optional[int] = field(default=None, compare=True, repr=True)
-    other: Optional[List[str]] = field(default=None, compare=False, repr=False)
-
-    _next_id = 0
-
-    def __post_init__(self):
-        """
-        Initialize default values after dataclass creation.
-
-        Sets sensible defaults for optional fields that were not provided at construction
-        time. Uses object.__setattr__ because the dataclass is configured with slots=True.
-        The parent defaults to self to establish each node as its own union-find root.
-        """
-
-        if self.position is None:
-            object.__setattr__(self, 'position', np.zeros(3))
 
-        # Auto-increment node_id if not explicitly provided
-        if self.node_id is None:
-            object.__setattr__(self, 'node_id', Node._next_id)
-            Node._next_id += 1
+    __slots__ = (
+        "frame",
+        "node_id",
+        "symbol",
+        "parent",
+        "other",
+    )
 
-        if self.mass is None:
-            object.__setattr__(self, 'mass', 1.0)
-
-        if self.coordination is None:
-            object.__setattr__(self, 'coordination', 0)
-
-        if self.other is None:
-            object.__setattr__(self, 'other', [])
-
-        if self.neighbors is None:
-            object.__setattr__(self, 'neighbors', [])
+    def __init__(self, frame: "Frame", node_id: int) -> None:
+        """
+        Create a view of the node at index *node_id* of *frame*.
 
+        Args:
+            frame (Frame): Frame whose arrays hold the node data.
+            node_id (int): Index of the node in the frame arrays.
+        """
+        self.frame: "Frame" = frame
+        self.node_id: int = node_id
+        self.symbol: str = frame.type_symbols[frame.types[node_id]]
         # Self-parenting makes each node the root of its own cluster initially
-        if self.parent is None:
-            object.__setattr__(self, 'parent', self)
-
-        if self.cluster_id is None:
-            object.__setattr__(self, 'cluster_id', self.node_id)
+        self.parent: "Node" = self
+        self.other: List[str] = []
+
+    @property
+    def position(self) -> np.ndarray:
+        """Cartesian coordinates, a view of the node row of the frame ``positions``."""
+        return self.frame.positions[self.node_id]
+
+    @position.setter
+    def position(self, position: np.ndarray) -> None:
+        self.frame.positions[self.node_id] = position
+
+    @property
+    def mass(self) -> float:
+        """Mass of the node, read from the frame ``masses``."""
+        return float(self.frame.masses[self.node_id])
+
+    @mass.setter
+    def mass(self, mass: float) -> None:
+        self.frame.masses[self.node_id] = mass
+
+    @property
+    def coordination(self) -> int:
+        """Coordination number, read from the frame ``coordination``."""
+        return int(self.frame.coordination[self.node_id])
+
+    @coordination.setter
+    def coordination(self, coordination: int) -> None:
+        self.frame.coordination[self.node_id] = coordination
+
+    @property
+    def cluster_id(self) -> int:
+        """Cluster identifier, read from the frame ``cluster_labels``."""
+        return int(self.frame.cluster_labels[self.node_id])
+
+    @cluster_id.setter
+    def cluster_id(self, cluster_id: int) -> None:
+        self.frame.cluster_labels[self.node_id] = cluster_id
+
+    @property
+    def neighbors(self) -> List["Node"]:
+        """Views of the neighboring nodes, empty before the neighbor search."""
+        return [Node(self.frame, j) for j in self.indices.tolist()]
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Indices of the neighboring nodes, read from the frame ``neighbor_list``."""
+        if self.frame.neighbor_list is None:
+            return np.empty(0, dtype=np.int64)
+        return self.frame.neighbor_list.get_neighbors(self.node_id)
+
+    @property
+    def distances(self) -> np.ndarray:
+        """Distances to the neighboring nodes, read from the frame ``neighbor_list``."""
+        if self.frame.neighbor_list is None:
+            return np.empty(0)
+        return self.frame.neighbor_list.get_distances(self.node_id)
 
     @staticmethod
     def wrap_position(position: np.ndarray, lattice: np.ndarray) -> np.ndarray:
@@ -97,15 +136,6 @@ class Node:
         """
         return wrap_position(position, lattice)
 
-    def add_neighbor(self, node: 'Node') -> None:
-        """
-        Append a node to this node's neighbor list.
-
-        Args:
-            node (Node): The neighboring node to add.
-        """
-        self.neighbors.append(node)
-
     def reset_parent(self) -> None:
         """
         Reset this node's parent to itself.
@@ -124,6 +154,20 @@ class Node:
         """
         self.coordination = coordination
 
+    def __eq__(self, other: object) -> bool:
+        """Return True if both views refer to the same node of the same frame."""
+        if not isinstance(other, Node):
+            return NotImplemented
+        return self.frame is other.frame and self.node_id == other.node_id
+
+    def __lt__(self, other: 'Node') -> bool:
+        """Order nodes by symbol, then by node ID."""
+        return (self.symbol, self.node_id) < (other.symbol, other.node_id)
+
+    def __hash__(self) -> int:
+        """Hash the node by frame identity and node ID."""
+        return hash((id(self.frame), self.node_id))
+
     def __str__(self) -> str:
         """Return a human-readable summary of the node."""
         return f"Node {self.node_id} ({self.symbol}) | Z = {self.coordination} | neighbors: {len(self.neighbors)} | position: {self.position}"
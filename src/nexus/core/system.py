@@ -1,10 +1,16 @@
 import numpy as np
-from typing import List, Optional, Generator
+import threading
+import time
+from queue import Empty, Full, Queue
+from typing import Callable, Iterable, List, Optional, Generator
 
 from ..io.reader.base_reader import BaseReader
 from .frame import Frame
 from ..config.settings import Settings  # Import the Settings class
 
+# Seconds to wait for the prefetch thread once the consumer stopped
+_PREFETCH_JOIN_TIMEOUT = 1.0
+
 
 class System:
     """
@@ -27,12 +33,17 @@ class System:
         Initialize the system with a reader and settings, then scan the trajectory file.
 
         Assigns the file location from settings to the reader and triggers the reader's
-        ``scan()`` method to index frame byte offsets.
+        ``scan()`` method to index frame byte offsets. Streams (standard input and
+        named pipes) cannot be indexed and are left to ``iter_frames()``.
 
         Args:
             reader (BaseReader): The file reader instance to use for parsing frames.
             settings (Settings): Configuration settings containing file location and
                 frame range.
+
+        Raises:
+            ValueError: If ``follow`` is enabled for a trajectory whose appended
+                frames cannot be indexed (see ``BaseReader.can_update``).
         """
         self.reader: BaseReader = reader
         self.settings: Settings = settings
@@ -43,8 +54,16 @@ class System:
         # Set the filename in the reader
         self.reader.filename = self.settings.file_location
         
+        # Following a file needs a reader able to index appended frames
+        if settings.follow and not self.reader.is_stream and not self.reader.can_update:
+            if self.reader.compression is not None:
+                reason = "compressed trajectories cannot be indexed incrementally"
+            else:
+                reason = f"{self.reader.__class__.__name__} cannot index appended frames"
+            raise ValueError(f"{self.settings.file_location} cannot be followed: {reason}")
+
         # Scan the file to initialize the reader
-        if hasattr(self.reader, 'scan'):
+        if hasattr(self.reader, 'scan') and not self.reader.is_stream:
             self.reader.scan()
 
     def load_frame(self, frame_index: int) -> bool:
@@ -62,10 +81,16 @@ class System:
 
         Raises:
             ValueError: If ``frame_index`` is negative.
+            IOError: If the trajectory is a stream, whose frames can only be read in
+                order with ``iter_frames()``.
         """
 
         if frame_index < 0:
             raise ValueError("Frame index cannot be negative.")
+        if self.reader.is_stream:
+            raise IOError(
+                f"Frames of the stream {self.reader.filename} can only be read in order"
+            )
 
         # Check the range from settings.
         start_frame, end_frame = self.settings.range_of_frames  # Unpack the tuple
@@ -110,10 +135,15 @@ class System:
 
         Uses the reader's ``num_frames`` attribute if available, otherwise counts frames
         by iterating through the trajectory. The result is cached for subsequent calls.
+        For a stream, whose length is only known once consumed, the number of frames
+        read so far is returned.
 
         Returns:
             int: Total number of frames, or 0 if an error occurs.
         """
+        if self.reader.is_stream:
+            return self.reader.num_frames
+
         # First, check if we already calculated the number of frames
         if self._num_frames is not None:
             return self._num_frames
@@ -135,24 +165,32 @@ class System:
         Yield frames one at a time over the configured range.
 
         Generator-based iteration that avoids loading the entire trajectory into memory.
-        Uses the reader's indexed frame offsets when available, falling back to sequential
-        ``load_frame()`` calls otherwise. Respects the frame range defined in settings.
+        Uses the reader's indexed frame offsets when available, reading the frames in
+        order through a single open file handle (see ``BaseReader.sequential()``),
+        falling back to sequential ``load_frame()`` calls otherwise. Streams are read
+        in a single forward pass with ``BaseReader.iter_stream()``. Respects the frame
+        range defined in settings.
 
         Yields:
             Frame: The next frame in the trajectory.
         """
         start_frame, end_frame = self.settings.range_of_frames
+
+        if self.reader.is_stream:
+            yield from self.reader.iter_stream(start_frame, end_frame)
+            return
         
         # If the reader has frame_indices, use them to iterate through frames
         if hasattr(self.reader, 'frame_indices') and self.reader.frame_indices:
-            for frame_id in range(start_frame, min(end_frame + 1 if end_frame != -1 else float('inf'), len(self.reader.frame_indices))):
-                try:
-                    frame_generator = self.reader.parse(frame_id)
-                    frame = next(frame_generator)
-                    yield frame
-                except (StopIteration, IndexError, ValueError) as e:
-                    print(f"Error loading frame {frame_id}: {str(e)}")
-                    continue
+            with self.reader.sequential():
+                for frame_id in range(start_frame, min(end_frame + 1 if end_frame != -1 else float('inf'), len(self.reader.frame_indices))):
+                    try:
+                        frame_generator = self.reader.parse(frame_id)
+                        frame = next(frame_generator)
+                        yield frame
+                    except (StopIteration, IndexError, ValueError) as e:
+                        print(f"Error loading frame {frame_id}: {str(e)}")
+                        continue
         else:
             # Fallback to loading frames one by one
             for frame_id in range(start_frame, end_frame + 1 if end_frame != -1 else float('inf')):
@@ -162,6 +200,161 @@ class System:
                     break  # Stop if we can't load a frame
 
 
+    def follow_frames(
+        self,
+        poll_interval: float = 1.0,
+        timeout: Optional[float] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> Generator[Frame, None, None]:
+        """
+        Yield frames over the configured range, waiting for frames appended to the file.
+
+        Works like ``iter_frames()`` on a trajectory that is still being written.
+        Once the indexed frames are exhausted, the reader indexes the complete frames
+        appended since (see ``BaseReader.update()``) and iteration goes on with them.
+        When none is available, the file is checked again every ``poll_interval``
+        seconds. Iteration stops at the end of the frame range, after ``timeout``
+        seconds without new frames, or as soon as ``stop`` is set while waiting.
+        Streams already wait for their writer, so they are read with
+        ``iter_frames()`` and ``timeout`` does not apply.
+
+        Args:
+            poll_interval (float): Seconds to wait between checks for new frames.
+            timeout (Optional[float]): Seconds without new frames after which the
+                iteration stops. None waits indefinitely.
+            stop (Optional[threading.Event]): Event ending the iteration when set,
+                e.g. by ``prefetch_frames()`` once its consumer went away.
+
+        Yields:
+            Frame: The next frame in the trajectory.
+        """
+        if self.reader.is_stream:
+            yield from self.iter_frames()
+            return
+
+        start_frame, end_frame = self.settings.range_of_frames
+        last_frame = end_frame if end_frame != -1 else float('inf')
+        frame_id = start_frame
+        last_growth = time.monotonic()
+
+        while frame_id <= last_frame:
+            if frame_id < self.reader.num_frames:
+                with self.reader.sequential():
+                    while frame_id < min(last_frame + 1, self.reader.num_frames):
+                        try:
+                            frame_generator = self.reader.parse(frame_id)
+                            frame = next(frame_generator)
+                            yield frame
+                        except (StopIteration, IndexError, ValueError) as e:
+                            print(f"Error loading frame {frame_id}: {str(e)}")
+                        frame_id += 1
+                last_growth = time.monotonic()
+                continue
+
+            if self.reader.update() > 0:
+                self._num_frames = None
+                continue
+            if timeout is not None and time.monotonic() - last_growth >= timeout:
+                break
+            if stop is None:
+                time.sleep(poll_interval)
+            elif stop.wait(poll_interval):
+                break
+
+    def prefetch_frames(
+        self,
+        depth: int,
+        prepare: Optional[Callable[[Frame], None]] = None,
+        frames: Optional[Callable[[threading.Event], Iterable[Frame]]] = None,
+    ) -> Generator[Frame, None, None]:
+        """
+        Yield frames from ``iter_frames()`` while the next ones are read in the background.
+
+        A background thread parses up to ``depth`` frames ahead of the consumer and
+        applies ``prepare`` to each of them, so that reading and node initialization
+        overlap with the analysis of the current frame. Frames are yielded in order.
+        Errors raised in the background thread are re-raised in the consumer.
+
+        The frame source is created by ``frames`` from an event that is set when the
+        consumer stops (the generator is closed or an exception such as
+        KeyboardInterrupt is raised), so that a source waiting for new frames, such
+        as ``follow_frames()``, returns. The background thread is then given
+        ``_PREFETCH_JOIN_TIMEOUT`` seconds to finish. A thread still blocked in a
+        read after that (e.g. of an idle stream) is a daemon and is left behind
+        rather than waited for.
+
+        Args:
+            depth (int): Maximum number of prepared frames waiting in the queue. With
+                0, frames are read and prepared in the calling thread.
+            prepare (Optional[Callable[[Frame], None]]): Function applied to each
+                frame before it is yielded.
+            frames (Optional[Callable[[threading.Event], Iterable[Frame]]]): Function
+                returning the frames to read instead of ``iter_frames()`` given the
+                stop event, e.g.
+                ``lambda stop: system.follow_frames(1.0, None, stop=stop)``.
+
+        Yields:
+            Frame: The next prepared frame in the trajectory.
+        """
+        stop = threading.Event()
+        source = self.iter_frames() if frames is None else frames(stop)
+
+        if depth <= 0:
+            for frame in source:
+                if prepare is not None:
+                    prepare(frame)
+                yield frame
+            return
+
+        done = object()  # Sentinel marking the end of the trajectory
+        queue: Queue = Queue(maxsize=depth)
+
+        def put(item) -> bool:
+            # Wait for room in the queue unless the consumer went away
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for frame in source:
+                    if prepare is not None:
+                        prepare(frame)
+                    if not put(frame):
+                        return
+            except BaseException as e:
+                put(e)
+                return
+            finally:
+                # Release the reader from the thread that used it
+                close = getattr(source, "close", None)
+                if close is not None:
+                    close()
+            put(done)
+
+        producer = threading.Thread(target=produce, name="nexus-prefetch", daemon=True)
+        producer.start()
+        try:
+            while True:
+                try:
+                    item = queue.get(timeout=0.1)
+                except Empty:
+                    if not producer.is_alive() and queue.empty():
+                        break
+                    continue
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join(timeout=_PREFETCH_JOIN_TIMEOUT)
+
     def __iter__(self) -> 'System':
         """Reset the frame index and return self as an iterator."""
         self._current_frame_index = self.settings.range_of_frames[0]
@@ -2,17 +2,21 @@
 Readers for molecular dynamics trajectory formats.
 
 Provides a factory-based system for detecting file formats and parsing frames from
-XYZ and LAMMPS trajectory files.
+XYZ, LAMMPS text, LAMMPS binary and Nexus-native trajectory files.
 """
 
 from .base_reader import BaseReader
 from .xyz_reader import XYZReader
 from .lammps_reader import LAMMPSReader
+from .lammps_binary_reader import LAMMPSBinaryReader
+from .nexus_reader import NexusReader
 from .reader_factory import ReaderFactory
 
 __all__ = [
     BaseReader,
     ReaderFactory,
     XYZReader,
-    LAMMPSReader
+    LAMMPSReader,
+    LAMMPSBinaryReader,
+    NexusReader
 ]
\ No newline at end of file
@@ -1,9 +1,172 @@
 from abc import ABC, abstractmethod
-from typing import Generator, List, Optional, TextIO
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from itertools import islice, repeat
+from typing import (
+    BinaryIO,
+    Collection,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+from numba import jit
+import numpy as np
+import json
+import gzip
+import lzma
+import mmap
+import stat
+import zipfile
+import bz2
+import sys
+import io
+import os
 
+from .compressed_file import Checkpoint, CompressedFile, split_compression
 from ...config.settings import Settings
 from ...core.frame import Frame
 
+# Forward-only decompressing openers used for streams, by compression format
+_STREAM_OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "lzma": lzma.open}
+
+FrameIndex = namedtuple(
+    "FrameIndex", ["frame_id", "num_nodes", "lattice", "byte_offset"]
+)
+
+# Version of the on-disk frame index layout written by ``BaseReader.save_index``
+_INDEX_VERSION = 1
+
+# Record layout of one node line as decoded by ``BaseReader.read_node_block``
+_NODE_BLOCK_DTYPE = np.dtype(
+    [("symbol", "U16"), ("x", np.float64), ("y", np.float64), ("z", np.float64)]
+)
+
+
+@jit(nopython=True, cache=True)
+def _skip_lines(buffer: np.ndarray, offset: int, count: int) -> int:
+    """
+    Return the byte offset found after skipping *count* newlines from *offset*.
+
+    Args:
+        buffer (np.ndarray): Byte view of the memory-mapped file (dtype uint8).
+        offset (int): Byte offset to start counting from.
+        count (int): Number of lines to skip.
+
+    Returns:
+        int: Offset of the first byte after the last skipped newline, or the buffer
+            size if the end of the file is reached first.
+    """
+    size = buffer.size
+    while count > 0 and offset < size:
+        if buffer[offset] == 10:
+            count -= 1
+        offset += 1
+    return offset
+
+
+# Size of the slices copied out of the memory map when counting newlines
+_COUNT_BLOCK_SIZE = 1 << 26
+
+
+def _count_lines(mm: mmap.mmap, start: int, end: int) -> int:
+    """
+    Count the newlines found in the byte range [*start*, *end*) of a mapped file.
+
+    The range is copied in bounded slices so that ``bytes.count`` runs at C speed
+    without materializing the whole range in memory.
+
+    Args:
+        mm (mmap.mmap): Memory-mapped trajectory file.
+        start (int): First byte offset of the range.
+        end (int): Byte offset one past the end of the range.
+
+    Returns:
+        int: Number of newline bytes in the range.
+    """
+    count = 0
+    for offset in range(start, end, _COUNT_BLOCK_SIZE):
+        count += mm[offset : min(offset + _COUNT_BLOCK_SIZE, end)].count(b"\n")
+    return count
+
+
+def _find_frames(
+    filename: str,
+    start: int,
+    end: int,
+    marker: bytes,
+    marker_line: int,
+    header_size: int,
+) -> Tuple[List[Tuple[int, int, List[str]]], int]:
+    """
+    Locate the frame headers starting inside one byte range of a trajectory file.
+
+    Runs in a worker process of ``BaseReader.scan_parallel``. Occurrences of *marker*
+    are searched for on the memory-mapped file; a frame starts *marker_line* lines
+    before the line holding the marker. Frames are attributed to the range that
+    contains their first byte, so that neighbouring ranges never report the same
+    frame.
+
+    Args:
+        filename (str): Path to the trajectory file.
+        start (int): First byte offset of the range.
+        end (int): Byte offset one past the end of the range.
+        marker (bytes): Byte string found once in every frame header.
+        marker_line (int): Line of the frame header holding the marker (0-based).
+        header_size (int): Number of header lines to return for each frame.
+
+    Returns:
+        Tuple[List[Tuple[int, int, List[str]]], int]: For each frame, its byte offset,
+            its line number relative to *start* and its decoded header lines; and
+            the number of newlines in the range.
+    """
+    frames = []
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            num_lines = 0
+            counted = start
+            search = start
+            while True:
+                hit = mm.find(marker, search)
+                if hit == -1:
+                    break
+                search = hit + len(marker)
+
+                # Walk back from the marker to the first line of the frame
+                frame_start = mm.rfind(b"\n", 0, hit) + 1
+                for _ in range(marker_line):
+                    if frame_start == 0:
+                        frame_start = -1
+                        break
+                    frame_start = mm.rfind(b"\n", 0, frame_start - 1) + 1
+                if frame_start >= end:
+                    break
+                if frame_start < start:
+                    # Either reported by the previous range or not a valid header
+                    continue
+
+                num_lines += _count_lines(mm, counted, frame_start)
+                counted = frame_start
+
+                header_lines = []
+                offset = frame_start
+                for _ in range(header_size):
+                    line_end = mm.find(b"\n", offset)
+                    if line_end == -1:
+                        line_end = len(mm) - 1
+                    header_lines.append(mm[offset : line_end + 1].decode())
+                    offset = line_end + 1
+                frames.append((frame_start, num_lines, header_lines))
+
+            num_lines += _count_lines(mm, counted, end)
+    return frames, num_lines
+
+
 class BaseReader(ABC):
     """
     Abstract base class for trajectory file readers.
@@ -17,7 +180,12 @@ class BaseReader(ABC):
         num_frames (int): Total number of frames found after scanning.
         frame_offsets (List[int]): Byte offset of each frame in the file.
         frame_sizes (List[int]): Byte size of each frame in the file.
-        mmaped_file (Optional[memoryview]): Memory-mapped file handle, if used.
+        frame_indices (List[FrameIndex]): Frame metadata built by ``scan()``.
+        mmaped_file (Optional[mmap.mmap]): Memory-mapped file handle, if used.
+        stream (Optional[TextIO]): File handle shared by all frames while inside
+            ``sequential()``.
+        checkpoints (List[Checkpoint]): Decompression checkpoints of a compressed
+            trajectory, shared by all its handles.
         is_indexed (bool): True once the file has been scanned and indexed.
     """
 
@@ -35,7 +203,11 @@ class BaseReader(ABC):
         self.num_frames: int = 0
         self.frame_offsets: List[int] = []
         self.frame_sizes: List[int] = []
-        self.mmaped_file: Optional[memoryview] = None
+        self.frame_indices: List[FrameIndex] = []
+        self.mmaped_file: Optional[mmap.mmap] = None
+        self.stream: Optional[TextIO] = None
+        self._stream_offset: Optional[int] = None
+        self.checkpoints: List[Checkpoint] = []
         self.is_indexed: bool = False
 
     def set_verbose(self, verbose: bool) -> None:
@@ -60,6 +232,605 @@ class BaseReader(ABC):
             file_handle.readline()
         return
 
+    @property
+    def compression(self) -> Optional[str]:
+        """
+        Return the compression format of the trajectory file, from its extension.
+
+        Returns:
+            Optional[str]: ``"gzip"``, ``"bz2"``, ``"lzma"``, or None if the file is
+                not compressed.
+        """
+        return split_compression(self.filename)[1]
+
+    def open_text(self, buffering: int = -1) -> TextIO:
+        """
+        Open the trajectory file for reading text, decompressing it if needed.
+
+        Compressed trajectories are read through a ``CompressedFile`` whose offsets
+        are positions in the uncompressed data. Its decompression checkpoints are
+        kept in ``checkpoints``, so that every handle opened later seeks from the
+        nearest checkpoint instead of decompressing from the start.
+
+        Args:
+            buffering (int): Buffer size in bytes, -1 for the default size.
+
+        Returns:
+            TextIO: A text handle positioned at the start of the file.
+        """
+        compression = self.compression
+        if compression is None:
+            return open(self.filename, "r", buffering=buffering)
+        raw = CompressedFile(
+            self.filename,
+            compression,
+            self.checkpoints,
+            self._settings.checkpoint_interval,
+        )
+        buffer_size = buffering if buffering > 0 else io.DEFAULT_BUFFER_SIZE
+        return io.TextIOWrapper(io.BufferedReader(raw, buffer_size=buffer_size))
+
+    @property
+    def is_stream(self) -> bool:
+        """
+        Return whether the trajectory is a non-seekable stream rather than a file.
+
+        Standard input (``file_location`` set to ``"-"``) and named pipes can only
+        be read once from start to end with ``iter_stream()``.
+
+        Returns:
+            bool: True for standard input and named pipes.
+        """
+        if self.filename == "-":
+            return True
+        try:
+            return stat.S_ISFIFO(os.stat(self.filename).st_mode)
+        except OSError:
+            return False
+
+    @property
+    def can_update(self) -> bool:
+        """
+        Return whether frames appended to the file can be indexed with ``update()``.
+
+        Compressed files and readers without an incremental ``_scan_file()`` (e.g.
+        the native format) cannot be followed.
+
+        Returns:
+            bool: True if the reader can index appended frames.
+        """
+        return (
+            self.compression is None
+            and type(self)._scan_file is not BaseReader._scan_file
+        )
+
+    def open_stream(self, binary: bool = False) -> Union[TextIO, BinaryIO]:
+        """
+        Open the trajectory stream for a single forward pass.
+
+        Named pipes with a compression extension are decompressed on the fly, as no
+        seeking is needed to read a stream once.
+
+        Args:
+            binary (bool): Whether to return a binary handle instead of a text one.
+
+        Returns:
+            Union[TextIO, BinaryIO]: A handle to be used as a context manager. Standard
+                input is left open when the context exits.
+        """
+        if self.filename == "-":
+            return nullcontext(sys.stdin.buffer if binary else sys.stdin)
+        compression = self.compression
+        if compression is None:
+            return open(
+                self.filename,
+                "rb" if binary else "r",
+                buffering=self._settings.read_buffer_size,
+            )
+        handle = _STREAM_OPENERS[compression](self.filename, "rb")
+        return handle if binary else io.TextIOWrapper(handle)
+
+    def iter_stream(
+        self, start_frame: int = 0, end_frame: int = -1
+    ) -> Generator[Frame, None, None]:
+        """
+        Yield the frames of a non-seekable stream as they arrive, in a single pass.
+
+        No index is built and ``scan()`` is never called. Frames before
+        ``start_frame`` are skipped without being decoded, and reading stops after
+        ``end_frame``. ``num_frames`` counts the frames read so far.
+
+        Args:
+            start_frame (int): Zero-based index of the first frame to yield.
+            end_frame (int): Index of the last frame to yield, or -1 for all frames.
+
+        Yields:
+            Frame: The next frame of the stream.
+
+        Raises:
+            NotImplementedError: If the format cannot be read from a stream.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} cannot read a trajectory from a stream"
+        )
+
+    def index_path(self) -> str:
+        """
+        Return the path of the frame index sidecar file of the trajectory.
+
+        Returns:
+            str: Path of the form ``<trajectory>.nexus-index.npz``.
+        """
+        return f"{self.filename}.nexus-index.npz"
+
+    def load_index(self) -> bool:
+        """
+        Restore the frame index from the sidecar file if it is still valid.
+
+        The sidecar is only used when ``save_frame_index`` is enabled and when the
+        reader type, absolute path, size and modification time it records all match
+        the current trajectory file.
+
+        Returns:
+            bool: True if ``frame_indices``, ``frame_offsets`` and ``frame_sizes`` were
+                restored from the sidecar.
+        """
+        if not self._settings.save_frame_index:
+            return False
+        path = self.index_path()
+        if not os.path.exists(path):
+            return False
+        try:
+            file_stat = os.stat(self.filename)
+            with np.load(path, allow_pickle=False) as index:
+                if (
+                    int(index["version"]) != _INDEX_VERSION
+                    or str(index["reader"]) != self.__class__.__name__
+                    or str(index["path"]) != os.path.abspath(self.filename)
+                    or int(index["size"]) != file_stat.st_size
+                    or int(index["mtime_ns"]) != file_stat.st_mtime_ns
+                ):
+                    return False
+                offsets = index["offsets"].tolist()
+                sizes = index["sizes"].tolist()
+                num_nodes = index["num_nodes"].tolist()
+                lattices = index["lattices"]
+                state = json.loads(str(index["state"]))
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile) as e:
+            if self.verbose:
+                print(f"Ignoring unreadable frame index {path}: {e}")
+            return False
+
+        self.frame_indices = [
+            FrameIndex(
+                frame_id=i,
+                num_nodes=num_nodes[i],
+                lattice=lattices[i],
+                byte_offset=offsets[i],
+            )
+            for i in range(len(offsets))
+        ]
+        self.frame_offsets = offsets
+        self.frame_sizes = sizes
+        self.num_frames = len(offsets)
+        self.set_index_state(state)
+        return True
+
+    def save_index(self) -> None:
+        """
+        Write the current frame index to the sidecar file.
+
+        Does nothing unless ``save_frame_index`` is enabled. The file is written to a
+        temporary path and moved into place so that concurrent runs never read a
+        partial index. Failures to write (e.g. read-only directories) are not fatal.
+        """
+        if not self._settings.save_frame_index:
+            return
+        path = self.index_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            file_stat = os.stat(self.filename)
+            lattices = np.array(
+                [frame_index.lattice for frame_index in self.frame_indices],
+                dtype=np.float64,
+            ).reshape(-1, 3, 3)
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    version=_INDEX_VERSION,
+                    reader=self.__class__.__name__,
+                    path=os.path.abspath(self.filename),
+                    size=file_stat.st_size,
+                    mtime_ns=file_stat.st_mtime_ns,
+                    offsets=np.array(self.frame_offsets, dtype=np.int64),
+                    sizes=np.array(self.frame_sizes, dtype=np.int64),
+                    num_nodes=np.array(
+                        [frame_index.num_nodes for frame_index in self.frame_indices],
+                        dtype=np.int64,
+                    ),
+                    lattices=lattices,
+                    state=json.dumps(self.get_index_state()),
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            if self.verbose:
+                print(f"Could not save frame index {path}: {e}")
+
+    def get_index_state(self) -> Dict:
+        """
+        Return reader-specific state to store alongside the frame index.
+
+        Returns:
+            Dict: JSON-serializable state, empty by default.
+        """
+        return {}
+
+    def set_index_state(self, state: Dict) -> None:
+        """
+        Restore reader-specific state loaded alongside the frame index.
+
+        Args:
+            state (Dict): State previously returned by ``get_index_state()``.
+        """
+        pass
+
+    def _index_frame(
+        self, num_nodes: int, lattice: np.ndarray, byte_offset: int, byte_size: int
+    ) -> None:
+        """
+        Store the index entry, byte offset and byte size of a scanned frame.
+
+        Args:
+            num_nodes (int): Number of nodes in the frame.
+            lattice (np.ndarray): 3x3 lattice matrix of the frame.
+            byte_offset (int): Byte offset of the first header line.
+            byte_size (int): Size of the frame in bytes, headers included.
+        """
+        frame_index = FrameIndex(
+            frame_id=self.num_frames,
+            num_nodes=num_nodes,
+            lattice=lattice,
+            byte_offset=byte_offset,
+        )
+        self.frame_indices.append(frame_index)
+        self.frame_offsets.append(byte_offset)
+        self.frame_sizes.append(byte_size)
+        self.num_frames += 1
+
+    def _scan_file(self, start_offset: int = 0, complete_only: bool = False) -> None:
+        """
+        Index frames by reading the file sequentially from a byte offset.
+
+        Args:
+            start_offset (int): Byte offset of the first frame to index.
+            complete_only (bool): Stop at the first frame whose data are not fully
+                written yet instead of indexing it, as needed when the file is
+                still being written.
+
+        Raises:
+            NotImplementedError: If the reader cannot index a file incrementally.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} cannot index {self.filename} incrementally"
+        )
+
+    @staticmethod
+    def _skip_complete_lines(file_handle: TextIO, count: int) -> bool:
+        """
+        Read ``count`` lines, stopping at the first one not terminated by a newline.
+
+        Args:
+            file_handle (TextIO): File positioned at the first line to read.
+            count (int): Number of lines to read.
+
+        Returns:
+            bool: True if all the lines were complete.
+        """
+        for _ in range(count):
+            if not file_handle.readline().endswith("\n"):
+                return False
+        return True
+
+    def update(self) -> int:
+        """
+        Index the complete frames appended to the file since the last scan.
+
+        Scanning resumes at the end of the last indexed frame, and a frame that is
+        still being written is left out until a later call finds it complete. The
+        memory map and the sidecar index are refreshed when new frames are found.
+
+        Returns:
+            int: Number of newly indexed frames.
+
+        Raises:
+            NotImplementedError: If the reader cannot index a file incrementally or
+                the file is compressed.
+        """
+        if self.compression is not None:
+            raise NotImplementedError(
+                f"Compressed trajectory {self.filename} cannot be indexed incrementally"
+            )
+        if not self.is_indexed:
+            self.scan()
+        num_frames = self.num_frames
+        start_offset = 0
+        if self.num_frames:
+            start_offset = self.frame_offsets[-1] + self.frame_sizes[-1]
+        if os.path.getsize(self.filename) <= start_offset:
+            return 0
+
+        self._scan_file(start_offset, complete_only=True)
+        if self.num_frames > num_frames:
+            if self.mmaped_file is not None:
+                self.map_file()
+            self.save_index()
+        return self.num_frames - num_frames
+
+    def scan_parallel(self, marker: bytes, marker_line: int, header_size: int) -> None:
+        """
+        Index frames by scanning byte ranges of the file in worker processes.
+
+        The file is split into ``scan_workers`` byte ranges. Each worker locates the
+        frame headers starting in its range and counts the lines of the range; the
+        results are then stitched in file order. Headers are parsed with the reader's
+        ``_parse_header(header_lines, byte_offset)`` and every frame is checked to end
+        exactly where the next one begins, so that a marker appearing outside of a
+        header cannot go unnoticed.
+
+        Args:
+            marker (bytes): Byte string found once in every frame header.
+            marker_line (int): Line of the frame header holding the marker (0-based).
+            header_size (int): Number of header lines preceding the node lines.
+
+        Raises:
+            IOError: If the located frames do not tile the file consistently.
+        """
+        size = os.path.getsize(self.filename)
+        if size == 0:
+            return
+        workers = self._settings.scan_workers
+        bounds = [size * k // workers for k in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(
+                executor.map(
+                    _find_frames,
+                    repeat(self.filename),
+                    bounds[:-1],
+                    bounds[1:],
+                    repeat(marker),
+                    repeat(marker_line),
+                    repeat(header_size),
+                )
+            )
+
+        # Turn line numbers relative to each range into absolute line numbers
+        frames = []
+        line_offset = 0
+        for chunk_frames, num_lines in chunks:
+            for byte_offset, line, header_lines in chunk_frames:
+                frames.append((byte_offset, line_offset + line, header_lines))
+            line_offset += num_lines
+
+        if frames and frames[0][0] != 0:
+            raise IOError(
+                f"{self.filename} does not start with a frame header "
+                f"(first header found at byte offset {frames[0][0]})"
+            )
+
+        for i, (byte_offset, line, header_lines) in enumerate(frames):
+            num_nodes, lattice = self._parse_header(header_lines, byte_offset)
+            if i + 1 < len(frames):
+                next_offset, next_line, _ = frames[i + 1]
+                if next_line - line != header_size + num_nodes:
+                    raise IOError(
+                        f"Frame at byte offset {byte_offset} in {self.filename} spans "
+                        f"{next_line - line} lines, expected {header_size + num_nodes}"
+                    )
+            else:
+                next_offset = size
+            self._index_frame(num_nodes, lattice, byte_offset, next_offset - byte_offset)
+
+    def map_file(self) -> bool:
+        """
+        Memory-map the trajectory file if ``memory_map`` is enabled in settings.
+
+        A previous map of the file is closed first (see ``close()``).
+
+        Returns:
+            bool: True if ``mmaped_file`` is available for scanning and parsing.
+        """
+        self.close()
+        if not self._settings.memory_map or self.compression is not None:
+            # Compressed files cannot be mapped, they are read through open_text()
+            return False
+        if os.path.getsize(self.filename) == 0:
+            # Empty files cannot be mapped, fall back to regular reads
+            return False
+        with open(self.filename, "rb") as f:
+            self.mmaped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return True
+
+    def close(self) -> None:
+        """
+        Close the memory map of the trajectory file, if any.
+
+        Frames are then read from the file again. A map that is still viewed by
+        arrays of parsed frames cannot be closed yet; it is released once those
+        arrays are freed.
+        """
+        if self.mmaped_file is None:
+            return
+        try:
+            self.mmaped_file.close()
+        except BufferError:
+            pass  # Exported views keep the map open until they are freed
+        self.mmaped_file = None
+
+    def read_mapped_line(self, offset: int) -> Tuple[str, int]:
+        """
+        Read one line from the memory-mapped file.
+
+        Args:
+            offset (int): Byte offset of the start of the line.
+
+        Returns:
+            Tuple[str, int]: The decoded line (empty at end of file) and the byte
+                offset of the next line.
+        """
+        end = self.mmaped_file.find(b"\n", offset)
+        if end == -1:
+            end = len(self.mmaped_file) - 1
+        return self.mmaped_file[offset : end + 1].decode(), end + 1
+
+    def skip_mapped_lines(self, offset: int, count: int) -> int:
+        """
+        Skip lines in the memory-mapped file by counting newlines.
+
+        Args:
+            offset (int): Byte offset to start from.
+            count (int): Number of lines to skip.
+
+        Returns:
+            int: Byte offset of the first line after the skipped block.
+        """
+        buffer = np.frombuffer(self.mmaped_file, dtype=np.uint8)
+        return _skip_lines(buffer, offset, count)
+
+    @contextmanager
+    def sequential(self) -> Iterator[None]:
+        """
+        Keep a single buffered file handle open for frames parsed inside the block.
+
+        While the block is active, ``open_frame()`` hands out the shared ``stream``
+        instead of opening the file again, and only seeks when the requested frame
+        does not start where the previous one ended. Reading frames in order thus
+        costs no open or seek call per frame. The read-ahead buffer size is taken
+        from ``read_buffer_size``. Memory-mapped files need no handle and are left
+        untouched.
+
+        Yields:
+            None
+        """
+        if self.mmaped_file is not None or self.stream is not None:
+            yield
+            return
+        with self.open_text(self._settings.read_buffer_size) as f:
+            self.stream = f
+            self._stream_offset = 0
+            try:
+                yield
+            finally:
+                self.stream = None
+                self._stream_offset = None
+
+    def open_frame(self, frame_id: int) -> TextIO:
+        """
+        Return a text handle positioned at the first line of an indexed frame.
+
+        When the file is memory-mapped, the frame's bytes are sliced from the map
+        using ``frame_offsets`` and ``frame_sizes`` without reopening the file.
+        Inside ``sequential()``, the shared ``stream`` is returned and is left open
+        when the context exits.
+
+        Args:
+            frame_id (int): Zero-based index of the frame.
+
+        Returns:
+            TextIO: A handle to be used as a context manager.
+        """
+        offset = self.frame_offsets[frame_id]
+        if self.mmaped_file is not None:
+            size = self.frame_sizes[frame_id]
+            block = self.mmaped_file[offset : offset + size]
+            return io.TextIOWrapper(io.BytesIO(block))
+        if self.stream is not None:
+            if self._stream_offset != offset:
+                self.stream.seek(offset)
+            # Parsers consume whole frames, the next frame starts right after
+            self._stream_offset = offset + self.frame_sizes[frame_id]
+            return nullcontext(self.stream)
+        f = self.open_text()
+        f.seek(offset)
+        return f
+
+    def read_node_block(
+        self,
+        file_handle: TextIO,
+        num_nodes: int,
+        usecols: Tuple[int, int, int, int],
+        node_types: Optional[Collection[str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read a block of node lines in one call and convert it column-wise.
+
+        The lines are handed to NumPy's C tokenizer in a single ``np.loadtxt`` call
+        instead of being split and converted one line at a time. When ``node_types``
+        is given, lines of other species are dropped before any conversion, so that
+        the cost of decoding and the size of the returned arrays scale with the
+        selected nodes only.
+
+        Args:
+            file_handle (TextIO): Open file handle positioned at the first node line.
+            num_nodes (int): Number of node lines to read.
+            usecols (Tuple[int, int, int, int]): Column indices of the symbol and of
+                the x, y and z coordinates.
+            node_types (Optional[Collection[str]]): Symbols of the nodes to keep, or
+                None to keep every node.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Symbol array of shape (N,) and contiguous
+                float64 position array of shape (N, 3).
+
+        Raises:
+            ValueError: If the block is truncated or a line cannot be converted.
+        """
+        lines = list(islice(file_handle, num_nodes))
+        if len(lines) != num_nodes:
+            raise ValueError(
+                f"Expected {num_nodes} node lines, found {len(lines)} before end of file"
+            )
+        if node_types is not None:
+            lines = self._select_lines(lines, usecols[0], node_types)
+        if not lines:
+            return np.empty(0, dtype=_NODE_BLOCK_DTYPE["symbol"]), np.empty((0, 3))
+        block = np.loadtxt(lines, dtype=_NODE_BLOCK_DTYPE, usecols=usecols, ndmin=1)
+        positions = np.column_stack((block["x"], block["y"], block["z"]))
+        return block["symbol"], positions
+
+    @staticmethod
+    def _select_lines(
+        lines: List[str], column: int, node_types: Collection[str]
+    ) -> List[str]:
+        """
+        Keep the node lines whose symbol column holds one of ``node_types``.
+
+        Args:
+            lines (List[str]): Raw node lines.
+            column (int): Index of the symbol column.
+            node_types (Collection[str]): Symbols of the nodes to keep.
+
+        Returns:
+            List[str]: The selected lines, in file order.
+
+        Raises:
+            ValueError: If a line has fewer columns than ``column + 1``.
+        """
+        if column == 0:
+            # A prefix test is much cheaper than splitting every line
+            prefixes = tuple(
+                f"{node_type}{separator}"
+                for node_type in node_types
+                for separator in (" ", "\t")
+            )
+            return [line for line in lines if line.lstrip().startswith(prefixes)]
+        types = set(node_types)
+        try:
+            return [line for line in lines if line.split(None, column + 1)[column] in types]
+        except IndexError:
+            raise ValueError(f"Node line has no column {column}")
+
     @abstractmethod
     def detect(self, filepath: str) -> bool:
         """
@@ -0,0 +1,215 @@
+from bisect import bisect_right
+from collections import namedtuple
+from typing import List, Optional, Tuple
+import bz2
+import io
+import lzma
+import zlib
+
+# Compression formats supported for trajectory inputs, by file extension
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "lzma",
+    ".lzma": "lzma",
+}
+
+_DECOMPRESSORS = {
+    "gzip": lambda: zlib.decompressobj(wbits=zlib.MAX_WBITS | 16),
+    "bz2": bz2.BZ2Decompressor,
+    "lzma": lzma.LZMADecompressor,
+}
+
+# Size of the compressed chunks fed to the decompressor
+_CHUNK_SIZE = 1 << 16
+
+Checkpoint = namedtuple(
+    "Checkpoint", ["compressed_offset", "uncompressed_offset", "decompressor"]
+)
+Checkpoint.__doc__ = """
+Point from which decompression can resume without starting over.
+
+Attributes:
+    compressed_offset (int): Offset in the compressed file of the next byte to feed.
+    uncompressed_offset (int): Offset in the uncompressed data of the next output byte.
+    decompressor: Snapshot of the decompressor state (about 40 kB for gzip), or
+        None at the start of a stream where a fresh decompressor is used.
+"""
+
+
+def split_compression(path: str) -> Tuple[str, Optional[str]]:
+    """
+    Split a compression extension off a file path.
+
+    Args:
+        path (str): Path of the file, e.g. ``traj.xyz.gz``.
+
+    Returns:
+        Tuple[str, Optional[str]]: The path without its compression extension and
+            the compression format (``"gzip"``, ``"bz2"`` or ``"lzma"``), or the
+            unchanged path and None for uncompressed files.
+    """
+    for extension, compression in COMPRESSION_EXTENSIONS.items():
+        if path.lower().endswith(extension):
+            return path[: -len(extension)], compression
+    return path, None
+
+
+class CompressedFile(io.RawIOBase):
+    """
+    Seekable read-only stream over the uncompressed content of a compressed file.
+
+    Offsets given to ``seek()`` and returned by ``tell()`` are positions in the
+    uncompressed data, so frame offsets recorded by ``scan()`` can be used as for
+    plain files. While data is read, checkpoints are appended to a list shared
+    between all streams of the same file: every ``interval`` uncompressed bytes
+    for gzip, whose decompressor state can be copied, and at the start of every
+    stream of multi-stream files for all formats. Seeking resumes from the last
+    checkpoint before the target instead of decompressing from the start.
+
+    A gzip checkpoint inside a stream holds a copy of the decompressor, whose
+    32 KiB window and internal buffers take about 40 kB, so the checkpoints of a
+    file take roughly ``40 kB * uncompressed size / interval``.
+
+    Attributes:
+        checkpoints (List[Checkpoint]): Checkpoints sorted by uncompressed offset.
+    """
+
+    def __init__(
+        self, path: str, compression: str, checkpoints: List[Checkpoint], interval: int
+    ) -> None:
+        """
+        Open a compressed file.
+
+        Args:
+            path (str): Path of the compressed file.
+            compression (str): Compression format, a value of
+                ``COMPRESSION_EXTENSIONS``.
+            checkpoints (List[Checkpoint]): Checkpoint list shared by the streams of
+                this file, extended in place.
+            interval (int): Minimum number of uncompressed bytes between checkpoints.
+        """
+        super().__init__()
+        self._file = open(path, "rb")
+        self._compression = compression
+        self._interval = interval
+        self.checkpoints = checkpoints
+        if not self.checkpoints:
+            self.checkpoints.append(Checkpoint(0, 0, None))
+        self._restore(self.checkpoints[0])
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        if not self.closed:
+            self._file.close()
+        super().close()
+
+    def _restore(self, checkpoint: Checkpoint) -> None:
+        """Resume decompression from a checkpoint."""
+        self._file.seek(checkpoint.compressed_offset)
+        if checkpoint.decompressor is None:
+            self._decompressor = None
+        else:
+            self._decompressor = checkpoint.decompressor.copy()
+        self._pending = b""
+        self._buffer = b""
+        self._buffer_offset = 0
+        self._produced = checkpoint.uncompressed_offset
+        self._position = checkpoint.uncompressed_offset
+
+    def _add_checkpoint(self, compressed_offset: int, decompressor) -> None:
+        """Record a checkpoint at the current end of the decompressed data."""
+        last = self.checkpoints[-1].uncompressed_offset
+        if self._produced >= last + self._interval:
+            state = decompressor.copy() if decompressor is not None else None
+            self.checkpoints.append(Checkpoint(compressed_offset, self._produced, state))
+
+    def _fill(self) -> bytes:
+        """
+        Decompress the next piece of data.
+
+        Returns:
+            bytes: Newly decompressed data, empty at the end of the file.
+
+        Raises:
+            EOFError: If the file ends in the middle of a compressed stream.
+        """
+        while True:
+            data = self._pending or self._file.read(_CHUNK_SIZE)
+            self._pending = b""
+            if self._decompressor is None:
+                # Between streams: a new stream starts if any data is left
+                if not data:
+                    return b""
+                if self._compression == "gzip":
+                    # Skip the zero padding allowed after gzip members
+                    data = data.lstrip(b"\0")
+                    if not data:
+                        continue
+                self._decompressor = _DECOMPRESSORS[self._compression]()
+                self._add_checkpoint(self._file.tell() - len(data), None)
+            elif not data:
+                raise EOFError("Compressed file ended before the end-of-stream marker")
+
+            output = self._decompressor.decompress(data)
+            self._produced += len(output)
+            if self._decompressor.eof:
+                self._pending = self._decompressor.unused_data
+                self._decompressor = None
+            elif hasattr(self._decompressor, "copy"):
+                # All input was consumed, the state matches the file position
+                self._add_checkpoint(self._file.tell(), self._decompressor)
+            if output:
+                return output
+
+    def readinto(self, b) -> int:
+        if self._buffer_offset >= len(self._buffer):
+            self._buffer = self._fill()
+            self._buffer_offset = 0
+            if not self._buffer:
+                return 0
+        size = min(len(b), len(self._buffer) - self._buffer_offset)
+        b[:size] = self._buffer[self._buffer_offset : self._buffer_offset + size]
+        self._buffer_offset += size
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            while self.readinto(bytearray(_CHUNK_SIZE)):
+                pass
+            offset += self._position
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        buffer_start = self._produced - len(self._buffer)
+        if buffer_start <= offset <= self._produced:
+            # Target inside the current buffer
+            self._buffer_offset = offset - buffer_start
+            self._position = offset
+            return offset
+
+        index = bisect_right([c.uncompressed_offset for c in self.checkpoints], offset)
+        checkpoint = self.checkpoints[index - 1]
+        if not (checkpoint.uncompressed_offset <= self._position <= offset):
+            self._restore(checkpoint)
+
+        # Decompress and discard up to the target
+        while self._produced < offset:
+            self._buffer = self._fill()
+            if not self._buffer:
+                break
+        buffer_start = self._produced - len(self._buffer)
+        self._buffer_offset = min(offset, self._produced) - buffer_start
+        self._position = buffer_start + self._buffer_offset
+        return self._position
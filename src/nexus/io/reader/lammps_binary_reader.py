@@ -0,0 +1,460 @@
+from typing import BinaryIO, Dict, Generator, List, Optional, Tuple
+import numpy as np
+import struct
+import io
+import os
+
+from .base_reader import BaseReader, FrameIndex
+from ...core.frame import Frame
+from ...config.settings import Settings
+
+# Column names written by ``dump atom`` files that predate column headers
+_DEFAULT_ATOM_COLUMNS = ["id", "type", "xs", "ys", "zs"]
+
+# Position column triplets, by order of preference, and whether they are scaled
+_POSITION_COLUMNS = [
+    (("x", "y", "z"), False),
+    (("xu", "yu", "zu"), False),
+    (("xs", "ys", "zs"), True),
+    (("xsu", "ysu", "zsu"), True),
+]
+
+
+class LAMMPSBinaryReader(BaseReader):
+    """
+    Reader for binary LAMMPS dump files (``dump ... binary``, ``.bin`` extension).
+
+    Each frame holds a fixed binary header (timestep, node count, box bounds and,
+    in recent LAMMPS versions, the unit style, time and column names) followed by
+    one chunk of float64 values per writing process. Frames are indexed by
+    skipping over the chunks and decoded with ``np.frombuffer`` without any text
+    parsing. Node types are numeric in binary dumps, so the symbols of the parsed
+    nodes are the type numbers as strings (e.g. ``"1"``, ``"2"``).
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """
+        Initialize the binary LAMMPS reader.
+
+        Args:
+            settings (Settings): Configuration settings.
+        """
+        super().__init__(settings)
+        self.columns: Dict[str, int] = {}
+
+    def detect(self, filepath: str) -> bool:
+        """
+        Check whether the file has the ``.bin`` extension used by LAMMPS binary dumps.
+
+        Args:
+            filepath (str): Path to the file to test.
+
+        Returns:
+            bool: True if the file ends with ``.bin``.
+        """
+        return filepath.lower().endswith(".bin")
+
+    def scan(self) -> List[FrameIndex]:
+        """
+        Scan the binary dump and build an index of frame byte offsets.
+
+        Reads each frame header and seeks over the data chunks, recording the byte
+        offset and size of every frame. When ``save_frame_index`` is enabled, a
+        still-valid sidecar index is loaded instead of scanning, and a fresh scan is
+        saved to the sidecar. Binary frames have no text marker to search for, so
+        ``scan_workers`` is not used.
+
+        Returns:
+            List[FrameIndex]: Indexed frame metadata for every frame in the file.
+
+        Raises:
+            IOError: If a frame header is malformed or the file is truncated.
+        """
+        self.frame_indices = []
+        self.frame_offsets = []
+        self.frame_sizes = []
+        self.num_frames = 0
+
+        if self.load_index():
+            # The sidecar index is still valid, only map the file if requested
+            self.map_file()
+            if self.verbose:
+                print(f"Loaded frame index of {self.filename} from {self.index_path()}")
+            self.is_indexed = True
+            return self.frame_indices
+
+        try:
+            self.map_file()
+            # In follow mode the file may still be written, a partial frame is left out
+            self._scan_file(complete_only=self._settings.follow)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            raise IOError(f"Error scanning trajectory file {self.filename}: {e}")
+
+        self.save_index()
+
+        if self.verbose:
+            print(f"Scanned {self.num_frames} frames in {self.filename}")
+
+        self.is_indexed = True
+        return self.frame_indices
+
+    def get_index_state(self) -> Dict:
+        """
+        Return the node property column mapping to store with the frame index.
+
+        Returns:
+            Dict: The ``columns`` mapping discovered during scanning.
+        """
+        return {"columns": self.columns}
+
+    def set_index_state(self, state: Dict) -> None:
+        """
+        Restore the node property column mapping loaded with the frame index.
+
+        Args:
+            state (Dict): State previously returned by ``get_index_state()``.
+        """
+        self.columns = state["columns"]
+
+    def _scan_file(self, start_offset: int = 0, complete_only: bool = False) -> None:
+        """
+        Index frames by reading each header and seeking over the data chunks.
+
+        Args:
+            start_offset (int): Byte offset of the first frame to index.
+            complete_only (bool): Stop at the first frame that is not fully written
+                yet instead of raising an error.
+        """
+        with open(self.filename, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(start_offset)
+            while f.tell() < size:
+                frame_start_offset = f.tell()
+                try:
+                    num_nodes, lattice, _, columns = self._read_header(f, frame_start_offset)
+                    (num_chunks,) = self._unpack(f, "<i", frame_start_offset)
+                    for _ in range(num_chunks):
+                        (num_values,) = self._unpack(f, "<i", frame_start_offset)
+                        f.seek(num_values * 8, os.SEEK_CUR)
+                except EOFError:
+                    if complete_only:
+                        break  # Frame still being written
+                    raise
+
+                frame_end_offset = f.tell()
+                if frame_end_offset > size:
+                    if complete_only:
+                        break
+                    raise IOError(
+                        f"Frame at byte offset {frame_start_offset} in {self.filename} "
+                        f"is truncated"
+                    )
+                self.columns = columns
+                self._index_frame(
+                    num_nodes,
+                    lattice,
+                    frame_start_offset,
+                    frame_end_offset - frame_start_offset,
+                )
+
+    def _unpack(
+        self, f: BinaryIO, fmt: str, frame_start_offset: Optional[int]
+    ) -> Tuple:
+        """
+        Read and unpack one fixed-size record.
+
+        Args:
+            f (BinaryIO): Binary handle positioned at the record.
+            fmt (str): ``struct`` format of the record.
+            frame_start_offset (Optional[int]): Byte offset of the frame, used in
+                error messages, or None for a frame read from a stream.
+
+        Returns:
+            Tuple: The unpacked values.
+
+        Raises:
+            EOFError: If the end of the file is reached inside the record.
+        """
+        size = struct.calcsize(fmt)
+        data = f.read(size)
+        if len(data) != size:
+            raise EOFError(
+                f"Unexpected end of file in frame {self._locate(frame_start_offset)} "
+                f"in {self.filename}"
+            )
+        return struct.unpack(fmt, data)
+
+    def _locate(self, frame_start_offset: Optional[int]) -> str:
+        """Describe where a frame is in the file, for error messages."""
+        if frame_start_offset is None:
+            return f"{self.num_frames} of the stream"
+        return f"at byte offset {frame_start_offset}"
+
+    def _read_string(
+        self, f: BinaryIO, length: int, frame_start_offset: Optional[int]
+    ) -> str:
+        """Read a string of *length* bytes from the frame header."""
+        return self._unpack(f, f"<{length}s", frame_start_offset)[0].decode()
+
+    def _read_header(
+        self, f: BinaryIO, frame_start_offset: Optional[int]
+    ) -> Tuple[int, np.ndarray, np.ndarray, Dict[str, int]]:
+        """
+        Read the header of a binary frame, leaving the handle on the chunk count.
+
+        Args:
+            f (BinaryIO): Binary handle positioned at the start of the frame.
+            frame_start_offset (Optional[int]): Byte offset of the frame, used in
+                error messages, or None for a frame read from a stream.
+
+        Returns:
+            Tuple[int, np.ndarray, np.ndarray, Dict[str, int]]: The node count, the
+                3x3 lattice matrix, the origin of the box and the column mapping.
+
+        Raises:
+            IOError: If the header is malformed or uses an unsupported layout.
+        """
+        (timestep,) = self._unpack(f, "<q", frame_start_offset)
+        revision = 0
+        if timestep < 0:
+            # Recent LAMMPS versions start with the negated length of a magic string
+            self._read_string(f, -timestep, frame_start_offset)
+            endian, revision = self._unpack(f, "<ii", frame_start_offset)
+            if endian != 1:
+                raise IOError(
+                    f"Frame {self._locate(frame_start_offset)} in {self.filename} "
+                    f"was written with a different byte order"
+                )
+            (timestep,) = self._unpack(f, "<q", frame_start_offset)
+
+        (num_nodes,) = self._unpack(f, "<q", frame_start_offset)
+        (triclinic,) = self._unpack(f, "<i", frame_start_offset)
+        if triclinic not in (0, 1):
+            raise IOError(
+                f"Unsupported box type {triclinic} in frame "
+                f"{self._locate(frame_start_offset)} in {self.filename}"
+            )
+        self._unpack(f, "<6i", frame_start_offset)  # Boundary flags
+        xlo, xhi, ylo, yhi, zlo, zhi = self._unpack(f, "<6d", frame_start_offset)
+        xy = xz = yz = 0.0
+        if triclinic:
+            xy, xz, yz = self._unpack(f, "<3d", frame_start_offset)
+            # Bounds are those of the bounding box of the tilted cell
+            xlo -= min(0.0, xy, xz, xy + xz)
+            xhi -= max(0.0, xy, xz, xy + xz)
+            ylo -= min(0.0, yz)
+            yhi -= max(0.0, yz)
+        (size_one,) = self._unpack(f, "<i", frame_start_offset)
+
+        columns = None
+        if revision > 1:
+            (length,) = self._unpack(f, "<i", frame_start_offset)
+            if length > 0:
+                self._read_string(f, length, frame_start_offset)  # Unit style
+            (has_time,) = self._unpack(f, "<b", frame_start_offset)
+            if has_time:
+                self._unpack(f, "<d", frame_start_offset)
+            (length,) = self._unpack(f, "<i", frame_start_offset)
+            columns = self._read_string(f, length, frame_start_offset).split()
+        if columns is None:
+            if size_one != len(_DEFAULT_ATOM_COLUMNS):
+                raise IOError(
+                    f"Frame {self._locate(frame_start_offset)} in {self.filename} has "
+                    f"no column names; only 'dump atom' files can be read without them"
+                )
+            columns = _DEFAULT_ATOM_COLUMNS
+        if len(columns) != size_one:
+            raise IOError(
+                f"Frame {self._locate(frame_start_offset)} in {self.filename} declares "
+                f"{len(columns)} column names for {size_one} values per node"
+            )
+
+        lattice = np.array(
+            [
+                [xhi - xlo, 0.0, 0.0],
+                [xy, yhi - ylo, 0.0],
+                [xz, yz, zhi - zlo],
+            ]
+        )
+        origin = np.array([xlo, ylo, zlo])
+        return num_nodes, lattice, origin, {col: i for i, col in enumerate(columns)}
+
+    def _read_frame_bytes(self, frame_id: int) -> bytes:
+        """
+        Return the raw bytes of an indexed frame.
+
+        Slices the memory-mapped file when available, reuses the shared handle of
+        ``sequential()`` when active, and otherwise opens the file.
+
+        Args:
+            frame_id (int): Zero-based index of the frame.
+
+        Returns:
+            bytes: The header and data chunks of the frame.
+        """
+        offset = self.frame_offsets[frame_id]
+        size = self.frame_sizes[frame_id]
+        if self.mmaped_file is not None:
+            return self.mmaped_file[offset : offset + size]
+        if self.stream is not None:
+            # The binary buffer under the shared text handle is read directly
+            handle = self.stream.buffer
+            if self._stream_offset != offset:
+                handle.seek(offset)
+            self._stream_offset = offset + size
+            return handle.read(size)
+        with open(self.filename, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
+
+    def parse(self, frame_id: int) -> Generator[Frame, None, None]:
+        """
+        Parse a specific frame by decoding its data chunks with ``np.frombuffer``.
+
+        The per-node values of all chunks are gathered into a (N, size_one) array,
+        the type and position columns are selected with the mapping read from the
+        header, and only the types listed in ``clustering.node_types`` are kept.
+        Scaled coordinates are converted to Cartesian coordinates.
+
+        Args:
+            frame_id (int): Zero-based index of the frame to parse.
+
+        Yields:
+            Frame: A frame with raw node data and lattice information.
+        """
+        if not self.is_indexed:
+            self.scan()
+
+        frame_start_offset = self.frame_offsets[frame_id]
+        block = self._read_frame_bytes(frame_id)
+
+        f = io.BytesIO(block)
+        num_nodes, lattice, origin, columns = self._read_header(f, frame_start_offset)
+        (num_chunks,) = self._unpack(f, "<i", frame_start_offset)
+        chunks = []
+        offset = f.tell()
+        for _ in range(num_chunks):
+            (num_values,) = struct.unpack_from("<i", block, offset)
+            offset += 4
+            chunks.append(
+                np.frombuffer(block, dtype="<f8", count=num_values, offset=offset)
+            )
+            offset += num_values * 8
+        values = np.concatenate(chunks) if chunks else np.empty(0)
+        yield self._build_frame(frame_id, num_nodes, lattice, origin, columns, values)
+
+    def iter_stream(
+        self, start_frame: int = 0, end_frame: int = -1
+    ) -> Generator[Frame, None, None]:
+        """
+        Yield the frames of a non-seekable binary dump as they arrive, in a single pass.
+
+        Each frame header and data chunks are read straight from the stream without
+        an index, and decoded as in ``parse()``.
+
+        Args:
+            start_frame (int): Zero-based index of the first frame to yield.
+            end_frame (int): Index of the last frame to yield, or -1 for all frames.
+
+        Yields:
+            Frame: The next frame of the stream.
+
+        Raises:
+            IOError: If a frame header is malformed or the stream ends inside a frame.
+        """
+        self.num_frames = 0
+        with self.open_stream(binary=True) as f:
+            while end_frame == -1 or self.num_frames <= end_frame:
+                if not f.peek(1):
+                    break  # End of stream
+                frame_id = self.num_frames
+                try:
+                    num_nodes, lattice, origin, columns = self._read_header(f, None)
+                    (num_chunks,) = self._unpack(f, "<i", None)
+                    chunks = []
+                    for _ in range(num_chunks):
+                        (num_values,) = self._unpack(f, "<i", None)
+                        data = f.read(num_values * 8)
+                        if len(data) != num_values * 8:
+                            raise EOFError(
+                                f"Unexpected end of file in frame {self._locate(None)} "
+                                f"in {self.filename}"
+                            )
+                        if frame_id >= start_frame:
+                            chunks.append(np.frombuffer(data, dtype="<f8"))
+                except EOFError as e:
+                    raise IOError(str(e))
+                self.num_frames += 1
+
+                if frame_id < start_frame:
+                    continue
+                values = np.concatenate(chunks) if chunks else np.empty(0)
+                yield self._build_frame(frame_id, num_nodes, lattice, origin, columns, values)
+
+    def _build_frame(
+        self,
+        frame_id: int,
+        num_nodes: int,
+        lattice: np.ndarray,
+        origin: np.ndarray,
+        columns: Dict[str, int],
+        values: np.ndarray,
+    ) -> Frame:
+        """
+        Build a frame from the decoded header and the flat per-node values.
+
+        Selects the type and position columns, keeps only the types listed in
+        ``clustering.node_types`` and converts scaled coordinates to Cartesian ones.
+
+        Args:
+            frame_id (int): Zero-based index of the frame.
+            num_nodes (int): Number of nodes declared in the header.
+            lattice (np.ndarray): 3x3 lattice matrix read from the header.
+            origin (np.ndarray): Origin of the box read from the header.
+            columns (Dict[str, int]): Column mapping read from the header.
+            values (np.ndarray): Flat float64 values of all chunks.
+
+        Returns:
+            Frame: A frame with raw node data and lattice information.
+
+        Raises:
+            ValueError: If the value count or the columns do not match the header.
+        """
+        size_one = len(columns)
+        if values.size != num_nodes * size_one:
+            raise ValueError(
+                f"Frame {frame_id} holds {values.size} values, expected "
+                f"{num_nodes * size_one}"
+            )
+        values = values.reshape(num_nodes, size_one)
+
+        if "type" not in columns:
+            raise ValueError("Binary dump has no 'type' column")
+        for position_columns, scaled in _POSITION_COLUMNS:
+            if all(col in columns for col in position_columns):
+                break
+        else:
+            raise ValueError("Binary dump has no position columns")
+
+        symbols = values[:, columns["type"]].astype(np.int64).astype(str)
+        selected = np.isin(symbols, self._settings.clustering.node_types)
+        symbols = symbols[selected]
+        positions = values[selected][:, [columns[col] for col in position_columns]]
+        if scaled:
+            positions = origin + positions @ lattice
+        positions = np.ascontiguousarray(positions, dtype=np.float64)
+
+        if not self._settings.lattice.apply_custom_lattice:
+            self._settings.lattice.lattice = lattice
+        else:
+            lattice = self._settings.lattice.custom_lattice
+
+        return Frame(
+            frame_id=frame_id,
+            _data={"symbol": symbols, "position": positions},
+            lattice=lattice,
+            nodes=[],
+            _settings=self._settings,
+        )
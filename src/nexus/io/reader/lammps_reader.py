@@ -1,19 +1,19 @@
-from typing import List, Generator
-from collections import namedtuple
+from typing import Dict, List, Generator, Optional, Tuple
+from itertools import islice
 import numpy as np
 import os
 
-from .base_reader import BaseReader
+from .base_reader import BaseReader, FrameIndex
+from .compressed_file import split_compression
 from ...core.frame import Frame
 from ...config.settings import Settings
 
-FrameIndex = namedtuple('FrameIndex', ['frame_id', 'num_nodes', 'lattice', 'byte_offset'])
-
 class LAMMPSReader(BaseReader):
     """
     Reader for LAMMPS dump trajectory files.
 
-    Supports ``.lammpstrj``, ``.lammps``, and ``.data`` file extensions. Parses the
+    Supports ``.lammpstrj``, ``.lammps``, and ``.data`` file extensions, as well as
+    their gzip, bz2 and xz compressed versions. Parses the
     ``ITEM:`` headers to extract timestep, node count, box bounds (orthorhombic), and
     column-mapped node properties.
     """
@@ -35,8 +35,10 @@ class LAMMPSReader(BaseReader):
             filepath (str): Path to the file to test.
 
         Returns:
-            bool: True if the file ends with ``.lammpstrj``, ``.lammps``, or ``.data``.
+            bool: True if the file ends with ``.lammpstrj``, ``.lammps``, or ``.data``,
+                optionally followed by ``.gz``, ``.bz2``, ``.xz`` or ``.lzma``.
         """
+        filepath, _ = split_compression(filepath)
         if filepath.lower().endswith('.lammpstrj'):
             return True
         if filepath.lower().endswith('.lammps'):
@@ -50,8 +52,13 @@ class LAMMPSReader(BaseReader):
         Scan the LAMMPS dump file and build an index of frame byte offsets.
 
         Reads the file sequentially, parsing each ``ITEM: TIMESTEP`` block to extract
-        the node count and orthorhombic box bounds, and recording the byte offset for
-        later seeking.
+        the node count and orthorhombic box bounds, and recording the byte offset and
+        size of each frame for later seeking. When ``memory_map`` is enabled, the file
+        is mapped and node lines are skipped by counting newlines on the mapped buffer.
+        When ``scan_workers`` is above 1, ``ITEM: TIMESTEP`` lines are located in byte
+        ranges of the file by worker processes (see ``BaseReader.scan_parallel``).
+        When ``save_frame_index`` is enabled, a still-valid sidecar index is loaded
+        instead of scanning, and a fresh scan is saved to the sidecar.
 
         Returns:
             List[FrameIndex]: Indexed frame metadata for every frame in the file.
@@ -60,87 +67,258 @@ class LAMMPSReader(BaseReader):
             IOError: If a frame header is malformed or the file cannot be read.
         """
         self.frame_indices = []
+        self.frame_offsets = []
+        self.frame_sizes = []
         self.num_frames = 0
+        self.checkpoints = []
         
-        try:
-            with open(self.filename, 'r') as f:
-                while True:
-                    frame_start_offset = f.tell()
-                    
-                    # Read the first line of the frame block
-                    line = f.readline()
-                    if not line:
-                        break # End of file
-                    
-                    # Check if the line is the 'ITEM: TIMESTEP' header
-                    if 'ITEM: TIMESTEP' not in line:
-                        # This could indicate a malformed file or we are out of sync.
-                        # For now, we'll assume it means the end of valid frames.
-                        break
-                        
-                    try:
-                        # --- Parse Frame Header ---
-                        f.readline() # Timestep value
-                        f.readline() # ITEM: NUMBER OF NODES
-                        num_nodes = int(f.readline().strip())
-                        
-                        f.readline() # ITEM: BOX BOUNDS
-                        
-                        # Read lattice vectors
-                        lattices = [f.readline().strip() for _ in range(3)]
-                        lattice = []
-                        for i in range(3):
-                            line_parts = lattices[i].split()
-                            low, high = float(line_parts[0]), float(line_parts[1])
-                            lii = high - low
-                            if i == 0:
-                                lattice.append([lii, 0.0, 0.0])
-                            elif i == 1:
-                                lattice.append([0.0, lii, 0.0])
-                            else:
-                                lattice.append([0.0, 0.0, lii])
-                        lattice = np.array(lattice)
-                        
-                        # Read node property header
-                        self.columns = {col: i for i, col in enumerate(f.readline().strip().split()[2:])}
-                        
-                        # Skip the atomic data lines to get to the next frame
-                        for _ in range(num_nodes):
-                            f.readline()
-
-                    except (ValueError, IndexError) as e:
-                        raise IOError(
-                            f"Failed to parse LAMMPS frame header at byte offset {frame_start_offset} in {self.filename}. "
-                            f"Error: {e}"
-                        )
-
-                    # Store the indexed frame information
-                    frame_index = FrameIndex(
-                        frame_id=self.num_frames,
-                        num_nodes=num_nodes,
-                        lattice=lattice,
-                        byte_offset=frame_start_offset
-                    )
-                    self.frame_indices.append(frame_index)
-                    self.num_frames += 1
+        if self.load_index():
+            # The sidecar index is still valid, only map the file if requested
+            self.map_file()
+            if self.verbose:
+                print(f"Loaded frame index of {self.filename} from {self.index_path()}")
+            self.is_indexed = True
+            return self.frame_indices
 
+        try:
+            mapped = self.map_file()
+            if self._settings.follow:
+                # The file may still be written, leave a trailing partial frame out
+                self._scan_file(complete_only=True)
+            elif self._settings.scan_workers > 1 and self.compression is None:
+                self.scan_parallel(b"ITEM: TIMESTEP", 0, 9)
+            elif mapped:
+                self._scan_mapped()
+            else:
+                self._scan_file()
         except FileNotFoundError:
             raise
         except Exception as e:
             raise IOError(f"Error scanning trajectory file {self.filename}: {e}")
 
+        self.save_index()
+
         if self.verbose:
             print(f"Scanned {self.num_frames} frames in {self.filename}")
 
         self.is_indexed = True
         return self.frame_indices
 
+    def get_index_state(self) -> Dict:
+        """
+        Return the node property column mapping to store with the frame index.
+
+        Returns:
+            Dict: The ``columns`` mapping discovered during scanning.
+        """
+        return {"columns": getattr(self, "columns", {})}
+
+    def set_index_state(self, state: Dict) -> None:
+        """
+        Restore the node property column mapping loaded with the frame index.
+
+        Args:
+            state (Dict): State previously returned by ``get_index_state()``.
+        """
+        self.columns = state["columns"]
+
+    def _scan_file(self, start_offset: int = 0, complete_only: bool = False) -> None:
+        """
+        Index frames by reading the file line by line.
+
+        Args:
+            start_offset (int): Byte offset of the first frame to index.
+            complete_only (bool): Stop at the first frame with a line that is not
+                terminated by a newline yet instead of indexing it. Every line is
+                checked, since a line read while it is being written is returned in
+                two parts by consecutive reads.
+        """
+        with self.open_text() as f:
+            f.seek(start_offset)
+            while True:
+                frame_start_offset = f.tell()
+                
+                # Read the first line of the frame block
+                line = f.readline()
+                if not line:
+                    break # End of file
+                
+                # Check if the line is the 'ITEM: TIMESTEP' header
+                if 'ITEM: TIMESTEP' not in line:
+                    # This could indicate a malformed file or we are out of sync.
+                    # For now, we'll assume it means the end of valid frames.
+                    break
+
+                # Timestep value through node property header
+                header_lines = [line] + [f.readline() for _ in range(8)]
+                if complete_only and not all(l.endswith("\n") for l in header_lines):
+                    break  # Header still being written
+                num_nodes, lattice = self._parse_header(header_lines, frame_start_offset)
+
+                # Skip the atomic data lines to get to the next frame
+                if complete_only:
+                    if not self._skip_complete_lines(f, num_nodes):
+                        break  # Node block still being written
+                else:
+                    for _ in range(num_nodes):
+                        f.readline()
+
+                self._index_frame(
+                    num_nodes, lattice, frame_start_offset, f.tell() - frame_start_offset
+                )
+
+    def _scan_mapped(self) -> None:
+        """Index frames by counting newlines on the memory-mapped file."""
+        size = len(self.mmaped_file)
+        frame_start_offset = 0
+        while frame_start_offset < size:
+            line, offset = self.read_mapped_line(frame_start_offset)
+
+            # Check if the line is the 'ITEM: TIMESTEP' header
+            if 'ITEM: TIMESTEP' not in line:
+                break
+
+            # Timestep value through node property header
+            header_lines = [line]
+            for _ in range(8):
+                line, offset = self.read_mapped_line(offset)
+                header_lines.append(line)
+            num_nodes, lattice = self._parse_header(header_lines, frame_start_offset)
+
+            # Jump over the atomic data lines to the next frame
+            offset = self.skip_mapped_lines(offset, num_nodes)
+
+            self._index_frame(
+                num_nodes, lattice, frame_start_offset, offset - frame_start_offset
+            )
+            frame_start_offset = offset
+
+    def _parse_header(
+        self, header_lines: List[str], frame_start_offset: Optional[int]
+    ) -> Tuple[int, np.ndarray]:
+        """
+        Extract the node count, box bounds and column mapping from a frame header.
+
+        Args:
+            header_lines (List[str]): The nine header lines of the frame, from
+                ``ITEM: TIMESTEP`` to the node property header.
+            frame_start_offset (Optional[int]): Byte offset of the frame, used in
+                error messages, or None for a frame read from a stream.
+
+        Returns:
+            Tuple[int, np.ndarray]: The node count and the 3x3 lattice matrix.
+
+        Raises:
+            IOError: If the header is malformed.
+        """
+        try:
+            # --- Parse Frame Header ---
+            # header_lines[0]: ITEM: TIMESTEP
+            # header_lines[1]: Timestep value
+            # header_lines[2]: ITEM: NUMBER OF NODES
+            num_nodes = int(header_lines[3].strip())
+
+            # header_lines[4]: ITEM: BOX BOUNDS
+            
+            # Read lattice vectors
+            lattices = [line.strip() for line in header_lines[5:8]]
+            lattice = []
+            for i in range(3):
+                line_parts = lattices[i].split()
+                low, high = float(line_parts[0]), float(line_parts[1])
+                lii = high - low
+                if i == 0:
+                    lattice.append([lii, 0.0, 0.0])
+                elif i == 1:
+                    lattice.append([0.0, lii, 0.0])
+                else:
+                    lattice.append([0.0, 0.0, lii])
+            lattice = np.array(lattice)
+            
+            # Read node property header
+            self.columns = {col: i for i, col in enumerate(header_lines[8].strip().split()[2:])}
+
+        except (ValueError, IndexError) as e:
+            if frame_start_offset is None:
+                location = f"of frame {self.num_frames} of the stream"
+            else:
+                location = f"at byte offset {frame_start_offset}"
+            raise IOError(
+                f"Failed to parse LAMMPS frame header {location} in {self.filename}. "
+                f"Error: {e}"
+            )
+        return num_nodes, lattice
+
+    def iter_stream(
+        self, start_frame: int = 0, end_frame: int = -1
+    ) -> Generator[Frame, None, None]:
+        """
+        Yield the frames of a non-seekable LAMMPS stream as they arrive, in a single pass.
+
+        Each frame is parsed from its nine header lines and node block exactly as in
+        ``parse()``, but read straight from the stream without an index.
+
+        Args:
+            start_frame (int): Zero-based index of the first frame to yield.
+            end_frame (int): Index of the last frame to yield, or -1 for all frames.
+
+        Yields:
+            Frame: The next frame of the stream.
+
+        Raises:
+            IOError: If a frame header is malformed.
+            ValueError: If a node block is truncated or malformed.
+        """
+        self.num_frames = 0
+        with self.open_stream() as f:
+            while end_frame == -1 or self.num_frames <= end_frame:
+                line = f.readline()
+                if 'ITEM: TIMESTEP' not in line:
+                    break  # End of stream
+
+                header_lines = [line] + [f.readline() for _ in range(8)]
+                num_nodes, lattice = self._parse_header(header_lines, None)
+                frame_id = self.num_frames
+                self.num_frames += 1
+
+                if frame_id < start_frame:
+                    # Consume the node lines of a frame before the range
+                    next(islice(f, num_nodes, num_nodes), None)
+                    continue
+
+                try:
+                    symbols, positions = self.read_node_block(
+                        f,
+                        num_nodes,
+                        (
+                            self.columns['type'],
+                            self.columns['x'],
+                            self.columns['y'],
+                            self.columns['z'],
+                        ),
+                        self._settings.clustering.node_types,
+                    )
+                except ValueError as e:
+                    raise ValueError(f"Frame {frame_id} of the stream: {e}")
+
+                yield Frame(
+                    frame_id=frame_id,
+                    _data={'symbol': symbols, 'position': positions},
+                    lattice=lattice,
+                    nodes=[],
+                    _settings=self._settings,
+                )
+
     def parse(self, frame_id: int) -> Generator[Frame, None, None]:
         """
-        Parse a specific frame by seeking to its indexed byte offset.
+        Parse a specific frame by seeking to its indexed byte offset, or by slicing
+        its bytes from the memory-mapped file when available.
 
-        Reads node properties using the column mapping discovered during scanning and
-        yields a ``Frame`` object containing the raw data.
+        Reads the node block in a single call, selecting the type and position
+        columns with the mapping discovered during scanning and keeping only the lines
+        of the types listed in ``clustering.node_types``, and yields a ``Frame``
+        whose raw data holds a symbol array of shape (N,) and a float64 position
+        array of shape (N, 3).
 
         Args:
             frame_id (int): Zero-based index of the frame to parse.
@@ -154,9 +332,7 @@ class LAMMPSReader(BaseReader):
 
         frame_index = self.frame_indices[frame_id]
         
-        with open(self.filename, 'r') as f:
-            f.seek(frame_index.byte_offset)
-        
+        with self.open_frame(frame_id) as f:
             num_nodes = frame_index.num_nodes
             lattice = frame_index.lattice
 
@@ -168,29 +344,27 @@ class LAMMPSReader(BaseReader):
             c_x = self.columns['x']
             c_y = self.columns['y']
             c_z = self.columns['z']
-            
-            symbols = []
-            positions = []
-            # Read node lines
-            for _ in range(num_nodes):
-                node_line = f.readline().strip()
-                try:
-                    parts = node_line.split()
-                    symbol = parts[c_type]
-                    x = float(parts[c_x])
-                    y = float(parts[c_y])
-                    z = float(parts[c_z])
-                    symbols.append(symbol)
-                    positions.append(np.array([x, y, z]))
-                except ValueError:
-                    raise ValueError("Node line must have 4 values: symbol, x, y, z")
+
+            # Read all node lines at once and convert whole columns
+            try:
+                symbols, positions = self.read_node_block(
+                    f,
+                    num_nodes,
+                    (c_type, c_x, c_y, c_z),
+                    self._settings.clustering.node_types,
+                )
+            except ValueError:
+                raise ValueError("Node line must have 4 values: symbol, x, y, z")
 
             data = {
                 'symbol': symbols,
                 'position': positions
             }
-            
-            yield Frame(frame_id=frame_id, _data=data, lattice=lattice, nodes=[])
-                
-                
 
+            yield Frame(
+                frame_id=frame_id,
+                _data=data,
+                lattice=lattice,
+                nodes=[],
+                _settings=self._settings,
+            )
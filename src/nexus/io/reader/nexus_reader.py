@@ -0,0 +1,196 @@
+from typing import Dict, Generator, List
+import numpy as np
+import struct
+import json
+import mmap
+import os
+
+from .base_reader import BaseReader, FrameIndex
+from ...core.frame import Frame
+from ...config.settings import Settings
+
+# Magic bytes found at the start and at the end of a Nexus trajectory file
+NEXUS_MAGIC = b"NXTRAJ01"
+
+# Trailer layout: footer byte offset, metadata length, magic bytes
+NEXUS_TRAILER = struct.Struct("<qq8s")
+
+# Dtypes of the per-frame columns
+NEXUS_POSITION_DTYPE = np.dtype("<f8")
+NEXUS_TYPE_DTYPE = np.dtype("<u2")
+
+
+def nexus_block_size(num_nodes: int) -> int:
+    """
+    Return the size in bytes of the data block of a frame, padding included.
+
+    A block holds the (N, 3) float64 positions followed by the (N,) uint16 type
+    codes, padded to a multiple of 8 bytes so that every block stays aligned.
+
+    Args:
+        num_nodes (int): Number of nodes stored in the frame.
+
+    Returns:
+        int: Size of the block in bytes.
+    """
+    size = num_nodes * (3 * NEXUS_POSITION_DTYPE.itemsize + NEXUS_TYPE_DTYPE.itemsize)
+    return (size + 7) // 8 * 8
+
+
+class NexusReader(BaseReader):
+    """
+    Reader for the Nexus-native columnar binary trajectory format (``.nxtraj``).
+
+    Files are written once from a text trajectory by ``TrajectoryWriter`` (or
+    ``nexus convert``) and only hold the species selected at conversion time.
+    The file is always memory-mapped: the frame table is read from the footer
+    without scanning, and parsed frames receive read-only position arrays that
+    are views of the map, so no data is decoded or copied.
+
+    File layout (little-endian)::
+
+        NXTRAJ01                          magic bytes
+        frame blocks                      positions float64 (N, 3), types uint16 (N,),
+                                          padded to 8 bytes
+        footer                            num_nodes int64 (F,), offsets int64 (F,),
+                                          lattices float64 (F, 3, 3), JSON metadata
+        trailer                           footer offset int64, metadata length int64,
+                                          NXTRAJ01
+
+    Attributes:
+        symbols (np.ndarray): Symbol of each type code stored in the file.
+        metadata (Dict): Metadata written at conversion time (source file, species).
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """
+        Initialize the Nexus trajectory reader.
+
+        Args:
+            settings (Settings): Configuration settings.
+        """
+        super().__init__(settings)
+        self.symbols: np.ndarray = np.empty(0, dtype=str)
+        self.metadata: Dict = {}
+
+    def detect(self, filepath: str) -> bool:
+        """
+        Check whether the file has the ``.nxtraj`` extension.
+
+        Args:
+            filepath (str): Path to the file to test.
+
+        Returns:
+            bool: True if the file ends with ``.nxtraj``.
+        """
+        return filepath.lower().endswith(".nxtraj")
+
+    def scan(self) -> List[FrameIndex]:
+        """
+        Map the file and load the frame table stored in its footer.
+
+        Returns:
+            List[FrameIndex]: Indexed frame metadata for every frame in the file.
+
+        Raises:
+            IOError: If the file is not a valid Nexus trajectory.
+        """
+        self.frame_indices = []
+        self.frame_offsets = []
+        self.frame_sizes = []
+        self.num_frames = 0
+
+        size = os.path.getsize(self.filename)
+        if size < len(NEXUS_MAGIC) + NEXUS_TRAILER.size:
+            raise IOError(f"{self.filename} is too small to be a Nexus trajectory")
+        self.close()
+        with open(self.filename, "rb") as f:
+            self.mmaped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mm = self.mmaped_file
+
+        footer_offset, metadata_length, magic = NEXUS_TRAILER.unpack_from(
+            mm, size - NEXUS_TRAILER.size
+        )
+        if mm[: len(NEXUS_MAGIC)] != NEXUS_MAGIC or magic != NEXUS_MAGIC:
+            raise IOError(f"{self.filename} is not a Nexus trajectory")
+
+        metadata_offset = size - NEXUS_TRAILER.size - metadata_length
+        try:
+            self.metadata = json.loads(mm[metadata_offset : metadata_offset + metadata_length])
+        except ValueError as e:
+            raise IOError(f"Invalid metadata in Nexus trajectory {self.filename}: {e}")
+        self.symbols = np.array(self.metadata["symbols"], dtype=str)
+
+        num_frames = self.metadata["num_frames"]
+        num_nodes = np.frombuffer(mm, dtype="<i8", count=num_frames, offset=footer_offset)
+        offsets = np.frombuffer(
+            mm, dtype="<i8", count=num_frames, offset=footer_offset + 8 * num_frames
+        )
+        lattices = np.frombuffer(
+            mm, dtype="<f8", count=9 * num_frames, offset=footer_offset + 16 * num_frames
+        ).reshape(num_frames, 3, 3)
+
+        for i in range(num_frames):
+            n = int(num_nodes[i])
+            self._index_frame(n, lattices[i].copy(), int(offsets[i]), nexus_block_size(n))
+
+        if self.verbose:
+            print(f"Loaded {self.num_frames} frames from {self.filename}")
+
+        self.is_indexed = True
+        return self.frame_indices
+
+    def parse(self, frame_id: int) -> Generator[Frame, None, None]:
+        """
+        Yield a frame whose raw data are views of the memory-mapped file.
+
+        Positions are returned as a read-only (N, 3) view of the map. If the file
+        holds species that are not listed in ``clustering.node_types``, only the
+        selected nodes are kept, which requires a copy.
+
+        Args:
+            frame_id (int): Zero-based index of the frame to parse.
+
+        Yields:
+            Frame: A frame with raw node data and lattice information.
+        """
+        if not self.is_indexed or self.mmaped_file is None:
+            # Frames are views of the map, which close() released
+            self.scan()
+
+        frame_index = self.frame_indices[frame_id]
+        num_nodes = frame_index.num_nodes
+        offset = self.frame_offsets[frame_id]
+
+        positions = np.frombuffer(
+            self.mmaped_file,
+            dtype=NEXUS_POSITION_DTYPE,
+            count=3 * num_nodes,
+            offset=offset,
+        ).reshape(num_nodes, 3)
+        types = np.frombuffer(
+            self.mmaped_file,
+            dtype=NEXUS_TYPE_DTYPE,
+            count=num_nodes,
+            offset=offset + positions.nbytes,
+        )
+        symbols = self.symbols[types]
+
+        selected = np.isin(symbols, self._settings.clustering.node_types)
+        if not selected.all():
+            symbols = symbols[selected]
+            positions = positions[selected]
+
+        lattice = frame_index.lattice
+        if not self._settings.lattice.apply_custom_lattice:
+            self._settings.lattice.lattice = lattice
+        else:
+            lattice = self._settings.lattice.custom_lattice
+
+        yield Frame(
+            frame_id=frame_id,
+            _data={"symbol": symbols, "position": positions},
+            lattice=lattice,
+            nodes=[],
+            _settings=self._settings,
+        )
@@ -2,6 +2,8 @@ from typing import Optional
 from .base_reader import BaseReader
 from .xyz_reader import XYZReader
 from .lammps_reader import LAMMPSReader
+from .lammps_binary_reader import LAMMPSBinaryReader
+from .nexus_reader import NexusReader
 from ...config.settings import Settings
 import os
 
@@ -29,6 +31,8 @@ class ReaderFactory:
         self._settings = settings
         self.register_reader(XYZReader(settings))
         self.register_reader(LAMMPSReader(settings))
+        self.register_reader(LAMMPSBinaryReader(settings))
+        self.register_reader(NexusReader(settings))
 
     def register_reader(self, reader: BaseReader):
         """
@@ -38,7 +42,7 @@ class ReaderFactory:
             reader (BaseReader): The reader instance to register.
         """
         # Use a dummy filename with the correct extension to determine support
-        for ext in ['.xyz', '.lammpstrj', '.other']: #add your extensions here.
+        for ext in ['.xyz', '.lammpstrj', '.bin', '.nxtraj', '.other']: #add your extensions here.
             if reader.detect(f'dummy{ext}'):
                 self._readers[ext] = reader
                 break
@@ -48,6 +52,10 @@ class ReaderFactory:
         """
         Return the reader that supports the configured file.
 
+        The reader is selected from the extension of ``file_format`` when it is set,
+        which is needed for standard input (``file_location`` set to ``"-"``), and
+        from the extension of ``file_location`` otherwise.
+
         Returns:
             Optional[BaseReader]: The matching reader, or None if no reader supports
                 the file format.
@@ -55,10 +63,12 @@ class ReaderFactory:
         Raises:
             ValueError: If the file does not exist.
         """
-        if os.path.exists(self._settings.file_location):
-            for extension, reader in self._readers.items():
-                if reader.detect(self._settings.file_location):
-                    return reader
-        else:
-            raise ValueError(f"File {self._settings.file_location} does not exist.")
-        return None
\ No newline at end of file
+        file_location = self._settings.file_location
+        if file_location != "-" and not os.path.exists(file_location):
+            raise ValueError(f"File {file_location} does not exist.")
+        if self._settings.file_format:
+            file_location = f"dummy.{self._settings.file_format.lstrip('.')}"
+        for extension, reader in self._readers.items():
+            if reader.detect(file_location):
+                return reader
+        return None
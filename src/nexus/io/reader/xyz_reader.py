@@ -1,23 +1,21 @@
-from typing import List, Generator
-from collections import namedtuple
+from typing import List, Generator, Optional, Tuple
+from itertools import islice
 from colorama import Fore, Style
 import numpy as np
 import os
 
-from .base_reader import BaseReader
+from .base_reader import BaseReader, FrameIndex
+from .compressed_file import split_compression
 from ...core.frame import Frame
 from ...config.settings import Settings
 
-FrameIndex = namedtuple(
-    "FrameIndex", ["frame_id", "num_nodes", "lattice", "byte_offset"]
-)
-
 
 class XYZReader(BaseReader):
     """
     Reader for XYZ-format trajectory files.
 
-    Supports files with an extended XYZ header containing a ``Lattice="..."`` string.
+    Supports files with an extended XYZ header containing a ``Lattice="..."`` string,
+    uncompressed or compressed with gzip, bz2 or xz.
     Each frame consists of a node count line, a header/comment line with lattice
     information, and the node data lines.
     """
@@ -39,8 +37,10 @@ class XYZReader(BaseReader):
             filepath (str): Path to the file to test.
 
         Returns:
-            bool: True if the file ends with ``.xyz``.
+            bool: True if the file ends with ``.xyz``, optionally followed by ``.gz``,
+                ``.bz2``, ``.xz`` or ``.lzma``.
         """
+        filepath, _ = split_compression(filepath)
         return filepath.lower().endswith(".xyz")
 
     def scan(self) -> List[FrameIndex]:
@@ -48,7 +48,13 @@ class XYZReader(BaseReader):
         Scan the XYZ file and build an index of frame byte offsets.
 
         Reads the file sequentially, parsing each frame's header to extract the node
-        count and lattice matrix, and recording the byte offset for later seeking.
+        count and lattice matrix, and recording the byte offset and size of each
+        frame for later seeking. When ``memory_map`` is enabled, the file is mapped
+        and node lines are skipped by counting newlines on the mapped buffer. When
+        ``scan_workers`` is above 1, ``Lattice="..."`` header lines are located in
+        byte ranges of the file by worker processes (see ``BaseReader.scan_parallel``).
+        When ``save_frame_index`` is enabled, a still-valid sidecar index is loaded
+        instead of scanning, and a fresh scan is saved to the sidecar.
 
         Returns:
             List[FrameIndex]: Indexed frame metadata for every frame in the file.
@@ -57,56 +63,40 @@ class XYZReader(BaseReader):
             IOError: If a frame header is malformed or the file cannot be read.
         """
         self.frame_indices = []
+        self.frame_offsets = []
+        self.frame_sizes = []
         self.num_frames = 0
+        self.checkpoints = []
 
-        try:
-            with open(self.filename, "r") as f:
-                while True:
-                    # Record the starting position of the potential frame.
-                    frame_start_offset = f.tell()
-
-                    num_nodes_line = f.readline()
-                    if not num_nodes_line:
-                        break  # End of file
-
-                    header_line = f.readline()
-
-                    try:
-                        num_nodes = int(num_nodes_line.strip())
-
-                        # Extract lattice information from the header
-                        lattice_str = header_line.split('Lattice="')[1].split('"')[0]
-                        parts = [float(p) for p in lattice_str.split()]
-                        lattice = np.array(parts).reshape(3, 3)
-
-                    except (ValueError, IndexError) as e:
-                        # Provides more context if a header is malformed.
-                        raise IOError(
-                            f"Failed to parse frame header at byte offset {frame_start_offset} in {self.filename}. "
-                            f"Ensure all frames have a number of nodes and a valid Lattice string. Error: {e}"
-                        )
-
-                    # Skip the atomic data to find the next frame's header
-                    for _ in range(num_nodes):
-                        f.readline()
-
-                    # Store the indexed frame information.
-                    frame_index = FrameIndex(
-                        frame_id=self.num_frames,
-                        num_nodes=num_nodes,
-                        lattice=lattice,
-                        byte_offset=frame_start_offset,
-                    )
-                    self.frame_indices.append(frame_index)
-                    self.num_frames += 1
+        if self.load_index():
+            # The sidecar index is still valid, only map the file if requested
+            self.map_file()
+            if self.verbose:
+                print(f"Loaded frame index of {self.filename} from {self.index_path()}")
+            self.is_indexed = True
+            return self.frame_indices
 
+        try:
+            mapped = self.map_file()
+            if self._settings.follow:
+                # The file may still be written, leave a trailing partial frame out
+                self._scan_file(complete_only=True)
+            elif self._settings.scan_workers > 1 and self.compression is None:
+                self.scan_parallel(b'Lattice="', 1, 2)
+            elif mapped:
+                self._scan_mapped()
+            else:
+                self._scan_file()
         except FileNotFoundError:
             raise
         except Exception as e:
             # Catch other potential I/O errors
             raise IOError(f"Error scanning trajectory file {self.filename}: {e}")
 
+        self.save_index()
+
         if self.verbose:
+            num_nodes = self.frame_indices[-1].num_nodes if self.frame_indices else 0
             message = (
                 Fore.LIGHTBLUE_EX
                 + rf"""
@@ -122,12 +112,173 @@ class XYZReader(BaseReader):
         # to the correct position in the file to read a specific frame.
         return self.frame_indices
 
+    def _scan_file(self, start_offset: int = 0, complete_only: bool = False) -> None:
+        """
+        Index frames by reading the file line by line.
+
+        Args:
+            start_offset (int): Byte offset of the first frame to index.
+            complete_only (bool): Stop at the first frame with a line that is not
+                terminated by a newline yet instead of indexing it. Every line is
+                checked, since a line read while it is being written is returned in
+                two parts by consecutive reads.
+        """
+        with self.open_text() as f:
+            f.seek(start_offset)
+            while True:
+                # Record the starting position of the potential frame.
+                frame_start_offset = f.tell()
+
+                num_nodes_line = f.readline()
+                if not num_nodes_line:
+                    break  # End of file
+
+                header_line = f.readline()
+                if complete_only and not (
+                    num_nodes_line.endswith("\n") and header_line.endswith("\n")
+                ):
+                    break  # Header still being written
+                num_nodes, lattice = self._parse_header(
+                    [num_nodes_line, header_line], frame_start_offset
+                )
+
+                # Skip the atomic data to find the next frame's header
+                if complete_only:
+                    if not self._skip_complete_lines(f, num_nodes):
+                        break  # Node block still being written
+                else:
+                    for _ in range(num_nodes):
+                        f.readline()
+
+                self._index_frame(
+                    num_nodes, lattice, frame_start_offset, f.tell() - frame_start_offset
+                )
+
+    def _scan_mapped(self) -> None:
+        """Index frames by counting newlines on the memory-mapped file."""
+        size = len(self.mmaped_file)
+        frame_start_offset = 0
+        while frame_start_offset < size:
+            num_nodes_line, offset = self.read_mapped_line(frame_start_offset)
+            header_line, offset = self.read_mapped_line(offset)
+            num_nodes, lattice = self._parse_header(
+                [num_nodes_line, header_line], frame_start_offset
+            )
+
+            # Jump over the atomic data to the next frame's header
+            offset = self.skip_mapped_lines(offset, num_nodes)
+
+            self._index_frame(
+                num_nodes, lattice, frame_start_offset, offset - frame_start_offset
+            )
+            frame_start_offset = offset
+
+    def _parse_header(
+        self, header_lines: List[str], frame_start_offset: Optional[int]
+    ) -> Tuple[int, np.ndarray]:
+        """
+        Extract the node count and lattice matrix from the two header lines of a frame.
+
+        Args:
+            header_lines (List[str]): The node count line and the comment line holding
+                the ``Lattice="..."`` string.
+            frame_start_offset (Optional[int]): Byte offset of the frame, used in
+                error messages, or None for a frame read from a stream.
+
+        Returns:
+            Tuple[int, np.ndarray]: The node count and the 3x3 lattice matrix.
+
+        Raises:
+            IOError: If the header is malformed.
+        """
+        num_nodes_line, header_line = header_lines
+        try:
+            num_nodes = int(num_nodes_line.strip())
+
+            # Extract lattice information from the header
+            lattice_str = header_line.split('Lattice="')[1].split('"')[0]
+            parts = [float(p) for p in lattice_str.split()]
+            lattice = np.array(parts).reshape(3, 3)
+
+        except (ValueError, IndexError) as e:
+            # Provides more context if a header is malformed.
+            if frame_start_offset is None:
+                location = f"of frame {self.num_frames} of the stream"
+            else:
+                location = f"at byte offset {frame_start_offset}"
+            raise IOError(
+                f"Failed to parse frame header {location} in {self.filename}. "
+                f"Ensure all frames have a number of nodes and a valid Lattice string. Error: {e}"
+            )
+        return num_nodes, lattice
+
+    def iter_stream(
+        self, start_frame: int = 0, end_frame: int = -1
+    ) -> Generator[Frame, None, None]:
+        """
+        Yield the frames of a non-seekable XYZ stream as they arrive, in a single pass.
+
+        Each frame is parsed from its two header lines and node block exactly as in
+        ``parse()``, but read straight from the stream without an index.
+
+        Args:
+            start_frame (int): Zero-based index of the first frame to yield.
+            end_frame (int): Index of the last frame to yield, or -1 for all frames.
+
+        Yields:
+            Frame: The next frame of the stream.
+
+        Raises:
+            IOError: If a frame header is malformed.
+            ValueError: If a node block is truncated or malformed.
+        """
+        self.num_frames = 0
+        with self.open_stream() as f:
+            while end_frame == -1 or self.num_frames <= end_frame:
+                num_nodes_line = f.readline()
+                if not num_nodes_line.strip():
+                    break  # End of stream
+                header_line = f.readline()
+                num_nodes, lattice = self._parse_header(
+                    [num_nodes_line, header_line], None
+                )
+                frame_id = self.num_frames
+                self.num_frames += 1
+
+                if frame_id < start_frame:
+                    # Consume the node lines of a frame before the range
+                    next(islice(f, num_nodes, num_nodes), None)
+                    continue
+
+                if not self._settings.lattice.apply_custom_lattice:
+                    self._settings.lattice.lattice = lattice
+                else:
+                    lattice = self._settings.lattice.custom_lattice
+
+                try:
+                    symbols, positions = self.read_node_block(
+                        f, num_nodes, (0, 1, 2, 3), self._settings.clustering.node_types
+                    )
+                except ValueError as e:
+                    raise ValueError(f"Frame {frame_id} of the stream: {e}")
+
+                yield Frame(
+                    frame_id=frame_id,
+                    _data={"symbol": symbols, "position": positions},
+                    lattice=lattice,
+                    nodes=[],
+                    _settings=self._settings,
+                )
+
     def parse(self, frame_id: int) -> Generator[Frame, None, None]:
         """
-        Parse a specific frame by seeking to its indexed byte offset.
+        Parse a specific frame by seeking to its indexed byte offset, or by slicing
+        its bytes from the memory-mapped file when available.
 
-        Reads the node symbols and Cartesian positions for the requested frame and
-        yields a ``Frame`` object containing the raw data.
+        Reads the node block of the requested frame in a single call, keeping only the
+        lines of the species listed in ``clustering.node_types``, and yields a
+        ``Frame`` whose raw data holds a symbol array of shape (N,) and a contiguous
+        float64 position array of shape (N, 3).
 
         Args:
             frame_id (int): Zero-based index of the frame to parse.
@@ -140,9 +291,7 @@ class XYZReader(BaseReader):
 
         frame_index = self.frame_indices[frame_id]
 
-        with open(self.filename, "r") as f:
-            f.seek(frame_index.byte_offset)
-
+        with self.open_frame(frame_id) as f:
             num_nodes = frame_index.num_nodes
             lattice = frame_index.lattice
             # update lattice in settings
@@ -156,20 +305,13 @@ class XYZReader(BaseReader):
             f.readline()
             f.readline()
 
-            symbols = []
-            positions = []
-            # Read node lines
-            for _ in range(num_nodes):
-                node_line = f.readline().strip()
-                try:
-                    parts = node_line.split()
-                    symbol = parts[0]
-                    x, y, z = map(float, parts[1:4])
-
-                    symbols.append(symbol)
-                    positions.append(np.array([x, y, z]))
-                except ValueError:
-                    raise ValueError("Node line must have 4 values: symbol, x, y, z")
+            # Read all node lines at once and convert whole columns
+            try:
+                symbols, positions = self.read_node_block(
+                    f, num_nodes, (0, 1, 2, 3), self._settings.clustering.node_types
+                )
+            except ValueError:
+                raise ValueError("Node line must have 4 values: symbol, x, y, z")
 
             data = {"symbol": symbols, "position": positions}
 
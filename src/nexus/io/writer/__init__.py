@@ -8,7 +8,9 @@
 #       - add support for performance writers
 
 from .clusters_writer import ClustersWriter
+from .trajectory_writer import TrajectoryWriter
 
 __all__ = [
-    'ClustersWriter'
+    'ClustersWriter',
+    'TrajectoryWriter'
 ]
\ No newline at end of file
@@ -0,0 +1,133 @@
+from typing import Dict, List, Optional
+import numpy as np
+import json
+import os
+
+from .base_writer import BaseWriter
+from ..reader.reader_factory import ReaderFactory
+from ..reader.nexus_reader import (
+    NEXUS_MAGIC,
+    NEXUS_TRAILER,
+    NEXUS_POSITION_DTYPE,
+    NEXUS_TYPE_DTYPE,
+    nexus_block_size,
+)
+from ...core.system import System
+from ...config.settings import Settings
+
+
+class TrajectoryWriter(BaseWriter):
+    """
+    Converts a trajectory into the Nexus-native columnar binary format (``.nxtraj``).
+
+    The source trajectory is read once with the reader selected by ``ReaderFactory``
+    over ``range_of_frames``. Only the species listed in ``clustering.node_types``
+    are stored. The resulting file is read by ``NexusReader`` without any parsing,
+    so repeated analyses of the same trajectory skip the text decoding entirely.
+    """
+
+    def __init__(self, settings: Settings, output_path: Optional[str] = None) -> None:
+        """
+        Initialize the trajectory writer.
+
+        Args:
+            settings (Settings): Configuration settings, with ``file_location`` set
+                to the trajectory to convert.
+            output_path (Optional[str]): Path of the converted file. Defaults to the
+                trajectory path with its extension replaced by ``.nxtraj``, and is
+                required when reading standard input.
+
+        Raises:
+            ValueError: If standard input is read without an output path.
+        """
+        super().__init__(settings)
+        self._settings: Settings = settings
+        if output_path is None:
+            if settings.file_location == "-":
+                raise ValueError("An output path is required to convert standard input")
+            output_path = os.path.splitext(settings.file_location)[0] + ".nxtraj"
+        self.output_path: str = output_path
+
+    def write(self) -> None:
+        """
+        Convert the configured trajectory and write it to ``output_path``.
+
+        Frames are streamed to a temporary file that is moved into place once the
+        footer is written, so an interrupted conversion never leaves a truncated
+        ``.nxtraj`` file behind.
+
+        Raises:
+            ValueError: If no reader supports the trajectory, or if it holds more
+                species than the format can encode.
+        """
+        output_path = self.output_path
+        reader = ReaderFactory(self._settings).get_reader()
+        if reader is None:
+            raise ValueError(
+                f"No reader supports the trajectory {self._settings.file_location}"
+            )
+        system = System(reader, self._settings)
+        source = self._settings.file_location
+        if source != "-":
+            source = os.path.abspath(source)
+
+        node_types = self._settings.clustering.node_types
+        codes: Dict[str, int] = {}
+        num_nodes: List[int] = []
+        offsets: List[int] = []
+        lattices: List[np.ndarray] = []
+
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(NEXUS_MAGIC)
+                for frame in system.iter_frames():
+                    symbols = np.asarray(frame._data["symbol"])
+                    positions = np.asarray(frame._data["position"])
+                    selected = np.isin(symbols, node_types)
+                    symbols = symbols[selected]
+                    positions = np.ascontiguousarray(
+                        positions[selected], dtype=NEXUS_POSITION_DTYPE
+                    )
+
+                    # Encode symbols with codes shared by all frames of the file
+                    unique, inverse = np.unique(symbols, return_inverse=True)
+                    unique_codes = np.array(
+                        [codes.setdefault(str(s), len(codes)) for s in unique],
+                        dtype=np.int64,
+                    )
+                    if len(codes) > np.iinfo(NEXUS_TYPE_DTYPE).max + 1:
+                        raise ValueError("Too many species to encode in a Nexus trajectory")
+                    types = unique_codes[inverse.ravel()].astype(NEXUS_TYPE_DTYPE)
+
+                    offsets.append(f.tell())
+                    num_nodes.append(len(symbols))
+                    lattices.append(np.asarray(frame.lattice, dtype=np.float64))
+                    f.write(positions.tobytes())
+                    f.write(types.tobytes())
+                    padding = nexus_block_size(len(symbols)) - positions.nbytes - types.nbytes
+                    f.write(b"\0" * padding)
+
+                footer_offset = f.tell()
+                f.write(np.array(num_nodes, dtype="<i8").tobytes())
+                f.write(np.array(offsets, dtype="<i8").tobytes())
+                f.write(np.array(lattices, dtype="<f8").reshape(-1, 9).tobytes())
+                metadata = json.dumps(
+                    {
+                        "num_frames": len(offsets),
+                        "symbols": list(codes),
+                        "node_types": list(node_types),
+                        "source": source,
+                        "range_of_frames": list(self._settings.range_of_frames),
+                    }
+                ).encode()
+                f.write(metadata)
+                f.write(NEXUS_TRAILER.pack(footer_offset, len(metadata), NEXUS_MAGIC))
+            os.replace(tmp_path, output_path)
+        finally:
+            reader.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        if self._settings.verbose:
+            print(f"Converted {len(offsets)} frames of {self._settings.file_location} to {output_path}")
@@ -3,6 +3,7 @@ from .base_writer import BaseWriter
 from .clusters_writer import ClustersWriter
 from .logs_writer import LogsWriter
 from .performance_writer import PerformanceWriter
+from .trajectory_writer import TrajectoryWriter
 from ...config.settings import Settings
 
 
@@ -30,6 +31,7 @@ class WriterFactory:
         self.register_writer(ClustersWriter)
         self.register_writer(LogsWriter)
         self.register_writer(PerformanceWriter)
+        self.register_writer(TrajectoryWriter)
 
     def register_writer(self, writer: BaseWriter):
         """
@@ -58,5 +60,7 @@ class WriterFactory:
             return LogsWriter(self._settings)
         elif name == "PerformanceWriter":
             return PerformanceWriter(self._settings)
+        elif name == "TrajectoryWriter":
+            return TrajectoryWriter(self._settings)
         else:
             return None
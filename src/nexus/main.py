@@ -10,12 +10,28 @@ from .config.settings import Settings
 from .io.reader.reader_factory import ReaderFactory
 from .core.system import System
 from .analysis.strategy_factory import StrategyFactory
+from .analysis.strategies.search.verlet_list import VerletList
 from .analysis.analyzer_factory import AnalyzerFactory
 from .io.writer.writer_factory import WriterFactory
 from .utils import *
 from .version import __version__
 
 
+def _prepare_frame(frame, settings: Settings) -> None:
+    """
+    Apply the custom lattice and build the node list of a freshly parsed frame.
+
+    Args:
+        frame (Frame): Frame yielded by the system.
+        settings (Settings): Settings of the run.
+    """
+    if settings.lattice.apply_custom_lattice:
+        frame.set_lattice(settings.lattice.custom_lattice)
+
+    # Initialize nodes
+    frame.initialize_nodes()
+
+
 def main(settings: Settings):
     """
     Run the full analysis pipeline.
@@ -64,6 +80,8 @@ def main(settings: Settings):
     scan_start = time.time()
     try:
         reader = ReaderFactory(settings).get_reader()
+        if reader is None:
+            raise ValueError("unsupported file format")
         reader.set_verbose(settings.verbose)
         system = System(reader, settings)
     except (FileNotFoundError, ValueError, OSError) as e:
@@ -79,6 +97,16 @@ def main(settings: Settings):
     # Resolve frame range (replace -1 sentinels with concrete indices)
     start_frame, end_frame = settings.resolve_frame_range(system.get_num_frames())
     total = end_frame - start_frame + 1
+    description = f"Processing frames ({start_frame}, {end_frame})..."
+    frames = None
+    if settings.follow:
+        frames = lambda stop: system.follow_frames(
+            settings.follow_poll_interval, settings.follow_timeout, stop=stop
+        )
+    if (settings.follow or reader.is_stream) and settings.range_of_frames[1] == -1:
+        # Frames keep arriving, the last one is not known in advance
+        total = None
+        description = f"Processing frames ({start_frame}, ...)..."
 
     # Initialize analyzers
     analyzers = []
@@ -93,15 +121,25 @@ def main(settings: Settings):
         "colour": "red",
     }
 
+    prefetched_frames = system.prefetch_frames(
+        settings.prefetch_depth,
+        prepare=lambda frame: _prepare_frame(frame, settings),
+        frames=frames,
+    )
     progress_bar = tqdm(
-        enumerate(system.iter_frames()),
-        desc=f"Processing frames ({start_frame}, {end_frame})...",
+        enumerate(prefetched_frames),
+        desc=description,
         unit="frame",
         initial=start_frame,
         total=total,
         **progress_bar_kwargs,
     )
 
+    # Candidate pairs reused across frames within the Verlet skin
+    verlet_list = None
+    if settings.clustering.verlet_skin > 0:
+        verlet_list = VerletList(settings.clustering.verlet_skin)
+
     # Track per-frame metrics
     frame_times = []
     neighbor_times = []
@@ -110,69 +148,79 @@ def main(settings: Settings):
     number_nodes = []
 
     # Read and process frames
-    for i, frame in progress_bar:
-        frame_start = time.time()
-
-        if settings.lattice.apply_custom_lattice:
-            frame.set_lattice(settings.lattice.custom_lattice)
-
-        # Initialize nodes
-        frame.initialize_nodes()
-        # Find neighbors
-        neighbor_start = time.time()
-        strategy = StrategyFactory(frame, settings).get_strategy(settings)
-        strategy.find_neighbors()
-        neighbor_end = time.time()
-        neighbor_times.append((neighbor_end - neighbor_start) * 1000)
-
-        # Find clusters
-        cluster_start = time.time()
-        connectivities = strategy.get_connectivities()
-        clusters = strategy.build_clusters()
-        frame.set_clusters(clusters)
-        frame.set_connectivities(connectivities)
-        cluster_end = time.time()
-        cluster_times.append((cluster_end - cluster_start) * 1000)
-
-        # Analyze clusters
-        analysis_start = time.time()
-        for analyzer in analyzers:
-            analyzer.analyze(frame, connectivities)
-        analysis_end = time.time()
-        analysis_times.append((analysis_end - analysis_start) * 1000)
-
-        # Print clusters
-        if settings.clustering.with_printed_unwrapped_clusters:
-            writer = WriterFactory(settings).get_writer("ClustersWriter")
-            writer.set_clusters(frame.get_clusters())
-            writer.write()
-
-        frame_end = time.time()
-        frame_times.append((frame_end - frame_start) * 1000)
-
-        number_nodes.append(len(frame))
-
-        # Record per-frame performance
-        if i % 10 == 0 or i == total - 1:  # Record every 10 frames or the last frame
-            current_memory = process.memory_info().rss / (1024 * 1024)
-            cpu_percent = process.cpu_percent()
-
-            perf.execution_time_ms = frame_times[-1]
-            perf.memory_usage_mb = current_memory
-            perf.cpu_usage_percent = cpu_percent
-            perf.add_metric("frame_number", i)
-            perf.add_metric("neighbor_finding_time_ms", neighbor_times[-1])
-            perf.add_metric("cluster_finding_time_ms", cluster_times[-1])
-            perf.add_metric("analysis_time_ms", analysis_times[-1])
-            perf.add_metric("number_nodes", number_nodes[-1])
-            perf.record_history()
-
-            if settings.save_performance:
-                perf_writer = WriterFactory(settings).get_writer("PerformanceWriter")
-                perf_writer.write(perf)
-
-    # Print results
+    try:
+        for i, frame in progress_bar:
+            frame_start = time.time()
+
+            # Find neighbors
+            neighbor_start = time.time()
+            strategy = StrategyFactory(frame, settings, verlet_list).get_strategy(settings)
+            strategy.find_neighbors()
+            neighbor_end = time.time()
+            neighbor_times.append((neighbor_end - neighbor_start) * 1000)
+
+            # Find clusters
+            cluster_start = time.time()
+            connectivities = strategy.get_connectivities()
+            clusters = strategy.build_clusters()
+            frame.set_clusters(clusters)
+            frame.set_connectivities(connectivities)
+            cluster_end = time.time()
+            cluster_times.append((cluster_end - cluster_start) * 1000)
+
+            # Analyze clusters
+            analysis_start = time.time()
+            for analyzer in analyzers:
+                analyzer.analyze(frame, connectivities)
+            analysis_end = time.time()
+            analysis_times.append((analysis_end - analysis_start) * 1000)
+
+            # Print clusters
+            if settings.clustering.with_printed_unwrapped_clusters:
+                writer = WriterFactory(settings).get_writer("ClustersWriter")
+                writer.set_clusters(frame.get_clusters())
+                writer.write()
+
+            frame_end = time.time()
+            frame_times.append((frame_end - frame_start) * 1000)
+
+            number_nodes.append(len(frame))
+
+            # Record per-frame performance
+            if i % 10 == 0 or (total is not None and i == total - 1):  # Record every 10 frames or the last frame
+                current_memory = process.memory_info().rss / (1024 * 1024)
+                cpu_percent = process.cpu_percent()
+
+                perf.execution_time_ms = frame_times[-1]
+                perf.memory_usage_mb = current_memory
+                perf.cpu_usage_percent = cpu_percent
+                perf.add_metric("frame_number", i)
+                perf.add_metric("neighbor_finding_time_ms", neighbor_times[-1])
+                perf.add_metric("cluster_finding_time_ms", cluster_times[-1])
+                perf.add_metric("analysis_time_ms", analysis_times[-1])
+                perf.add_metric("number_nodes", number_nodes[-1])
+                perf.record_history()
+
+                if settings.save_performance:
+                    perf_writer = WriterFactory(settings).get_writer("PerformanceWriter")
+                    perf_writer.write(perf)
+
+            # Write intermediate results over the frames processed so far
+            if settings.flush_interval and (i + 1) % settings.flush_interval == 0:
+                for analyzer in analyzers:
+                    analyzer.flush()
+    except KeyboardInterrupt:
+        if not settings.follow:
+            raise
+        # Following ends on interruption, the processed frames are still reported
+    finally:
+        # Stop reading ahead, also when interrupted, and release the trajectory map
+        prefetched_frames.close()
+        reader.close()
+
+    # Print results, replacing those written by intermediate flushes
     for analyzer in analyzers:
+        analyzer.restore_outputs()
         analyzer.print_to_file()
 
     # Record overall performance metrics
@@ -184,7 +232,7 @@ def main(settings: Settings):
     perf.execution_time_ms = total_time_ms
     perf.memory_usage_mb = final_memory
     perf.cpu_usage_percent = process.cpu_percent()
-    perf.add_metric("total_frames_processed", total)
+    perf.add_metric("total_frames_processed", len(frame_times))
     perf.add_metric("memory_increase_mb", memory_increase)
     perf.add_metric(
         "avg_frame_time_ms", sum(frame_times) / len(frame_times) if frame_times else 0
@@ -202,6 +202,22 @@ def fractional_to_cartesian(position: np.ndarray, lattice: np.ndarray) -> np.nda
     """
     return np.dot(position, lattice)
 
+def calculate_lattice_widths(lattice: np.ndarray) -> np.ndarray:
+    """
+    Compute the distance between opposite faces of the simulation cell.
+
+    For each lattice vector, this is the extent of the cell perpendicular to the
+    plane of the two other vectors. A displacement of length ``r`` changes the
+    fractional coordinate along axis ``a`` by at most ``r / widths[a]``.
+
+    Args:
+        lattice (np.ndarray): 3x3 lattice matrix defining the simulation cell.
+
+    Returns:
+        np.ndarray: Perpendicular width of the cell along each lattice vector.
+    """
+    return 1.0 / np.linalg.norm(np.linalg.inv(lattice), axis=0)
+
 @jit(nopython=True, cache=True, fastmath=True)
 def calculate_gyration_radius(positions: np.ndarray, center_of_mass: np.ndarray) -> float:
     """
@@ -0,0 +1,39 @@
+import pytest
+
+import nexus.config.settings as c
+from nexus import SettingsBuilder
+
+
+@pytest.fixture
+def make_settings(tmp_path):
+    """Return a factory of SiO2 settings reading ``file_location``."""
+
+    def make(file_location, **general):
+        general_settings = c.GeneralSettings(
+            project_name="test",
+            export_directory=str(tmp_path / "outputs"),
+            file_location=str(file_location),
+            range_of_frames=(0, -1),
+            apply_pbc=True,
+            **general,
+        )
+        clustering_settings = c.ClusteringSettings(
+            criterion="distance",
+            node_types=["Si", "O"],
+            node_masses=[28.0855, 15.9994],
+            connectivity=["Si", "Si"],
+            cutoffs=[
+                c.Cutoff(type1="Si", type2="Si", distance=3.50),
+                c.Cutoff(type1="Si", type2="O", distance=2.30),
+                c.Cutoff(type1="O", type2="O", distance=3.05),
+            ],
+        )
+        return (
+            SettingsBuilder()
+            .with_general(general_settings)
+            .with_clustering(clustering_settings)
+            .with_analysis(c.AnalysisSettings())
+            .build()
+        )
+
+    return make
@@ -0,0 +1,55 @@
+import numpy as np
+
+from nexus.io.reader.reader_factory import ReaderFactory
+from nexus.io.writer.trajectory_writer import TrajectoryWriter
+
+FRAME = """2
+Lattice="10.0 0.0 0.0 0.0 10.0 0.0 0.0 0.0 10.0"
+Si 1.0 1.0 1.0
+O 2.0 1.0 1.0
+"""
+
+
+def test_remapping_closes_previous_map(tmp_path, make_settings):
+    path = tmp_path / "trajectory.xyz"
+    path.write_text(FRAME * 2)
+    reader = ReaderFactory(make_settings(path, memory_map=True, follow=True)).get_reader()
+    reader.filename = str(path)
+    reader.scan()
+    mapped = reader.mmaped_file
+    assert mapped is not None
+
+    with open(path, "a") as f:
+        f.write(FRAME)
+    assert reader.update() == 1
+    assert mapped.closed
+    assert len(reader.mmaped_file) == 3 * len(FRAME)
+
+    mapped = reader.mmaped_file
+    reader.close()
+    assert mapped.closed and reader.mmaped_file is None
+    # Frames are read from the file once the map is closed
+    frame = next(reader.parse(2))
+    frame.initialize_nodes()
+    np.testing.assert_array_equal(frame.positions, [[1.0, 1.0, 1.0], [2.0, 1.0, 1.0]])
+
+
+def test_close_with_frames_viewing_the_map(tmp_path, make_settings):
+    path = tmp_path / "trajectory.xyz"
+    path.write_text(FRAME * 2)
+    settings = make_settings(path)
+    writer = TrajectoryWriter(settings)
+    writer.write()
+
+    reader = ReaderFactory(make_settings(writer.output_path)).get_reader()
+    reader.filename = writer.output_path
+    reader.scan()
+    frame = next(reader.parse(0))
+    # The positions of the frame are a view of the map, which stays valid
+    reader.close()
+    assert reader.mmaped_file is None
+    np.testing.assert_array_equal(frame._data["position"][0], [1.0, 1.0, 1.0])
+
+    # The file is mapped again when a frame is parsed after close()
+    frame = next(reader.parse(1))
+    np.testing.assert_array_equal(frame._data["position"][1], [2.0, 1.0, 1.0])
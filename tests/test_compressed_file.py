@@ -0,0 +1,91 @@
+import bz2
+import gzip
+import io
+import lzma
+import random
+
+import pytest
+
+from nexus.io.reader.compressed_file import CompressedFile
+
+COMPRESSORS = {
+    "gzip": lambda data: gzip.compress(data, mtime=0),
+    "bz2": bz2.compress,
+    "lzma": lzma.compress,
+}
+
+
+def make_data(seed, size):
+    rng = random.Random(seed)
+    lines = [
+        f"{rng.choice(['Si', 'O'])} {rng.random():.6f} {rng.random():.6f}\n"
+        for _ in range(size // 20 + 1)
+    ]
+    return "".join(lines).encode()
+
+
+@pytest.fixture(params=sorted(COMPRESSORS))
+def compressed(request, tmp_path):
+    """Write three concatenated streams and return the format, path and raw bytes."""
+    compression = request.param
+    parts = [make_data(i, size) for i, size in enumerate([400_000, 50, 100_000])]
+    path = tmp_path / "data.compressed"
+    with open(path, "wb") as f:
+        for part in parts:
+            f.write(COMPRESSORS[compression](part))
+        if compression == "gzip":
+            # Zero padding is allowed after gzip members
+            f.write(b"\0" * 16)
+    return compression, path, parts
+
+
+@pytest.mark.parametrize("interval", [1, 1 << 14, 1 << 24])
+def test_random_seek_and_read(compressed, interval):
+    compression, path, parts = compressed
+    raw = b"".join(parts)
+    checkpoints = []
+    rng = random.Random(interval)
+    # Wrapped as in BaseReader.open_text, since raw reads may return less data
+    raw_file = CompressedFile(str(path), compression, checkpoints, interval)
+    with io.BufferedReader(raw_file) as f:
+        for _ in range(100):
+            offset = rng.randrange(len(raw) + 10)
+            size = rng.choice([1, 17, 4096, 50_000])
+            assert f.seek(offset) == min(offset, len(raw))
+            assert f.read(size) == raw[offset : offset + size]
+            assert f.tell() == min(offset + size, len(raw))
+
+        assert f.seek(-5, io.SEEK_END) == len(raw) - 5
+        assert f.read() == raw[-5:]
+
+    # Stream starts are checkpoints for all formats, gzip also checkpoints inside
+    # its streams
+    starts = {c.uncompressed_offset for c in checkpoints if c.decompressor is None}
+    if interval == 1:
+        assert starts == {0, len(parts[0]), len(parts[0]) + len(parts[1])}
+    inside = [c for c in checkpoints if c.decompressor is not None]
+    assert bool(inside) == (compression == "gzip" and interval < len(raw))
+
+
+def test_checkpoints_shared_between_streams(compressed):
+    compression, path, parts = compressed
+    raw = b"".join(parts)
+    checkpoints = []
+    with io.BufferedReader(CompressedFile(str(path), compression, checkpoints, 1 << 12)) as f:
+        assert f.read() == raw
+    recorded = list(checkpoints)
+
+    # A second stream of the same file resumes from the recorded checkpoints
+    with io.BufferedReader(CompressedFile(str(path), compression, checkpoints, 1 << 12)) as f:
+        offset = len(raw) - 1000
+        f.seek(offset)
+        assert f.read(500) == raw[offset : offset + 500]
+    assert checkpoints == recorded
+
+
+def test_truncated_stream(tmp_path):
+    path = tmp_path / "data.gz"
+    path.write_bytes(gzip.compress(make_data(0, 10_000))[:-100])
+    with CompressedFile(str(path), "gzip", [], 1 << 12) as f:
+        with pytest.raises(EOFError):
+            f.read()
@@ -0,0 +1,93 @@
+import gzip
+
+import numpy as np
+import pytest
+
+from nexus.core.system import System
+from nexus.io.reader.reader_factory import ReaderFactory
+
+
+def xyz_frame(shift):
+    return (
+        "3\n"
+        'Lattice="10.0 0.0 0.0 0.0 10.0 0.0 0.0 0.0 10.0"\n'
+        f"Si {1.0 + shift:.4f} 1.0000 1.0000\n"
+        f"O {2.5 + shift:.4f} 1.0000 1.0000\n"
+        f"O {1.0 + shift:.4f} 2.5000 1.0000\n"
+    )
+
+
+def lammps_frame(shift):
+    return (
+        "ITEM: TIMESTEP\n0\nITEM: NUMBER OF ATOMS\n3\n"
+        "ITEM: BOX BOUNDS pp pp pp\n0.0 10.0\n0.0 10.0\n0.0 10.0\n"
+        "ITEM: ATOMS id type x y z\n"
+        f"1 Si {1.0 + shift:.4f} 1.0000 1.0000\n"
+        f"2 O {2.5 + shift:.4f} 1.0000 1.0000\n"
+        f"3 O {1.0 + shift:.4f} 2.5000 1.0000\n"
+    )
+
+
+def racing_open_text(reader, path, rest):
+    """Make ``reader`` append ``rest`` to the file right after reading a partial line."""
+    open_text = reader.open_text
+
+    def open_racing(*args, **kwargs):
+        f = open_text(*args, **kwargs)
+        readline = f.readline
+
+        def racing_readline(*readline_args):
+            line = readline(*readline_args)
+            if line and not line.endswith("\n") and rest:
+                with open(path, "a") as out:
+                    out.write(rest.pop())
+            return line
+
+        f.readline = racing_readline
+        return f
+
+    reader.open_text = open_racing
+
+
+@pytest.mark.parametrize(
+    "extension, make_frame", [("xyz", xyz_frame), ("lammpstrj", lammps_frame)]
+)
+def test_update_skips_line_completed_during_scan(
+    tmp_path, make_settings, extension, make_frame
+):
+    path = tmp_path / f"trajectory.{extension}"
+    frames = [make_frame(0.1 * i) for i in range(3)]
+    # The last frame is appended in two halves, split in the middle of its first
+    # node line
+    split = frames[2].index(" 1.0000 1.0000\n")
+    path.write_text(frames[0] + frames[1] + frames[2][:split])
+
+    reader = ReaderFactory(make_settings(path, follow=True)).get_reader()
+    reader.filename = str(path)
+    reader.scan()
+    assert reader.num_frames == 2
+
+    # The partial line is completed between two reads of the scan
+    racing_open_text(reader, path, [frames[2][split:]])
+    assert reader.update() == 0
+    assert reader.update() == 1
+    assert reader.frame_sizes == [len(frame) for frame in frames]
+
+    # Frames appended later are indexed from the right offset
+    with open(path, "a") as out:
+        out.write(make_frame(0.3))
+    assert reader.update() == 1
+    for i in range(4):
+        frame = next(reader.parse(i))
+        frame.initialize_nodes()
+        expected = np.array([1.0, 2.5, 1.0]) + 0.1 * i
+        np.testing.assert_allclose(frame.positions[:, 0], expected)
+
+
+def test_follow_rejects_compressed_file(tmp_path, make_settings):
+    path = tmp_path / "trajectory.xyz.gz"
+    with gzip.open(path, "wt") as f:
+        f.write(xyz_frame(0.0))
+    settings = make_settings(path, follow=True)
+    with pytest.raises(ValueError, match="cannot be followed"):
+        System(ReaderFactory(settings).get_reader(), settings)
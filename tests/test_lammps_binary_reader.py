@@ -0,0 +1,160 @@
+import struct
+
+import numpy as np
+import pytest
+
+from nexus.io.reader.lammps_binary_reader import LAMMPSBinaryReader
+from nexus.io.reader.lammps_reader import LAMMPSReader
+from nexus.io.reader.reader_factory import ReaderFactory
+
+BOUNDS = [(-1.0, 9.0), (0.5, 10.5), (2.0, 14.0)]
+NODE_TYPES = [1, 2, 1, 3, 2, 2, 1]
+
+
+def make_nodes(i):
+    """Return the types and Cartesian positions of the nodes of frame ``i``."""
+    rng = np.random.default_rng(i)
+    low = np.array([b[0] for b in BOUNDS])
+    high = np.array([b[1] for b in BOUNDS])
+    positions = low + rng.random((len(NODE_TYPES), 3)) * (high - low)
+    return np.array(NODE_TYPES), positions
+
+
+def lattice_of(tilt):
+    xy, xz, yz = tilt
+    (xlo, xhi), (ylo, yhi), (zlo, zhi) = BOUNDS
+    return np.array([[xhi - xlo, 0.0, 0.0], [xy, yhi - ylo, 0.0], [xz, yz, zhi - zlo]])
+
+
+def write_text_dump(path, num_frames):
+    """Write the frames as a text dump with unscaled ``x y z`` columns."""
+    with open(path, "w") as f:
+        for i in range(num_frames):
+            types, positions = make_nodes(i)
+            f.write(f"ITEM: TIMESTEP\n{100 * i}\nITEM: NUMBER OF ATOMS\n{len(types)}\n")
+            f.write("ITEM: BOX BOUNDS pp pp pp\n")
+            for low, high in BOUNDS:
+                f.write(f"{low!r} {high!r}\n")
+            f.write("ITEM: ATOMS id type x y z\n")
+            for j, (t, (x, y, z)) in enumerate(zip(types, positions)):
+                f.write(f"{j + 1} {t} {x:.17g} {y:.17g} {z:.17g}\n")
+
+
+def write_binary_dump(path, num_frames, revision, columns, num_chunks, tilt=None):
+    """
+    Write the frames as a binary dump, as written by ``dump ... binary``.
+
+    ``revision`` 0 writes the header of LAMMPS versions without the magic string.
+    Scaled columns (``xs``) are computed from the Cartesian positions, and columns
+    other than id, type and positions are filled with a constant.
+    """
+    with open(path, "wb") as f:
+        for i in range(num_frames):
+            types, positions = make_nodes(i)
+            (xlo, xhi), (ylo, yhi), (zlo, zhi) = BOUNDS
+            lattice = lattice_of(tilt or (0.0, 0.0, 0.0))
+            scaled = np.linalg.solve(lattice.T, (positions - [xlo, ylo, zlo]).T).T
+            values = {
+                "id": np.arange(1, len(types) + 1),
+                "type": types,
+                "q": np.full(len(types), -0.5),
+            }
+            for k, axis in enumerate("xyz"):
+                values[axis] = positions[:, k]
+                values[f"{axis}s"] = scaled[:, k]
+            data = np.column_stack([values[col] for col in columns]).astype("<f8")
+
+            if revision:
+                magic = b"DUMPCUSTOM"
+                f.write(struct.pack("<q", -len(magic)) + magic)
+                f.write(struct.pack("<ii", 1, revision))
+            f.write(struct.pack("<qqi", 100 * i, len(types), int(tilt is not None)))
+            f.write(struct.pack("<6i", 0, 0, 0, 0, 0, 0))
+            if tilt is None:
+                f.write(struct.pack("<6d", xlo, xhi, ylo, yhi, zlo, zhi))
+            else:
+                # Triclinic boxes store the bounding box of the tilted cell
+                xy, xz, yz = tilt
+                f.write(
+                    struct.pack(
+                        "<9d",
+                        xlo + min(0.0, xy, xz, xy + xz),
+                        xhi + max(0.0, xy, xz, xy + xz),
+                        ylo + min(0.0, yz),
+                        yhi + max(0.0, yz),
+                        zlo,
+                        zhi,
+                        *tilt,
+                    )
+                )
+            f.write(struct.pack("<i", len(columns)))
+            if revision > 1:
+                unit_style = b"metal"
+                f.write(struct.pack("<i", len(unit_style)) + unit_style)
+                f.write(struct.pack("<bd", 1, 0.5 * i))
+                names = " ".join(columns).encode()
+                f.write(struct.pack("<i", len(names)) + names)
+            f.write(struct.pack("<i", num_chunks))
+            for chunk in np.array_split(data, num_chunks):
+                f.write(struct.pack("<i", chunk.size) + chunk.tobytes())
+
+
+def read_frames(reader, path):
+    reader._settings.clustering.node_types = ["1", "2"]
+    reader.filename = str(path)
+    reader.scan()
+    frames = []
+    for i in range(reader.num_frames):
+        frame = next(reader.parse(i))
+        frame.initialize_nodes()
+        frames.append(frame)
+    return frames
+
+
+@pytest.mark.parametrize(
+    "revision, columns, num_chunks, tilt",
+    [
+        # Header without the magic string, 'dump atom' columns are implied
+        (0, ["id", "type", "xs", "ys", "zs"], 1, None),
+        # Magic string and revision 2 header with unit style, time and column names
+        (2, ["id", "type", "x", "y", "z"], 1, None),
+        # Nodes split over several chunks, one of them empty
+        (2, ["id", "type", "q", "x", "y", "z"], 8, None),
+        (2, ["type", "xs", "ys", "zs", "id"], 3, None),
+        # Triclinic box, with Cartesian and scaled coordinates
+        (2, ["id", "type", "x", "y", "z"], 2, (1.5, -0.75, 0.5)),
+        (0, ["id", "type", "xs", "ys", "zs"], 1, (-1.5, 0.75, -0.5)),
+    ],
+)
+def test_matches_text_dump(tmp_path, make_settings, revision, columns, num_chunks, tilt):
+    text_path = tmp_path / "trajectory.lammpstrj"
+    binary_path = tmp_path / "trajectory.bin"
+    write_text_dump(text_path, 3)
+    write_binary_dump(binary_path, 3, revision, columns, num_chunks, tilt)
+
+    reader = ReaderFactory(make_settings(binary_path)).get_reader()
+    assert isinstance(reader, LAMMPSBinaryReader)
+    frames = read_frames(reader, binary_path)
+    expected = read_frames(LAMMPSReader(make_settings(text_path)), text_path)
+
+    assert len(frames) == len(expected) == 3
+    for frame, source in zip(frames, expected):
+        np.testing.assert_array_equal(frame.type_symbols, source.type_symbols)
+        assert set(frame.type_symbols) == {"1", "2"}
+        np.testing.assert_allclose(frame.positions, source.positions, atol=1e-12)
+        if tilt is None:
+            np.testing.assert_array_equal(frame.lattice, source.lattice)
+        else:
+            # The text reader only reads orthogonal boxes
+            np.testing.assert_allclose(frame.lattice, lattice_of(tilt), atol=1e-12)
+
+
+def test_truncated_frame(tmp_path, make_settings):
+    path = tmp_path / "trajectory.bin"
+    write_binary_dump(path, 2, 2, ["id", "type", "x", "y", "z"], 1)
+    path.write_bytes(path.read_bytes()[:-8])
+
+    reader = LAMMPSBinaryReader(make_settings(path))
+    reader.filename = str(path)
+    with pytest.raises(IOError, match="truncated"):
+        reader.scan()
@@ -0,0 +1,31 @@
+import os
+
+import nexus.config.settings as c
+from nexus import main
+
+EXAMPLE = os.path.join(
+    os.path.dirname(__file__), "..", "examples", "inputs", "example-SiO2-1008at.xyz"
+)
+
+
+def read_results(directory):
+    results = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".dat"):
+            with open(os.path.join(directory, name)) as f:
+                results[name] = [line for line in f if not line.startswith("# Date")]
+    return results
+
+
+def test_flushed_results_match_single_write(make_settings, tmp_path):
+    # Second runs append to the results of the first ones
+    for project_name, flush_interval in [("single", 0), ("flushed", 3)] * 2:
+        settings = make_settings(EXAMPLE, flush_interval=flush_interval)
+        settings.project_name = project_name
+        settings.export_directory = str(tmp_path)
+        settings.analysis = c.AnalysisSettings(overwrite=False, with_all=True)
+        main(settings)
+
+    single = read_results(tmp_path / "single")
+    assert single
+    assert read_results(tmp_path / "flushed") == single
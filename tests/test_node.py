@@ -0,0 +1,26 @@
+from nexus.analysis.strategy_factory import StrategyFactory
+from nexus.core.node import Node
+from nexus.io.reader.reader_factory import ReaderFactory
+
+FRAME = """3
+Lattice="10.0 0.0 0.0 0.0 10.0 0.0 0.0 0.0 10.0"
+Si 1.0 1.0 1.0
+Si 3.0 1.0 1.0
+O 9.0 9.0 9.0
+"""
+
+
+def test_neighbors_only_create_neighbor_views(tmp_path, make_settings):
+    path = tmp_path / "trajectory.xyz"
+    path.write_text(FRAME)
+    settings = make_settings(path)
+    reader = ReaderFactory(settings).get_reader()
+    reader.filename = str(path)
+    frame = next(reader.parse(0))
+    frame.initialize_nodes()
+    StrategyFactory(frame, settings).get_strategy(settings).find_neighbors()
+
+    node = Node(frame, 0)
+    assert [neighbor.node_id for neighbor in node.neighbors] == [1]
+    assert "neighbors: 1" in str(node)
+    assert frame.nodes == []
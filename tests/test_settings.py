@@ -0,0 +1,7 @@
+import pytest
+
+
+def test_stdin_requires_file_format(make_settings):
+    with pytest.raises(ValueError, match="file_format"):
+        make_settings("-")
+    assert make_settings("-", file_format="xyz").file_format == "xyz"
@@ -0,0 +1,41 @@
+import threading
+import time
+
+import pytest
+
+from nexus.core.system import System
+from nexus.io.reader.reader_factory import ReaderFactory
+
+FRAME = """2
+Lattice="10.0 0.0 0.0 0.0 10.0 0.0 0.0 0.0 10.0"
+Si 1.0 1.0 1.0
+O 2.0 1.0 1.0
+"""
+
+
+@pytest.fixture
+def system(tmp_path, make_settings):
+    path = tmp_path / "trajectory.xyz"
+    path.write_text(FRAME * 3)
+    settings = make_settings(path)
+    return System(ReaderFactory(settings).get_reader(), settings)
+
+
+def _prefetch_threads():
+    return [t for t in threading.enumerate() if t.name == "nexus-prefetch"]
+
+
+@pytest.mark.parametrize("depth", [0, 2])
+def test_prefetch_close_while_following_idle_file(system, depth):
+    before = set(_prefetch_threads())
+    frames = system.prefetch_frames(
+        depth, frames=lambda stop: system.follow_frames(0.2, None, stop=stop)
+    )
+    assert len([next(frames) for _ in range(3)]) == 3
+    # Let the background thread wait for frames that never come
+    time.sleep(0.5)
+
+    start = time.monotonic()
+    frames.close()
+    assert time.monotonic() - start < 1.0
+    assert set(_prefetch_threads()) <= before
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from nexus.__main__ import cli
+from nexus.io.reader.nexus_reader import NexusReader
+from nexus.io.reader.reader_factory import ReaderFactory
+from nexus.io.writer.trajectory_writer import TrajectoryWriter
+
+
+def xyz_frame(i):
+    # The lattice and the node order change between frames, and Na is not converted
+    size = 10.0 + i
+    nodes = [
+        f"Si {1.0 + i:.4f} 1.0000 1.0000",
+        f"O {2.5:.4f} {1.0 + i:.4f} 1.0000",
+        "Na 5.0000 5.0000 5.0000",
+        f"O {1.0:.4f} 2.5000 {1.0 + i:.4f}",
+    ]
+    if i % 2:
+        nodes.reverse()
+    return (
+        f"{len(nodes)}\n"
+        f'Lattice="{size} 0.0 0.0 0.5 {size} 0.0 0.0 0.0 {size}"\n'
+        + "\n".join(nodes)
+        + "\n"
+    )
+
+
+def read_frames(reader, path):
+    reader.filename = str(path)
+    reader.scan()
+    frames = []
+    for i in range(reader.num_frames):
+        frame = next(reader.parse(i))
+        frame.initialize_nodes()
+        frames.append(frame)
+    return frames
+
+
+@pytest.fixture
+def trajectory(tmp_path):
+    path = tmp_path / "trajectory.xyz"
+    path.write_text("".join(xyz_frame(i) for i in range(4)))
+    return path
+
+
+def test_round_trip_matches_source(trajectory, make_settings):
+    settings = make_settings(trajectory)
+    writer = TrajectoryWriter(settings)
+    assert writer.output_path == str(trajectory.with_suffix(".nxtraj"))
+    writer.write()
+
+    expected = read_frames(ReaderFactory(settings).get_reader(), trajectory)
+    reader = ReaderFactory(make_settings(writer.output_path)).get_reader()
+    assert isinstance(reader, NexusReader)
+    converted = read_frames(reader, writer.output_path)
+
+    assert len(converted) == len(expected) == 4
+    for source, frame in zip(expected, converted):
+        assert frame.frame_id == source.frame_id
+        np.testing.assert_array_equal(frame.positions, source.positions)
+        np.testing.assert_array_equal(frame.type_symbols, source.type_symbols)
+        np.testing.assert_array_equal(frame.lattice, source.lattice)
+        assert "Na" not in frame.type_symbols
+
+
+def test_convert_command(trajectory, tmp_path, capsys, make_settings):
+    output = tmp_path / "converted.nxtraj"
+    cli(["convert", str(trajectory), "-t", "Si", "O", "-r", "1", "2", "-o", str(output)])
+    assert capsys.readouterr().out.strip() == str(output)
+
+    frames = read_frames(NexusReader(make_settings(output)), output)
+    assert len(frames) == 2
+    np.testing.assert_array_equal(frames[0].lattice[0], [11.0, 0.0, 0.0])
+
+
+def test_convert_standard_input_requires_output(make_settings):
+    with pytest.raises(ValueError, match="output path"):
+        TrajectoryWriter(make_settings("-", file_format="xyz"))